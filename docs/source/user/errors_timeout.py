@@ -2,7 +2,7 @@ from blacksmith import AsyncClientFactory, AsyncStaticDiscovery, HTTPTimeout
 
 sd = AsyncStaticDiscovery({})
 
-# read timeout at 5 seconds
+# read timeout at 10 seconds
 # and connect timeout at 5 seconds
 cli = AsyncClientFactory(sd, timeout=(10.0, 5.0))
 # Or
@@ -13,6 +13,9 @@ cli = AsyncClientFactory(sd, timeout=10.0)
 # Or
 cli = AsyncClientFactory(sd, timeout=HTTPTimeout(10.0))
 
+# and the whole request is bounded at 20 seconds
+cli = AsyncClientFactory(sd, timeout=HTTPTimeout(10.0, 5.0, total=20.0))
+
 
 async def main():
     api = await cli("api")
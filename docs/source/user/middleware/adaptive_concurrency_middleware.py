@@ -0,0 +1,20 @@
+from blacksmith import (
+    AdaptiveLimit,
+    AsyncAdaptiveConcurrencyMiddleware,
+    AsyncClientFactory,
+    AsyncConsulDiscovery,
+    PrometheusMetrics,
+)
+
+
+async def main():
+    metrics = PrometheusMetrics()
+    factory = AsyncClientFactory(AsyncConsulDiscovery())
+    factory.add_middleware(
+        AsyncAdaptiveConcurrencyMiddleware(
+            AdaptiveLimit(initial_limit=20, min_limit=2, max_limit=200),
+            max_queue=50,
+            queue_timeout=1.0,
+            metrics=metrics,
+        )
+    )
@@ -0,0 +1,16 @@
+from blacksmith import (
+    AsyncAdaptiveTimeoutMiddleware,
+    AsyncClientFactory,
+    AsyncConsulDiscovery,
+)
+
+
+async def main():
+    factory = AsyncClientFactory(AsyncConsulDiscovery(), timeout=30.0)
+    factory.add_middleware(
+        AsyncAdaptiveTimeoutMiddleware(
+            percentile=0.99,
+            factor=2.0,
+            min_timeout=0.5,
+        )
+    )
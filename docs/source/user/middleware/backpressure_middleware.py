@@ -0,0 +1,18 @@
+from blacksmith import (
+    AsyncBackpressureMiddleware,
+    AsyncClientFactory,
+    AsyncConsulDiscovery,
+    PrometheusMetrics,
+)
+
+
+async def main():
+    metrics = PrometheusMetrics()
+    factory = AsyncClientFactory(AsyncConsulDiscovery())
+    factory.add_middleware(
+        AsyncBackpressureMiddleware(
+            status_codes=(429, 503),
+            max_delay=1.0,
+            metrics=metrics,
+        )
+    )
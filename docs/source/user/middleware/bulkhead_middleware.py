@@ -0,0 +1,24 @@
+from blacksmith import (
+    AsyncBulkheadMiddleware,
+    AsyncClientFactory,
+    AsyncConsulDiscovery,
+    Bulkhead,
+    HTTPPoolLimits,
+    PrometheusMetrics,
+)
+
+
+async def main():
+    metrics = PrometheusMetrics()
+    factory = AsyncClientFactory(
+        AsyncConsulDiscovery(),
+        # the slow api has its own connection pool
+        pools={"slow-api": HTTPPoolLimits(max_connections=20)},
+    )
+    factory.add_middleware(
+        AsyncBulkheadMiddleware(
+            {"slow-api": Bulkhead(max_inflight=20, max_queue=10, queue_timeout=0.5)},
+            default=Bulkhead(max_inflight=50),
+            metrics=metrics,
+        )
+    )
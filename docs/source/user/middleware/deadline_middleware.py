@@ -0,0 +1,17 @@
+from blacksmith import (
+    AsyncClientFactory,
+    AsyncConsulDiscovery,
+    AsyncDeadlineMiddleware,
+    Deadline,
+)
+
+
+async def main():
+    factory = AsyncClientFactory(AsyncConsulDiscovery())
+    factory.add_middleware(AsyncDeadlineMiddleware())
+    api = await factory("api")
+
+    # every request made in this block share a budget of 2 seconds
+    with Deadline(2.0):
+        user = (await api.users.get({"username": "alice"})).unwrap()
+        await api.notifications.post({"username": user.username})
@@ -0,0 +1,20 @@
+from blacksmith import (
+    AsyncClientFactory,
+    AsyncConsulDiscovery,
+    AsyncHedgingMiddleware,
+    Budget,
+    PrometheusMetrics,
+)
+
+
+async def main():
+    metrics = PrometheusMetrics()
+    factory = AsyncClientFactory(AsyncConsulDiscovery())
+    factory.add_middleware(
+        AsyncHedgingMiddleware(
+            delay=0.1,
+            percentile=0.95,
+            budget=Budget(ratio=0.05),
+            metrics=metrics,
+        )
+    )
@@ -0,0 +1,28 @@
+from redis import asyncio as aioredis
+
+from blacksmith import (
+    AsyncClientFactory,
+    AsyncConsulDiscovery,
+    AsyncRateLimitMiddleware,
+    PrometheusMetrics,
+    RateLimit,
+)
+
+
+async def main():
+    metrics = PrometheusMetrics()
+    cache = aioredis.from_url("redis://redis/0")
+    factory = AsyncClientFactory(AsyncConsulDiscovery())
+    factory.add_middleware(
+        AsyncRateLimitMiddleware(
+            {
+                # 10 requests per second, for the whole client
+                "api": RateLimit(rate=10, burst=10),
+                # 1 request per second, for every path of the client
+                "partner": RateLimit(rate=1, per_path=True),
+            },
+            cache=cache,
+            max_delay=5.0,
+            metrics=metrics,
+        )
+    )
@@ -0,0 +1,20 @@
+from blacksmith import (
+    AsyncClientFactory,
+    AsyncConsulDiscovery,
+    AsyncRetryMiddleware,
+    Budget,
+    PrometheusMetrics,
+    RetryPolicy,
+)
+
+
+async def main():
+    metrics = PrometheusMetrics()
+    factory = AsyncClientFactory(AsyncConsulDiscovery())
+    factory.add_middleware(
+        AsyncRetryMiddleware(
+            RetryPolicy(max_attempts=3, base_delay=0.05, max_delay=2.0),
+            budget=Budget(ratio=0.1),
+            metrics=metrics,
+        )
+    )
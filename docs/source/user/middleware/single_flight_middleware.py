@@ -0,0 +1,10 @@
+from blacksmith import (
+    AsyncClientFactory,
+    AsyncConsulDiscovery,
+    AsyncSingleFlightMiddleware,
+)
+
+
+async def main():
+    factory = AsyncClientFactory(AsyncConsulDiscovery())
+    factory.add_middleware(AsyncSingleFlightMiddleware(vary=["Authorization"]))
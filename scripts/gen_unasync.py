@@ -21,6 +21,7 @@ for path in DIRECTORIES:
                     "_async": "_sync",
                     "asyncio": "client",  # replace redis.asyncio -> redis.client
                     "AsyncHTTPTransport": "HTTPTransport",
+                    "aclose": "close",
                 },
             ),
         ],
@@ -38,6 +39,7 @@ unasync.unasync_files(
                 "AsyncSleep": "SyncSleep",
                 "httpx._client.AsyncClient.request": "httpx._client.Client.request",
                 "AsyncHTTPTransport": "HTTPTransport",
+                "aclose": "close",
             },
         ),
     ],
@@ -3,36 +3,59 @@ from importlib import metadata
 __version__ = metadata.version("blacksmith")
 
 from .domain.error import AbstractErrorParser, TError_co, default_error_parser
-from .domain.exceptions import HTTPError, HTTPTimeoutError
+from .domain.exceptions import (
+    BackpressureError,
+    ConcurrencyLimitError,
+    DeadlineExceededError,
+    HTTPError,
+    HTTPTimeoutError,
+    RateLimitError,
+)
 from .domain.model import (
     AbstractCachePolicy,
     AbstractCollectionParser,
     AbstractSerializer,
     AbstractTraceContext,
+    AdaptiveLimit,
     Attachment,
     AttachmentField,
+    Budget,
+    Bulkhead,
     CacheControlPolicy,
     CollectionIterator,
     CollectionParser,
+    Deadline,
     HeaderField,
+    HTTPPoolLimits,
     HTTPTimeout,
     JsonSerializer,
+    LatencyPercentiles,
     PathInfoField,
     PostBodyField,
     PrometheusMetrics,
     QueryStringField,
+    RateLimit,
     Request,
     Response,
     ResponseBox,
+    RetryPolicy,
+    RouteOptions,
     TCollectionResponse,
     TResponse,
 )
 from .domain.model.http import HTTPRequest, HTTPResponse
-from .domain.registry import register
+from .domain.registry import BatchGet, register
 from .domain.scanner import scan
 from .middleware._async import (
     AsyncAbstractCache,
+    AsyncAbstractRateLimitCache,
+    AsyncAdaptiveConcurrencyMiddleware,
+    AsyncAdaptiveTimeoutMiddleware,
+    AsyncBackpressureMiddleware,
+    AsyncBulkheadMiddleware,
     AsyncCircuitBreakerMiddleware,
+    AsyncDeadlineMiddleware,
+    AsyncHedgingMiddleware,
     AsyncHTTPAddHeadersMiddleware,
     AsyncHTTPAuthorizationMiddleware,
     AsyncHTTPBearerMiddleware,
@@ -42,10 +65,20 @@ from .middleware._async import (
     AsyncMiddleware,
     AsyncOAuth2RefreshTokenMiddlewareFactory,
     AsyncPrometheusMiddleware,
+    AsyncRateLimitMiddleware,
+    AsyncRetryMiddleware,
+    AsyncSingleFlightMiddleware,
     AsyncZipkinMiddleware,
 )
 from .middleware._sync import (
+    SyncAbstractRateLimitCache,
+    SyncAdaptiveConcurrencyMiddleware,
+    SyncAdaptiveTimeoutMiddleware,
+    SyncBackpressureMiddleware,
+    SyncBulkheadMiddleware,
     SyncCircuitBreakerMiddleware,
+    SyncDeadlineMiddleware,
+    SyncHedgingMiddleware,
     SyncHTTPAddHeadersMiddleware,
     SyncHTTPAuthorizationMiddleware,
     SyncHTTPBearerMiddleware,
@@ -55,6 +88,9 @@ from .middleware._sync import (
     SyncMiddleware,
     SyncOAuth2RefreshTokenMiddlewareFactory,
     SyncPrometheusMiddleware,
+    SyncRateLimitMiddleware,
+    SyncRetryMiddleware,
+    SyncSingleFlightMiddleware,
     SyncZipkinMiddleware,
 )
 from .sd._async import (
@@ -88,6 +124,8 @@ __all__ = [
     # Request / Response
     "scan",
     "register",
+    "BatchGet",
+    "RouteOptions",
     "Request",
     "Response",
     "HeaderField",
@@ -106,12 +144,18 @@ __all__ = [
     # Exceptions
     "HTTPError",
     "HTTPTimeoutError",
+    "ConcurrencyLimitError",
+    "RateLimitError",
+    "BackpressureError",
+    "DeadlineExceededError",
     # Errors,
     "AbstractErrorParser",
     "TError_co",
     "default_error_parser",
     # Timeout Config
     "HTTPTimeout",
+    # Connection Pool Config
+    "HTTPPoolLimits",
     # Client
     "AsyncClientFactory",
     "SyncClientFactory",
@@ -158,6 +202,33 @@ __all__ = [
     "AsyncAbstractCache",
     "AsyncHTTPCacheMiddleware",
     "SyncHTTPCacheMiddleware",
+    "AsyncSingleFlightMiddleware",
+    "SyncSingleFlightMiddleware",
+    "Budget",
+    "LatencyPercentiles",
+    "AsyncHedgingMiddleware",
+    "SyncHedgingMiddleware",
+    "RetryPolicy",
+    "AsyncRetryMiddleware",
+    "SyncRetryMiddleware",
+    "AdaptiveLimit",
+    "AsyncAdaptiveConcurrencyMiddleware",
+    "SyncAdaptiveConcurrencyMiddleware",
+    "AsyncAdaptiveTimeoutMiddleware",
+    "SyncAdaptiveTimeoutMiddleware",
+    "RateLimit",
+    "AsyncAbstractRateLimitCache",
+    "SyncAbstractRateLimitCache",
+    "AsyncRateLimitMiddleware",
+    "SyncRateLimitMiddleware",
+    "AsyncBackpressureMiddleware",
+    "SyncBackpressureMiddleware",
+    "Bulkhead",
+    "AsyncBulkheadMiddleware",
+    "SyncBulkheadMiddleware",
+    "Deadline",
+    "AsyncDeadlineMiddleware",
+    "SyncDeadlineMiddleware",
     "AsyncLoggingMiddleware",
     "SyncLoggingMiddleware",
     "AbstractTraceContext",
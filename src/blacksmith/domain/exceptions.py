@@ -134,3 +134,37 @@ class HTTPError(Exception):
 
 class HTTPTimeoutError(TimeoutError):
     """Represent the http timeout error."""
+
+
+class ConcurrencyLimitError(RuntimeError):
+    """Raised when a request is rejected by a concurrency limit."""
+
+    def __init__(self, client: ClientName, limit: int) -> None:
+        super().__init__(
+            f"Concurrency limit of {limit} requests reached for client '{client}'"
+        )
+        self.client = client
+        self.limit = limit
+
+
+class RateLimitError(RuntimeError):
+    """Raised when a request would wait too long for the rate limit."""
+
+    def __init__(self, client: ClientName) -> None:
+        super().__init__(f"Rate limit of client '{client}' exceeded")
+        self.client = client
+
+
+class BackpressureError(RuntimeError):
+    """Raised when a service asked to pause the requests, using Retry-After."""
+
+    def __init__(self, client: ClientName, delay: float) -> None:
+        super().__init__(
+            f"Requests of client '{client}' are paused for {delay:.2f} seconds"
+        )
+        self.client = client
+        self.delay = delay
+
+
+class DeadlineExceededError(HTTPTimeoutError):
+    """Raised when a request is made after the deadline of its context."""
@@ -1,11 +1,25 @@
-from .http import HTTPRawResponse, HTTPRequest, HTTPResponse, HTTPTimeout
+from .deadline import Deadline
+from .http import (
+    HTTPPoolLimits,
+    HTTPRawResponse,
+    HTTPRequest,
+    HTTPResponse,
+    HTTPTimeout,
+    RouteOptions,
+)
+from .middleware.adaptive_limit import AdaptiveLimit
+from .middleware.budget import Budget
+from .middleware.bulkhead import Bulkhead
 from .middleware.http_cache import (
     AbstractCachePolicy,
     AbstractSerializer,
     CacheControlPolicy,
     JsonSerializer,
 )
+from .middleware.latency import LatencyPercentiles
 from .middleware.prometheus import PrometheusMetrics
+from .middleware.rate_limit import RateLimit
+from .middleware.retry import RetryPolicy
 from .middleware.zipkin import AbstractTraceContext
 from .params import (
     AbstractCollectionParser,
@@ -25,11 +39,14 @@ from .params import (
 )
 
 __all__ = [
+    "Deadline",
     "HeaderField",
     "HTTPRequest",
     "HTTPRawResponse",
     "HTTPResponse",
     "HTTPTimeout",
+    "HTTPPoolLimits",
+    "RouteOptions",
     "PathInfoField",
     "PostBodyField",
     "QueryStringField",
@@ -49,4 +66,10 @@ __all__ = [
     "CacheControlPolicy",
     "PrometheusMetrics",
     "AbstractTraceContext",
+    "AdaptiveLimit",
+    "Budget",
+    "Bulkhead",
+    "LatencyPercentiles",
+    "RateLimit",
+    "RetryPolicy",
 ]
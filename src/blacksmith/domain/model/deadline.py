@@ -0,0 +1,67 @@
+"""Bound the duration of the requests made while handling a request."""
+
+import time
+from contextvars import ContextVar, Token
+from types import TracebackType
+
+_deadline: ContextVar[float | None] = ContextVar("blacksmith_deadline", default=None)
+
+
+def get_remaining_time() -> float | None:
+    """
+    Return the time remaining before the deadline of the context, in seconds.
+
+    :return: None if there is no deadline.
+    """
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+class Deadline:
+    """
+    Context manager that bounds the duration of the requests made in its context.
+
+    The timeout of every request is shrunk to the remaining time, and the
+    requests fail fast with a :class:`blacksmith.DeadlineExceededError` once
+    the deadline is exceeded.
+
+    Nested deadlines can't extend the deadline of their parent context.
+
+    :param timeout: duration of the context in seconds, None for no deadline.
+    """
+
+    def __init__(self, timeout: float | None) -> None:
+        self.timeout = timeout
+        self._token: Token[float | None] | None = None
+
+    @classmethod
+    def from_header(cls, value: str | None) -> "Deadline":
+        """
+        Build the deadline from the header propagated by the
+        :class:`blacksmith.AsyncDeadlineMiddleware`.
+        """
+        try:
+            return cls(float(value) if value else None)
+        except ValueError:
+            return cls(None)
+
+    def __enter__(self) -> "Deadline":
+        if self.timeout is not None:
+            deadline = time.monotonic() + self.timeout
+            current = _deadline.get()
+            if current is not None and current < deadline:
+                deadline = current
+            self._token = _deadline.set(deadline)
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        if self._token is not None:
+            _deadline.reset(self._token)
+            self._token = None
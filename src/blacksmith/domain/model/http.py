@@ -1,3 +1,4 @@
+import json as jsonlib
 import re
 from collections.abc import AsyncIterable, Iterable, Mapping
 from dataclasses import dataclass, field
@@ -26,17 +27,108 @@ RequestAttachments = dict[
 
 
 class HTTPTimeout:
-    """Request timeout."""
+    """
+    Request timeout.
+
+    :param read: maximum time waiting for a chunk of the response, in seconds.
+    :param connect: maximum time to establish the connection, in seconds.
+    :param write: maximum time to send a chunk of the request,
+        the read timeout by default.
+    :param pool: maximum time waiting for a connection of the pool,
+        the read timeout by default.
+    :param total: maximum duration of the whole request, from the pool to the
+        last chunk of the response, unbounded by default.
+    """
 
     read: float
     connect: float
-
-    def __init__(self, read: float = 30.0, connect: float = 15.0) -> None:
+    write: float
+    pool: float
+    total: float | None
+
+    def __init__(
+        self,
+        read: float = 30.0,
+        connect: float = 15.0,
+        write: float | None = None,
+        pool: float | None = None,
+        total: float | None = None,
+    ) -> None:
         self.read = read
         self.connect = connect
+        self.write = read if write is None else write
+        self.pool = read if pool is None else pool
+        self.total = total
 
     def __eq__(self, other: Any) -> bool:
-        return self.read == other.read and self.connect == other.connect
+        return (
+            self.read == other.read
+            and self.connect == other.connect
+            and self.write == other.write
+            and self.pool == other.pool
+            and self.total == other.total
+        )
+
+    def shrink(self, remaining: float) -> "HTTPTimeout":
+        """Return the timeout bounded by the remaining time, in seconds."""
+        return HTTPTimeout(
+            min(self.read, remaining),
+            min(self.connect, remaining),
+            min(self.write, remaining),
+            min(self.pool, remaining),
+            remaining if self.total is None else min(self.total, remaining),
+        )
+
+
+@dataclass(frozen=True)
+class RouteOptions:
+    """
+    Options of the requests of a route, declared in the registry.
+
+    :param timeout: timeout of the requests, overriding the timeout of the
+        client, the timeout passed to the request still overrides it.
+    :param retry: hint for the :class:`blacksmith.AsyncRetryMiddleware`,
+        retry the requests even if their method is not idempotent, or never
+        retry them. The retry policy decides by default.
+    :param cache: hint for the :class:`blacksmith.AsyncHTTPCacheMiddleware`,
+        ``False`` never caches the responses.
+    """
+
+    timeout: HTTPTimeout | None = None
+    retry: bool | None = None
+    cache: bool = True
+
+
+class HTTPPoolLimits:
+    """
+    Connection pool limits of the transport.
+
+    :param max_connections: maximum number of concurrent connections.
+    :param max_keepalive_connections: maximum number of idle connections
+        kept in the pool.
+    :param keepalive_expiry: time in seconds an idle connection is kept alive.
+    """
+
+    max_connections: int | None
+    max_keepalive_connections: int | None
+    keepalive_expiry: float | None
+
+    def __init__(
+        self,
+        max_connections: int | None = 100,
+        max_keepalive_connections: int | None = 20,
+        keepalive_expiry: float | None = 5.0,
+    ) -> None:
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.keepalive_expiry = keepalive_expiry
+
+    def __eq__(self, other: Any) -> bool:
+        return (
+            self.max_connections == other.max_connections
+            and self.max_keepalive_connections == other.max_keepalive_connections
+            and self.keepalive_expiry == other.keepalive_expiry
+        )
 
 
 @dataclass
@@ -61,6 +153,7 @@ class HTTPRequest:
     headers: dict[str, str] = field(default_factory=dict)
     body: RequestBody = ""
     attachments: RequestAttachments | None = field(default=None)
+    options: RouteOptions = field(default_factory=RouteOptions)
 
     @property
     def url(self) -> str:
@@ -143,6 +236,44 @@ class HTTPRawResponse(Protocol):
     def encoding(self) -> str: ...
 
 
+_UNPARSED: Any = object()
+
+
+def parse_json_body(content: bytes | None) -> Json:
+    """Parse a raw json body, the way the json response deserializer does."""
+    if not content:
+        return ""
+    try:
+        return jsonlib.loads(content)
+    except ValueError:
+        return {"error": content.decode("utf-8", errors="replace")}
+
+
+class LazyJson:
+    """
+    Descriptor of the json body of the :class:`HTTPResponse`.
+
+    When the response has been built from its raw content, the json body
+    is parsed on its first access, and assigning the json body drops the raw
+    content.
+    """
+
+    def __get__(self, obj: "HTTPResponse | None", objtype: Any = None) -> Json:
+        if obj is None:
+            # default value of the dataclass field
+            return _UNPARSED
+        json_ = obj.__dict__.get("_json", _UNPARSED)
+        if json_ is _UNPARSED:
+            json_ = obj.__dict__["_json"] = parse_json_body(obj.content)
+        return json_
+
+    def __set__(self, obj: "HTTPResponse", value: Json) -> None:
+        obj.__dict__["_json"] = value
+        if value is not _UNPARSED:
+            # the raw content does not match an assigned json anymore
+            obj.content = None
+
+
 @dataclass
 class HTTPResponse:
     """
@@ -151,14 +282,20 @@ class HTTPResponse:
     In this representation, the response body has been parsed to the property ``json``,
     which is a python structure containing simple python types. This http response
     representation will be used create pydantic response object.
+
+    If the response has been built with its raw json ``content``, the ``json``
+    property is parsed lazily, and the pydantic response object is validated
+    from the raw content directly.
     """
 
     status_code: int
     """HTTP Status code."""
     headers: Mapping[str, str]
     """Header of the response."""
-    json: Json
+    json: Json = LazyJson()
     """Json Body of the response."""
+    content: bytes | None = field(default=None, repr=False, compare=False)
+    """Raw json body of the response, kept only if the json is parsed lazily."""
 
     @property
     def links(self) -> Links:
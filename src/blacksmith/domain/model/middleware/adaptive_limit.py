@@ -0,0 +1,87 @@
+"""Adapt the concurrency limit of the clients to the observed latency."""
+
+import threading
+
+from blacksmith.typing import ClientName
+
+
+class AdaptiveLimit:
+    """
+    AIMD concurrency limit, per client, driven by the observed latency.
+
+    The limit increases by one while the requests are fast, and the limit is
+    used. It is multiplied by ``backoff_ratio`` when a request is dropped,
+    a timeout or a server error, or when its latency exceeds ``tolerance``
+    times the baseline latency of the client.
+
+    The baseline latency is a moving average of the latencies, in order to
+    follow the slow changes of the service.
+
+    :param initial_limit: limit of a client before any request is observed.
+    :param min_limit: minimum limit.
+    :param max_limit: maximum limit.
+    :param backoff_ratio: multiplicative decrease of the limit.
+    :param tolerance: ratio of the baseline latency above which the service
+        is considered as overloaded.
+    :param smoothing: weight of a latency in the moving average.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 20,
+        min_limit: int = 1,
+        max_limit: int = 200,
+        backoff_ratio: float = 0.9,
+        tolerance: float = 2.0,
+        smoothing: float = 0.05,
+    ) -> None:
+        self.initial_limit = initial_limit
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff_ratio = backoff_ratio
+        self.tolerance = tolerance
+        self.smoothing = smoothing
+        self._limits: dict[ClientName, int] = {}
+        self._baselines: dict[ClientName, float] = {}
+        self._lock = threading.Lock()
+
+    def get_limit(self, client_name: ClientName) -> int:
+        """Return the current limit of the client."""
+        return self._limits.get(client_name, self.initial_limit)
+
+    def get_baseline(self, client_name: ClientName) -> float | None:
+        """Return the baseline latency of the client, in seconds."""
+        return self._baselines.get(client_name)
+
+    def on_sample(
+        self,
+        client_name: ClientName,
+        latency: float,
+        inflight: int,
+        dropped: bool = False,
+    ) -> int:
+        """
+        Observe a request, and return the new limit of the client.
+
+        :param latency: latency of the request, in seconds.
+        :param inflight: number of requests running while it completed.
+        :param dropped: True if the request failed on overload.
+        """
+        with self._lock:
+            limit = self._limits.get(client_name, self.initial_limit)
+            baseline = self._baselines.get(client_name)
+            if dropped:
+                limit = int(limit * self.backoff_ratio)
+            else:
+                if baseline is not None and latency > baseline * self.tolerance:
+                    limit = int(limit * self.backoff_ratio)
+                elif inflight * 2 >= limit:
+                    limit += 1
+                self._baselines[client_name] = (
+                    latency
+                    if baseline is None
+                    else baseline + (latency - baseline) * self.smoothing
+                )
+            limit = max(self.min_limit, min(limit, self.max_limit))
+            self._limits[client_name] = limit
+            return limit
@@ -0,0 +1,35 @@
+"""Keep the pauses advertised by the services."""
+
+import threading
+import time
+from collections.abc import Hashable
+
+
+class Backpressure:
+    """
+    Pauses advertised by the services, using the ``Retry-After`` header,
+    per key.
+    """
+
+    def __init__(self) -> None:
+        self._pauses: dict[Hashable, float] = {}
+        self._lock = threading.Lock()
+
+    def pause(self, key: Hashable, delay: float) -> None:
+        """Pause the requests of the key, for the delay in seconds."""
+        until = time.monotonic() + delay
+        with self._lock:
+            if until > self._pauses.get(key, 0.0):
+                self._pauses[key] = until
+
+    def get_pause(self, key: Hashable) -> float:
+        """Return the remaining pause of the key, in seconds."""
+        with self._lock:
+            until = self._pauses.get(key)
+            if until is None:
+                return 0.0
+            remaining = until - time.monotonic()
+            if remaining <= 0:
+                del self._pauses[key]
+                return 0.0
+            return remaining
@@ -0,0 +1,42 @@
+"""Bound the extra requests sent to a service."""
+
+import threading
+
+from blacksmith.typing import ClientName
+
+
+class Budget:
+    """
+    Token bucket that bounds the ratio of extra requests, per client.
+
+    Extra requests are the requests sent in addition to the requests made
+    by the application, such as hedged requests, or retries.
+
+    Every request made by the application deposits ``ratio`` token in the bucket
+    of its client, and every extra request withdraws one token.
+
+    :param ratio: ratio of extra requests, ``0.1`` for 10% of extra requests.
+    :param max_tokens: capacity of the bucket, it bounds the bursts of extra
+        requests. Buckets are full initially.
+    """
+
+    def __init__(self, ratio: float = 0.1, max_tokens: float = 10.0) -> None:
+        self.ratio = ratio
+        self.max_tokens = max_tokens
+        self._tokens: dict[ClientName, float] = {}
+        self._lock = threading.Lock()
+
+    def deposit(self, client_name: ClientName) -> None:
+        """Deposit the tokens of a request made by the application."""
+        with self._lock:
+            tokens = self._tokens.get(client_name, self.max_tokens) + self.ratio
+            self._tokens[client_name] = min(tokens, self.max_tokens)
+
+    def withdraw(self, client_name: ClientName) -> bool:
+        """Withdraw a token for an extra request, return False if it is denied."""
+        with self._lock:
+            tokens = self._tokens.get(client_name, self.max_tokens)
+            if tokens < 1:
+                return False
+            self._tokens[client_name] = tokens - 1
+            return True
@@ -0,0 +1,19 @@
+"""Isolate the clients from each other."""
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class Bulkhead:
+    """
+    Concurrency limit of a client.
+
+    :param max_inflight: maximum number of concurrent requests.
+    :param max_queue: maximum number of requests waiting for a slot.
+    :param queue_timeout: maximum time waiting for a slot, in seconds,
+        None to wait forever.
+    """
+
+    max_inflight: int
+    max_queue: int = 0
+    queue_timeout: float | None = None
@@ -0,0 +1,60 @@
+"""Observe the latency of requests."""
+
+import threading
+from collections import deque
+
+from blacksmith.typing import ClientName, Path
+
+
+class LatencyPercentiles:
+    """
+    Keep the latest latencies of requests, per client and path, to compute
+    their percentiles.
+
+    :param window_size: number of latencies kept per client and path.
+    :param min_samples: number of latencies required to compute a percentile.
+    :param refresh_every: percentiles are computed again after this number of
+        new latencies.
+    """
+
+    def __init__(
+        self, window_size: int = 1000, min_samples: int = 100, refresh_every: int = 10
+    ) -> None:
+        self.window_size = window_size
+        self.min_samples = min_samples
+        self.refresh_every = refresh_every
+        self._latencies: dict[tuple[ClientName, Path], deque[float]] = {}
+        self._sorted: dict[tuple[ClientName, Path], list[float]] = {}
+        self._observed: dict[tuple[ClientName, Path], int] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, client_name: ClientName, path: Path, latency: float) -> None:
+        """Observe the latency, in seconds, of a request."""
+        key = (client_name, path)
+        with self._lock:
+            latencies = self._latencies.get(key)
+            if latencies is None:
+                latencies = self._latencies[key] = deque(maxlen=self.window_size)
+            latencies.append(latency)
+            self._observed[key] = self._observed.get(key, 0) + 1
+
+    def get_percentile(
+        self, client_name: ClientName, path: Path, percentile: float
+    ) -> float | None:
+        """
+        Return the percentile of the latencies, in seconds.
+
+        :param percentile: the percentile, ``0.99`` for the p99.
+        :return: None if not enough latencies have been observed.
+        """
+        key = (client_name, path)
+        with self._lock:
+            latencies = self._latencies.get(key)
+            if latencies is None or len(latencies) < self.min_samples:
+                return None
+            sorted_latencies = self._sorted.get(key)
+            if sorted_latencies is None or self._observed[key] >= self.refresh_every:
+                sorted_latencies = self._sorted[key] = sorted(latencies)
+                self._observed[key] = 0
+        idx = min(int(percentile * len(sorted_latencies)), len(sorted_latencies) - 1)
+        return sorted_latencies[idx]
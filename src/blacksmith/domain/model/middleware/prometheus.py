@@ -87,3 +87,95 @@ class PrometheusMetrics:
             registry=registry,
             labelnames=["client_name", "method", "path", "status_code"],
         )
+
+        self.blacksmith_endpoint_cache_hit = Counter(
+            "blacksmith_endpoint_cache_hit",
+            "Endpoint retrieved from the client factory cache.",
+            registry=registry,
+            labelnames=["client_name"],
+        )
+
+        self.blacksmith_endpoint_cache_miss = Counter(
+            "blacksmith_endpoint_cache_miss",
+            "Endpoint retrieved from the service discovery.",
+            registry=registry,
+            labelnames=["client_name"],
+        )
+
+        self.blacksmith_request_coalesced = Counter(
+            "blacksmith_request_coalesced",
+            "Request where the response has been shared by an identical request.",
+            registry=registry,
+            labelnames=["client_name", "method", "path"],
+        )
+
+        self.blacksmith_hedged_request = Counter(
+            "blacksmith_hedged_request",
+            "Hedged request sent while the first request was too slow.",
+            registry=registry,
+            labelnames=["client_name", "method", "path"],
+        )
+
+        self.blacksmith_hedged_request_won = Counter(
+            "blacksmith_hedged_request_won",
+            "Hedged request that returned before the first request.",
+            registry=registry,
+            labelnames=["client_name", "method", "path"],
+        )
+
+        self.blacksmith_request_retried = Counter(
+            "blacksmith_request_retried",
+            "Request sent again after a transient error.",
+            registry=registry,
+            labelnames=["client_name", "method", "path"],
+        )
+
+        self.blacksmith_concurrency_limit = Gauge(
+            "blacksmith_concurrency_limit",
+            "Number of concurrent requests allowed.",
+            registry=registry,
+            labelnames=["client_name"],
+        )
+
+        self.blacksmith_concurrency_queue_depth = Gauge(
+            "blacksmith_concurrency_queue_depth",
+            "Number of requests waiting for the concurrency limit.",
+            registry=registry,
+            labelnames=["client_name"],
+        )
+
+        self.blacksmith_concurrency_rejected = Counter(
+            "blacksmith_concurrency_rejected",
+            "Request rejected by the concurrency limit.",
+            registry=registry,
+            labelnames=["client_name"],
+        )
+
+        self.blacksmith_request_throttled = Counter(
+            "blacksmith_request_throttled",
+            "Request delayed by the rate limit.",
+            registry=registry,
+            labelnames=["client_name", "method", "path"],
+        )
+
+        self.blacksmith_request_paused = Counter(
+            "blacksmith_request_paused",
+            "Request delayed or rejected while the service asked for a pause.",
+            registry=registry,
+            labelnames=["client_name", "method", "path"],
+        )
+
+        self.blacksmith_bulkhead_queue_wait_seconds = Histogram(
+            "blacksmith_bulkhead_queue_wait_seconds",
+            "Time waiting for the bulkhead of the client in seconds",
+            buckets=buckets,
+            registry=registry,
+            labelnames=["client_name"],
+        )
+
+        self.blacksmith_bulkhead_rejected = Counter(
+            "blacksmith_bulkhead_rejected",
+            "Request rejected by the bulkhead of the client.",
+            registry=registry,
+            labelnames=["client_name"],
+        )
@@ -0,0 +1,80 @@
+"""Bound the rate of the requests sent to a service."""
+
+import threading
+import time
+from collections.abc import Hashable
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """
+    Rate limit of a client.
+
+    :param rate: number of requests per second.
+    :param burst: number of requests that can be sent at once,
+        after a period of inactivity.
+    :param per_path: apply the rate limit per path template of the client,
+        instead of the whole client.
+    """
+
+    rate: float
+    burst: int = 1
+    per_path: bool = False
+
+    @property
+    def period(self) -> float:
+        """Duration to refill the burst, in seconds."""
+        return self.burst / self.rate
+
+    def reserve(
+        self, tat: float | None, now: float, max_delay: float | None = None
+    ) -> tuple[float, float] | None:
+        """
+        Reserve a request, using the generic cell rate algorithm.
+
+        :param tat: theoretical arrival time of the next request, in seconds,
+            None if no request has been reserved.
+        :param now: current time, in seconds.
+        :param max_delay: maximum delay, the request is not reserved if the
+            delay is longer.
+        :return: the delay to wait, and the theoretical arrival time of the
+            next request, or None if the request has not been reserved.
+        """
+        interval = 1 / self.rate
+        tat = now if tat is None else max(tat, now)
+        delay = max(tat - (self.burst - 1) * interval - now, 0.0)
+        if max_delay is not None and delay > max_delay:
+            return None
+        return delay, tat + interval
+
+
+class TokenBucket:
+    """
+    In process token buckets, per key.
+
+    Requests reserve a token, and wait for the delay until the token is
+    refilled, in order to smooth the bursts instead of rejecting them.
+    """
+
+    def __init__(self) -> None:
+        self._buckets: dict[Hashable, float] = {}
+        self._lock = threading.Lock()
+
+    def reserve(
+        self, key: Hashable, limit: RateLimit, max_delay: float | None = None
+    ) -> float | None:
+        """
+        Reserve a token, and return the delay to wait, in seconds.
+
+        :param max_delay: maximum delay, the token is not reserved if the
+            delay is longer.
+        :return: None if the token has not been reserved.
+        """
+        now = time.monotonic()
+        with self._lock:
+            reservation = limit.reserve(self._buckets.get(key), now, max_delay)
+            if reservation is None:
+                return None
+            delay, self._buckets[key] = reservation
+        return delay
@@ -0,0 +1,116 @@
+"""Decide if and when a failed request is retried."""
+
+import random
+from collections.abc import Sequence
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+from httpx import ConnectError, Headers
+
+from blacksmith.domain.exceptions import HTTPError, HTTPTimeoutError
+from blacksmith.domain.model.http import HTTPRequest
+from blacksmith.typing import HTTPMethod
+
+
+def parse_retry_after(value: str) -> float | None:
+    """
+    Parse the value of a ``Retry-After`` header, in seconds.
+
+    The value is a number of seconds, or an http date.
+    """
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+    return max((date - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+class RetryPolicy:
+    """
+    Retry policy of the :class:`blacksmith.AsyncRetryMiddleware`.
+
+    Only the requests of idempotent methods are retried, on the transient
+    errors: the ``status_codes`` http errors, the timeouts and the connection
+    errors.
+
+    The delay between the attempts uses the decorrelated jitter backoff, the
+    delay is a random value between ``base_delay`` and three times the previous
+    delay, bounded by ``max_delay``.
+    The ``Retry-After`` header of the response is honoured if it is present.
+
+    :param max_attempts: maximum number of attempts, including the first one.
+    :param methods: idempotent http methods that are retried.
+    :param status_codes: http status codes of the transient errors.
+    :param base_delay: minimum delay between two attempts, in seconds.
+    :param max_delay: maximum delay between two attempts, in seconds.
+    :param max_retry_after: maximum ``Retry-After`` honoured, in seconds,
+        the request is not retried if the service asks to wait longer.
+    """
+
+    exceptions: tuple[type[Exception], ...] = (HTTPTimeoutError, ConnectError)
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        methods: Sequence[HTTPMethod] = ("GET", "HEAD", "OPTIONS", "PUT", "DELETE"),
+        status_codes: Sequence[int] = (502, 503, 504),
+        base_delay: float = 0.05,
+        max_delay: float = 2.0,
+        max_retry_after: float = 10.0,
+    ) -> None:
+        self.max_attempts = max_attempts
+        self.methods = methods
+        self.status_codes = status_codes
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_retry_after = max_retry_after
+
+    def handle_request(self, req: HTTPRequest) -> bool:
+        """
+        Return True if the request can be retried.
+
+        The ``retry`` option of the route, if any, overrides the methods.
+        """
+        if self.max_attempts <= 1:
+            return False
+        if req.options.retry is not None:
+            return req.options.retry
+        return req.method in self.methods
+
+    def is_transient(self, exc: Exception) -> bool:
+        """Return True if the error is worth a retry."""
+        if isinstance(exc, HTTPError):
+            return exc.status_code in self.status_codes
+        return isinstance(exc, self.exceptions)
+
+    def get_backoff(self, previous_delay: float) -> float:
+        """Return the delay before the next attempt, using the decorrelated jitter."""
+        delay = random.uniform(
+            self.base_delay, max(previous_delay, self.base_delay) * 3
+        )
+        return min(delay, self.max_delay)
+
+    def get_retry_delay(
+        self, exc: Exception, attempt: int, previous_delay: float
+    ) -> float | None:
+        """
+        Return the delay before the next attempt, or None if it is not retried.
+
+        :param exc: error of the attempt.
+        :param attempt: number of the attempt that failed, starting at 1.
+        :param previous_delay: delay before the attempt that failed.
+        """
+        if attempt >= self.max_attempts or not self.is_transient(exc):
+            return None
+        if isinstance(exc, HTTPError):
+            retry_after = Headers(exc.response.headers).get("Retry-After")
+            if retry_after is not None:
+                delay = parse_retry_after(retry_after)
+                if delay is not None:
+                    return delay if delay <= self.max_retry_after else None
+        return self.get_backoff(previous_delay)
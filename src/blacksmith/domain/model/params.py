@@ -1,4 +1,5 @@
 import abc
+from collections import deque
 from collections.abc import Callable, Iterator, Mapping
 from dataclasses import dataclass
 from functools import partial
@@ -9,13 +10,15 @@ from typing import (
     cast,
 )
 
-from pydantic import BaseModel, Field
-from result import Result
+from pydantic import BaseModel, Field, ValidationError
+from result import Ok, Result
 from result.result import F, U
 
 from blacksmith.domain.error import AbstractErrorParser, TError_co
 from blacksmith.shared_utils.introspection import (
+    build_pydantic_list,
     build_pydantic_union,
+    build_pydantic_union_from_json,
 )
 
 from ...domain.exceptions import HTTPError, NoResponseSchemaException
@@ -157,6 +160,9 @@ class ResponseBox(Generic[TResponse, TError_co]):
     """
     Wrap a HTTP response and deserialize it.
 
+    The response is validated once, on demand, and the validated model, or the
+    parsed error, is kept for the next calls.
+
     ::
 
         user: ResponseBox[User, HTTPError] = (
@@ -186,22 +192,27 @@ class ResponseBox(Generic[TResponse, TError_co]):
         self.name: ResourceName = name
         self.client_name: ClientName = client_name
         self.error_parser = error_parser
-
-    def _cast_optional_resp(self, resp: HTTPResponse) -> TResponse | None:
-        if self.response_schema is None:
-            return None
-        return cast(
-            TResponse, build_pydantic_union(self.response_schema, (resp.json or {}))
-        )
+        self._validated: Result[TResponse, HTTPError] | None = None
+        self._parsed: Result[TResponse, TError_co] | None = None
+
+    def _validate(self, resp: HTTPResponse) -> Any:
+        if resp.content:
+            try:
+                return build_pydantic_union_from_json(
+                    self.response_schema, resp.content
+                )
+            except ValidationError:
+                # the parsed json is validated, as without the raw content, an
+                # empty or an invalid json body, or null, may still be valid.
+                pass
+        return build_pydantic_union(self.response_schema, (resp.json or {}))
 
     def _cast_resp(self, resp: HTTPResponse) -> TResponse:
         if self.response_schema is None:
             raise NoResponseSchemaException(
                 self.method, self.path, self.name, self.client_name
             )
-        return cast(
-            TResponse, build_pydantic_union(self.response_schema, (resp.json or {}))
-        )
+        return cast(TResponse, self._validate(resp))
 
     @property
     def json(self) -> dict[str, Any] | None:
@@ -215,9 +226,17 @@ class ResponseBox(Generic[TResponse, TError_co]):
             return self.raw_result.unwrap().json
         return self.raw_result.unwrap_err().response.json
 
+    @property
+    def _validated_result(self) -> Result[TResponse, HTTPError]:
+        if self._validated is None:
+            self._validated = self.raw_result.map(self._cast_resp)
+        return self._validated
+
     @property
     def _result(self) -> Result[TResponse, TError_co]:
-        return self.raw_result.map(self._cast_resp).map_err(self.error_parser)
+        if self._parsed is None:
+            self._parsed = self._validated_result.map_err(self.error_parser)
+        return self._parsed
 
     def as_result(self) -> Result[TResponse, TError_co]:
         """
@@ -236,9 +255,9 @@ class ResponseBox(Generic[TResponse, TError_co]):
         then a ``Ok(None)`` is return to not raise any
         :class:`blacksmith.NoResponseSchemaException`
         """
-        return self.raw_result.map(self._cast_optional_resp).map_err(
-            self.error_parser  # type: ignore
-        )
+        if self.response_schema is None and self.raw_result.is_ok():
+            return Ok(None)
+        return self._result  # type: ignore
 
     def is_ok(self) -> bool:
         """Return True if the response was an http success."""
@@ -331,7 +350,7 @@ class ResponseBox(Generic[TResponse, TError_co]):
         :raises NoResponseSchemaException: if there are no response schema set.
         """
         # works in mypy, not in pylance
-        return self.raw_result.map(self._cast_resp).map_err(op)  # type: ignore
+        return self._validated_result.map_err(op)  # type: ignore
 
     def and_then(
         self, op: Callable[[TResponse], Result[U, HTTPError]]
@@ -372,6 +391,9 @@ class ResponseBox(Generic[TResponse, TError_co]):
 class CollectionIterator(Iterator[TResponse]):
     """
     Deserialize the models in a json response list, item by item.
+
+    If a ``batch_size`` is set, the models are validated by batches of
+    ``batch_size`` items, in one pass, and are still returned one by one.
     """
 
     response: AbstractCollectionParser
@@ -381,11 +403,14 @@ class CollectionIterator(Iterator[TResponse]):
         response: HTTPResponse,
         response_schema: type[Response],
         collection_parser: type[AbstractCollectionParser],
+        batch_size: int = 0,
     ) -> None:
         self.pos = 0
         self.response_schema = response_schema
         self.response = collection_parser(response)
         self.json_resp = self.response.json
+        self.batch_size = batch_size
+        self._batch: deque[Any] = deque()
 
     @property
     def meta(self) -> Metadata:
@@ -396,7 +421,33 @@ class CollectionIterator(Iterator[TResponse]):
         """
         return self.response.meta
 
+    def _next_batch(self) -> deque[Any]:
+        items = self.json_resp[self.pos : self.pos + self.batch_size]
+        try:
+            return deque(build_pydantic_list(self.response_schema, items))
+        except ValidationError:
+            pass
+        # validate the items one by one, as without batch, the items before
+        # an invalid one are returned, and the invalid one raises on its turn.
+        batch: deque[Any] = deque()
+        for item in items:
+            try:
+                batch.append(build_pydantic_union(self.response_schema, item))
+            except ValidationError:
+                if not batch:
+                    raise
+                break
+        return batch
+
     def __next__(self) -> TResponse:
+        if self.batch_size and self.response_schema:
+            if not self._batch:
+                self._batch = self._next_batch()
+                if not self._batch:
+                    raise StopIteration()
+            self.pos += 1
+            return cast(TResponse, self._batch.popleft())
+
         try:
             resp = self.json_resp[self.pos]
             if self.response_schema:
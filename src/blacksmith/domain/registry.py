@@ -16,7 +16,13 @@ from blacksmith.typing import (
 )
 
 from .exceptions import ConfigurationError, UnregisteredClientException
-from .model import AbstractCollectionParser, Request, TCollectionResponse, TResponse
+from .model import (
+    AbstractCollectionParser,
+    Request,
+    RouteOptions,
+    TCollectionResponse,
+    TResponse,
+)
 
 TRequest = TypeVar("TRequest", bound=Request)
 
@@ -26,6 +32,10 @@ Contract = Mapping[HTTPMethod, Schemas[Any, Any]]
 CollectionSchemas = tuple[TRequest, TCollectionResponse]
 CollectionContract = Mapping[HTTPMethod, Schemas[Any, Any]]
 
+Options = RouteOptions | Mapping[HTTPMethod, RouteOptions]
+
+default_options = RouteOptions()
+
 
 @dataclass(frozen=True)
 class HttpResource:
@@ -35,14 +45,50 @@ class HttpResource:
     """Path that identify the resource."""
     contract: Contract | None
     """A contract is a serialization schema for the request and there response."""
+    options: Options | None = None
+    """Options of the requests of the endpoint, for every method, or per method."""
+
+    def get_options(self, method: HTTPMethod) -> RouteOptions:
+        """Return the options of the requests of the given method."""
+        if self.options is None:
+            return default_options
+        if isinstance(self.options, RouteOptions):
+            return self.options
+        return self.options.get(method, default_options)
 
 
 @dataclass(frozen=True)
 class HttpCollection(HttpResource):
-    collection_parser: type[AbstractCollectionParser] | None
+    collection_parser: type[AbstractCollectionParser] | None = None
     """Override the default collection parlser for a given resource."""
 
 
+@dataclass(frozen=True)
+class BatchGet:
+    """
+    Coalesce the ``get`` of a resource in a ``collection_get``.
+
+    The ``get`` of the resource made concurrently are batched in a ``GET``
+    of the collection, filtered by the keys of the resources, and every
+    ``get`` receives its own resource from the collection.
+    """
+
+    key: str
+    """Name of the param that identify the resource in the ``get`` contract."""
+    collection_key: str | None = None
+    """
+    Name of the param of the collection ``GET`` contract that receives the list
+    of keys, the ``key`` by default. The alias of the field, if any.
+    """
+    response_key: str | None = None
+    """
+    Name of the field that identify the resource in the items of the collection,
+    the ``key`` by default.
+    """
+    max_batch_size: int = 100
+    """Maximum number of keys in a ``collection_get``."""
+
+
 class ApiRoutes:
     """
     Store different routes for a type of resource.
@@ -55,6 +101,8 @@ class ApiRoutes:
     """Resource endpoint"""
     collection: HttpCollection | None
     """Collection endpoint."""
+    batch_get: BatchGet | None
+    """Batch the get of the resource using the collection endpoint."""
 
     def __init__(
         self,
@@ -63,13 +111,22 @@ class ApiRoutes:
         collection_path: Path | None,
         collection_contract: Contract | None,
         collection_parser: type[AbstractCollectionParser] | None,
+        batch_get: BatchGet | None = None,
+        options: Options | None = None,
+        collection_options: Options | None = None,
     ) -> None:
-        self.resource = HttpResource(path, contract) if path else None
+        self.resource = HttpResource(path, contract, options) if path else None
         self.collection = (
-            HttpCollection(collection_path, collection_contract, collection_parser)
+            HttpCollection(
+                collection_path,
+                collection_contract,
+                collection_options,
+                collection_parser,
+            )
             if collection_path
             else None
         )
+        self.batch_get = batch_get
 
 
 Resources = Mapping[ResourceName, ApiRoutes]
@@ -96,6 +153,9 @@ class Registry:
         collection_path: Path | None = None,
         collection_contract: Contract | None = None,
         collection_parser: type[AbstractCollectionParser] | None = None,
+        batch_get: BatchGet | None = None,
+        options: Options | None = None,
+        collection_options: Options | None = None,
     ) -> None:
         """
         Register the resource in the registry.
@@ -111,6 +171,14 @@ class Registry:
             in the given service.
         :param collection_contract: contract for the resource collection,
             define request and response.
+        :param collection_parser: override the collection parser of the client
+            for this resource.
+        :param batch_get: coalesce the concurrent ``get`` of the resource
+            in ``collection_get``.
+        :param options: options of the requests on the path, such as their
+            timeout, for every method, or a mapping of options per http method.
+        :param collection_options: options of the requests on the collection
+            path, for every method, or a mapping of options per http method.
         """
         if client_name in self.client_service and self.client_service[client_name] != (
             service,
@@ -127,6 +195,9 @@ class Registry:
             collection_path,
             collection_contract,
             collection_parser,
+            batch_get,
+            options,
+            collection_options,
         )
 
     def get_service(self, client_name: ClientName) -> tuple[Service, Resources]:
@@ -155,6 +226,9 @@ def register(
     collection_path: Path | None = None,
     collection_contract: CollectionContract | None = None,
     collection_parser: type[AbstractCollectionParser] | None = None,
+    batch_get: BatchGet | None = None,
+    options: Options | None = None,
+    collection_options: Options | None = None,
 ) -> None:
     """
     Register a resource in a client in the default registry.
@@ -171,4 +245,7 @@ def register(
         collection_path,
         collection_contract,
         collection_parser,
+        batch_get,
+        options,
+        collection_options,
     )
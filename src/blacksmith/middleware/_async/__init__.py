@@ -1,15 +1,30 @@
+from .adaptive_concurrency import AsyncAdaptiveConcurrencyMiddleware
+from .adaptive_timeout import AsyncAdaptiveTimeoutMiddleware
 from .auth import AsyncHTTPAuthorizationMiddleware, AsyncHTTPBearerMiddleware
+from .backpressure import AsyncBackpressureMiddleware
 from .base import AsyncHTTPAddHeadersMiddleware, AsyncHTTPMiddleware, AsyncMiddleware
+from .bulkhead import AsyncBulkheadMiddleware
 from .circuit_breaker import AsyncCircuitBreakerMiddleware
+from .deadline import AsyncDeadlineMiddleware
+from .hedging import AsyncHedgingMiddleware
 from .http_cache import AsyncAbstractCache, AsyncHTTPCacheMiddleware
 from .logging import AsyncLoggingMiddleware
 from .oauth2_token import AsyncOAuth2RefreshTokenMiddlewareFactory
 from .prometheus import AsyncPrometheusMiddleware
+from .rate_limit import AsyncAbstractRateLimitCache, AsyncRateLimitMiddleware
+from .retry import AsyncRetryMiddleware
+from .single_flight import AsyncSingleFlightMiddleware
 from .zipkin import AsyncZipkinMiddleware
 
 __all__ = [
+    "AsyncAdaptiveConcurrencyMiddleware",
+    "AsyncAdaptiveTimeoutMiddleware",
     "AsyncAbstractCache",
+    "AsyncBackpressureMiddleware",
+    "AsyncBulkheadMiddleware",
     "AsyncCircuitBreakerMiddleware",
+    "AsyncDeadlineMiddleware",
+    "AsyncHedgingMiddleware",
     "AsyncHTTPAddHeadersMiddleware",
     "AsyncHTTPAuthorizationMiddleware",
     "AsyncHTTPBearerMiddleware",
@@ -19,5 +34,9 @@ __all__ = [
     "AsyncMiddleware",
     "AsyncLoggingMiddleware",
     "AsyncPrometheusMiddleware",
+    "AsyncAbstractRateLimitCache",
+    "AsyncRateLimitMiddleware",
+    "AsyncRetryMiddleware",
+    "AsyncSingleFlightMiddleware",
     "AsyncZipkinMiddleware",
 ]
@@ -0,0 +1,102 @@
+"""Limit the concurrent requests of the clients, adapting the limit."""
+
+import time
+
+from blacksmith.domain.exceptions import (
+    ConcurrencyLimitError,
+    HTTPError,
+    HTTPTimeoutError,
+)
+from blacksmith.domain.model.http import HTTPRequest, HTTPResponse, HTTPTimeout
+from blacksmith.domain.model.middleware.adaptive_limit import AdaptiveLimit
+from blacksmith.domain.model.middleware.prometheus import PrometheusMetrics
+from blacksmith.shared_utils.concurrency import AsyncLimiter
+from blacksmith.typing import ClientName, Path
+
+from .base import AsyncHTTPMiddleware, AsyncMiddleware
+
+
+class AsyncAdaptiveConcurrencyMiddleware(AsyncHTTPMiddleware):
+    """
+    Limit the concurrent requests per client, the limit adapts to the latency.
+
+    The excess requests wait in a queue, or fail fast, raising
+    :class:`blacksmith.ConcurrencyLimitError`, if the queue is full, or
+    if they waited for longer than the ``queue_timeout``.
+
+    :param limit: algorithm that adapts the limit of the clients.
+    :param max_queue: maximum number of requests waiting, per client,
+        requests are never queued by default.
+    :param queue_timeout: maximum time waiting in the queue, in seconds.
+    :param metrics: export the limits and the queue depths of the clients,
+        and count the rejected requests.
+    """
+
+    def __init__(
+        self,
+        limit: AdaptiveLimit | None = None,
+        max_queue: int = 0,
+        queue_timeout: float | None = None,
+        metrics: PrometheusMetrics | None = None,
+    ) -> None:
+        self.limit = limit or AdaptiveLimit()
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self._metrics = metrics
+        self._limiters: dict[ClientName, AsyncLimiter] = {}
+
+    def get_limiter(self, client_name: ClientName) -> AsyncLimiter:
+        """Return the limiter of the client."""
+        limiter = self._limiters.get(client_name)
+        if limiter is None:
+            limiter = self._limiters[client_name] = AsyncLimiter(
+                self.limit.get_limit(client_name), self.max_queue, self.queue_timeout
+            )
+            self.observe_limiter(client_name, limiter)
+        return limiter
+
+    def __call__(self, next: AsyncMiddleware) -> AsyncMiddleware:
+        async def handle(
+            req: HTTPRequest,
+            client_name: ClientName,
+            path: Path,
+            timeout: HTTPTimeout,
+        ) -> HTTPResponse:
+            limiter = self.get_limiter(client_name)
+            if not await limiter.acquire():
+                self.inc_rejected(client_name)
+                raise ConcurrencyLimitError(client_name, limiter.limit)
+
+            dropped = False
+            start = time.perf_counter()
+            try:
+                return await next(req, client_name, path, timeout)
+            except HTTPError as exc:
+                dropped = exc.is_server_error
+                raise
+            except HTTPTimeoutError:
+                dropped = True
+                raise
+            finally:
+                latency = time.perf_counter() - start
+                limiter.limit = self.limit.on_sample(
+                    client_name, latency, limiter.inflight, dropped
+                )
+                limiter.release()
+
+        return handle
+
+    def observe_limiter(self, client_name: str, limiter: AsyncLimiter) -> None:
+        if self._metrics:
+            self._metrics.blacksmith_concurrency_limit.labels(
+                client_name=client_name
+            ).set_function(lambda: limiter.limit)
+            self._metrics.blacksmith_concurrency_queue_depth.labels(
+                client_name=client_name
+            ).set_function(lambda: limiter.queued)
+
+    def inc_rejected(self, client_name: str) -> None:
+        if self._metrics:
+            self._metrics.blacksmith_concurrency_rejected.labels(
+                client_name=client_name
+            ).inc()
@@ -0,0 +1,91 @@
+"""Isolate the clients, bounding their concurrent requests."""
+
+import time
+from collections.abc import Mapping
+
+from blacksmith.domain.exceptions import ConcurrencyLimitError
+from blacksmith.domain.model.http import HTTPRequest, HTTPResponse, HTTPTimeout
+from blacksmith.domain.model.middleware.bulkhead import Bulkhead
+from blacksmith.domain.model.middleware.prometheus import PrometheusMetrics
+from blacksmith.shared_utils.concurrency import AsyncLimiter
+from blacksmith.typing import ClientName, Path
+
+from .base import AsyncHTTPMiddleware, AsyncMiddleware
+
+
+class AsyncBulkheadMiddleware(AsyncHTTPMiddleware):
+    """
+    Bound the concurrent requests per client.
+
+    A slow service can't hold every resources of the process, the requests of
+    the other clients are not affected.
+
+    The excess requests wait in a bounded queue, and a
+    :class:`blacksmith.ConcurrencyLimitError` is raised if the queue is full,
+    or if they waited for longer than the queue timeout.
+
+    :param bulkheads: concurrency limits of the clients.
+    :param default: concurrency limit of the other clients,
+        they are not limited by default.
+    :param metrics: observe the time waiting in the queue,
+        and count the rejected requests.
+    """
+
+    def __init__(
+        self,
+        bulkheads: Mapping[ClientName, Bulkhead],
+        default: Bulkhead | None = None,
+        metrics: PrometheusMetrics | None = None,
+    ) -> None:
+        self.bulkheads = bulkheads
+        self.default = default
+        self._metrics = metrics
+        self._limiters: dict[ClientName, AsyncLimiter] = {}
+
+    def get_limiter(self, client_name: ClientName) -> AsyncLimiter | None:
+        """Return the limiter of the client, None if it is not limited."""
+        limiter = self._limiters.get(client_name)
+        if limiter is None:
+            bulkhead = self.bulkheads.get(client_name, self.default)
+            if bulkhead is None:
+                return None
+            limiter = self._limiters[client_name] = AsyncLimiter(
+                bulkhead.max_inflight, bulkhead.max_queue, bulkhead.queue_timeout
+            )
+        return limiter
+
+    def __call__(self, next: AsyncMiddleware) -> AsyncMiddleware:
+        async def handle(
+            req: HTTPRequest,
+            client_name: ClientName,
+            path: Path,
+            timeout: HTTPTimeout,
+        ) -> HTTPResponse:
+            limiter = self.get_limiter(client_name)
+            if limiter is None:
+                return await next(req, client_name, path, timeout)
+
+            start = time.perf_counter()
+            acquired = await limiter.acquire()
+            self.observe_queue_wait(client_name, time.perf_counter() - start)
+            if not acquired:
+                self.inc_rejected(client_name)
+                raise ConcurrencyLimitError(client_name, limiter.limit)
+            try:
+                return await next(req, client_name, path, timeout)
+            finally:
+                limiter.release()
+
+        return handle
+
+    def observe_queue_wait(self, client_name: str, latency: float) -> None:
+        if self._metrics:
+            self._metrics.blacksmith_bulkhead_queue_wait_seconds.labels(
+                client_name=client_name
+            ).observe(latency)
+
+    def inc_rejected(self, client_name: str) -> None:
+        if self._metrics:
+            self._metrics.blacksmith_bulkhead_rejected.labels(
+                client_name=client_name
+            ).inc()
@@ -0,0 +1,99 @@
+"""Hedge slow requests to reduce the tail latency."""
+
+import time
+from collections.abc import Sequence
+
+from blacksmith.domain.model.http import HTTPRequest, HTTPResponse, HTTPTimeout
+from blacksmith.domain.model.middleware.budget import Budget
+from blacksmith.domain.model.middleware.latency import LatencyPercentiles
+from blacksmith.domain.model.middleware.prometheus import PrometheusMetrics
+from blacksmith.shared_utils.concurrency import AsyncHedge
+from blacksmith.typing import ClientName, HTTPMethod, Path
+
+from .base import AsyncHTTPMiddleware, AsyncMiddleware
+
+
+class AsyncHedgingMiddleware(AsyncHTTPMiddleware):
+    """
+    Send a second request if the first one is slow, the first response wins.
+
+    The hedged request is sent after a delay, which is a fixed delay, or the
+    observed percentile of the latency of the requests of the same client and
+    path, if enough requests have been observed.
+
+    :param delay: delay in seconds before the hedged request is sent.
+    :param percentile: use the percentile of the observed latencies, instead of
+        the delay, ``0.95`` to hedge the requests slower than the p95.
+    :param budget: bound the ratio of hedged requests, per client,
+        10% of the requests by default.
+    :param methods: idempotent http methods that are hedged.
+    :param latencies: observed latencies, shared with other middlewares.
+    :param metrics: count the hedged requests, and the hedged requests that won.
+    """
+
+    def __init__(
+        self,
+        delay: float = 0.1,
+        percentile: float | None = None,
+        budget: Budget | None = None,
+        methods: Sequence[HTTPMethod] = ("GET", "HEAD", "OPTIONS"),
+        latencies: LatencyPercentiles | None = None,
+        metrics: PrometheusMetrics | None = None,
+    ) -> None:
+        self.delay = delay
+        self.percentile = percentile
+        self.budget = budget or Budget()
+        self.methods = methods
+        self.latencies = latencies or LatencyPercentiles()
+        self._metrics = metrics
+
+    def get_delay(self, client_name: ClientName, path: Path) -> float:
+        """Return the delay before the request is hedged."""
+        if self.percentile is None:
+            return self.delay
+        delay = self.latencies.get_percentile(client_name, path, self.percentile)
+        return self.delay if delay is None else delay
+
+    def __call__(self, next: AsyncMiddleware) -> AsyncMiddleware:
+        async def handle(
+            req: HTTPRequest,
+            client_name: ClientName,
+            path: Path,
+            timeout: HTTPTimeout,
+        ) -> HTTPResponse:
+            if req.method not in self.methods:
+                return await next(req, client_name, path, timeout)
+
+            async def send() -> HTTPResponse:
+                start = time.perf_counter()
+                resp = await next(req, client_name, path, timeout)
+                self.latencies.observe(client_name, path, time.perf_counter() - start)
+                return resp
+
+            def can_hedge() -> bool:
+                if not self.budget.withdraw(client_name):
+                    return False
+                self.inc_hedged(client_name, req.method, path)
+                return True
+
+            self.budget.deposit(client_name)
+            resp, hedge_won = await AsyncHedge(
+                send, self.get_delay(client_name, path), can_hedge
+            )
+            if hedge_won:
+                self.inc_hedged_won(client_name, req.method, path)
+            return resp
+
+        return handle
+
+    def inc_hedged(self, client_name: str, method: str, path: str) -> None:
+        if self._metrics:
+            self._metrics.blacksmith_hedged_request.labels(
+                client_name=client_name, method=method, path=path
+            ).inc()
+
+    def inc_hedged_won(self, client_name: str, method: str, path: str) -> None:
+        if self._metrics:
+            self._metrics.blacksmith_hedged_request_won.labels(
+                client_name=client_name, method=method, path=path
+            ).inc()
@@ -2,7 +2,6 @@
 
 import abc
 import time
-from dataclasses import asdict
 from datetime import timedelta
 from typing import Literal
 
@@ -92,7 +91,13 @@ class AsyncHTTPCacheMiddleware(AsyncHTTPMiddleware):
             client_name, path, req, vary
         )
         resp.headers = dict(resp.headers)
-        response_cache = self._serializer.dumps(asdict(resp))
+        response_cache = self._serializer.dumps(
+            {
+                "status_code": resp.status_code,
+                "headers": resp.headers,
+                "json": resp.json,
+            }
+        )
         await self._cache.set(response_cache_key, response_cache, ttld)
         return True
 
@@ -121,7 +126,9 @@ class AsyncHTTPCacheMiddleware(AsyncHTTPMiddleware):
             timeout: HTTPTimeout,
         ) -> HTTPResponse:
             start = time.perf_counter()
-            if not self._policy.handle_request(req, client_name, path):
+            if not req.options.cache or not self._policy.handle_request(
+                req, client_name, path
+            ):
                 resp = await next(req, client_name, path, timeout)
                 self.inc_cache_miss(
                     client_name,
@@ -0,0 +1,143 @@
+"""Bound the rate of the requests of the clients."""
+
+import abc
+from collections.abc import Mapping
+from typing import Any
+
+from blacksmith.domain.exceptions import RateLimitError
+from blacksmith.domain.model.http import HTTPRequest, HTTPResponse, HTTPTimeout
+from blacksmith.domain.model.middleware.prometheus import PrometheusMetrics
+from blacksmith.domain.model.middleware.rate_limit import RateLimit, TokenBucket
+from blacksmith.shared_utils.concurrency import AsyncSleep
+from blacksmith.typing import ClientName, Path
+
+from .base import AsyncHTTPMiddleware, AsyncMiddleware
+
+# The reservation of :meth:`blacksmith.RateLimit.reserve`, made atomically,
+# using the clock of redis, shared by every process.
+RESERVE_SCRIPT = """
+local time = redis.call("TIME")
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local max_delay = tonumber(ARGV[3])
+local interval = 1 / rate
+local tat = tonumber(redis.call("GET", KEYS[1]) or now)
+if tat < now then
+    tat = now
+end
+local delay = math.max(tat - (burst - 1) * interval - now, 0)
+if delay > max_delay then
+    return false
+end
+tat = tat + interval
+-- the key expires once the burst is refilled
+redis.call("SET", KEYS[1], tostring(tat), "PX", math.ceil((tat - now) * 1000) + 1000)
+return tostring(delay)
+"""
+
+
+class AsyncAbstractRateLimitCache(abc.ABC):
+    """Abstract Redis Client, sharing the rate limits between processes."""
+
+    @abc.abstractmethod
+    async def eval(self, script: str, numkeys: int, *keys_and_args: Any) -> Any:
+        """Run a lua script atomically, and return its result."""
+
+
+try:
+    from redis.asyncio import Redis
+
+    AsyncAbstractRateLimitCache.register(Redis)
+except ImportError:
+    pass
+
+
+class AsyncRateLimitMiddleware(AsyncHTTPMiddleware):
+    """
+    Rate limit the requests, per client, and optionally per path.
+
+    The requests in excess are delayed, in order to smooth the bursts.
+
+    By default, the rate limits are enforced per process, using token buckets.
+    Using a redis ``cache``, the rate limits are shared by every process,
+    the requests are reserved atomically, in a single lua script.
+
+    :param limits: rate limits of the clients, other clients are not limited.
+    :param cache: share the rate limits using redis.
+    :param max_delay: maximum delay of a request, in seconds,
+        a :class:`blacksmith.RateLimitError` is raised if the request would
+        wait longer, by default, requests wait up to ``max_reservation``.
+    :param max_reservation: maximum delay of a request, in seconds, if there
+        is no ``max_delay``, it bounds how far ahead the requests are reserved.
+    :param prefix: prefix of the redis keys.
+    :param metrics: count the delayed requests.
+    """
+
+    def __init__(
+        self,
+        limits: Mapping[ClientName, RateLimit],
+        cache: AsyncAbstractRateLimitCache | None = None,
+        max_delay: float | None = None,
+        max_reservation: float = 60.0,
+        prefix: str = "blacksmith:rate_limit:",
+        metrics: PrometheusMetrics | None = None,
+    ) -> None:
+        self.limits = limits
+        self._cache = cache
+        self.max_delay = max_delay
+        self.max_reservation = max_reservation
+        self.prefix = prefix
+        self._metrics = metrics
+        self._buckets = TokenBucket()
+
+    def get_key(self, client_name: ClientName, path: Path, limit: RateLimit) -> str:
+        """Return the key of the rate limit of the request."""
+        return f"{client_name}:{path}" if limit.per_path else client_name
+
+    async def reserve(self, key: str, limit: RateLimit) -> float | None:
+        """
+        Reserve a request, and return the delay to wait, in seconds.
+
+        :return: None if the request would wait longer than ``max_delay``.
+        """
+        max_delay = self.max_reservation if self.max_delay is None else self.max_delay
+        if self._cache is None:
+            return self._buckets.reserve(key, limit, max_delay)
+
+        delay = await self._cache.eval(
+            RESERVE_SCRIPT,
+            1,
+            f"{self.prefix}{key}",
+            limit.rate,
+            limit.burst,
+            max_delay,
+        )
+        return None if delay is None else float(delay)
+
+    def __call__(self, next: AsyncMiddleware) -> AsyncMiddleware:
+        async def handle(
+            req: HTTPRequest,
+            client_name: ClientName,
+            path: Path,
+            timeout: HTTPTimeout,
+        ) -> HTTPResponse:
+            limit = self.limits.get(client_name)
+            if limit is None:
+                return await next(req, client_name, path, timeout)
+
+            delay = await self.reserve(self.get_key(client_name, path, limit), limit)
+            if delay is None:
+                raise RateLimitError(client_name)
+            if delay > 0:
+                self.inc_throttled(client_name, req.method, path)
+                await AsyncSleep(delay)
+            return await next(req, client_name, path, timeout)
+
+        return handle
+
+    def inc_throttled(self, client_name: str, method: str, path: str) -> None:
+        if self._metrics:
+            self._metrics.blacksmith_request_throttled.labels(
+                client_name=client_name, method=method, path=path
+            ).inc()
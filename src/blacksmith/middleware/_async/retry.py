@@ -0,0 +1,79 @@
+"""Retry the requests that failed on transient errors."""
+
+from blacksmith.domain.model.deadline import get_remaining_time
+from blacksmith.domain.model.http import HTTPRequest, HTTPResponse, HTTPTimeout
+from blacksmith.domain.model.middleware.budget import Budget
+from blacksmith.domain.model.middleware.prometheus import PrometheusMetrics
+from blacksmith.domain.model.middleware.retry import RetryPolicy
+from blacksmith.shared_utils.concurrency import AsyncSleep
+from blacksmith.typing import ClientName, Path
+
+from .base import AsyncHTTPMiddleware, AsyncMiddleware
+
+
+class AsyncRetryMiddleware(AsyncHTTPMiddleware):
+    """
+    Retry the idempotent requests that failed on transient errors.
+
+    The last error is raised if every attempt failed, if the retry
+    budget of the client is exhausted, or if the next attempt would start after
+    the deadline of the context, see :class:`blacksmith.Deadline`.
+
+    :param policy: decide which request is retried, and when.
+    :param budget: bound the ratio of retries, per client,
+        10% of the requests by default, in order to not amplify the load
+        of a service during an outage.
+    :param metrics: count the retries.
+    """
+
+    def __init__(
+        self,
+        policy: RetryPolicy | None = None,
+        budget: Budget | None = None,
+        metrics: PrometheusMetrics | None = None,
+    ) -> None:
+        self.policy = policy or RetryPolicy()
+        self.budget = budget or Budget()
+        self._metrics = metrics
+
+    def __call__(self, next: AsyncMiddleware) -> AsyncMiddleware:
+        async def handle(
+            req: HTTPRequest,
+            client_name: ClientName,
+            path: Path,
+            timeout: HTTPTimeout,
+        ) -> HTTPResponse:
+            if not self.policy.handle_request(req):
+                return await next(req, client_name, path, timeout)
+
+            self.budget.deposit(client_name)
+            attempt = 1
+            delay = 0.0
+            while True:
+                remaining = get_remaining_time()
+                attempt_timeout = (
+                    timeout if remaining is None else timeout.shrink(remaining)
+                )
+                try:
+                    return await next(req, client_name, path, attempt_timeout)
+                except Exception as exc:
+                    retry_delay = self.policy.get_retry_delay(exc, attempt, delay)
+                    if retry_delay is None:
+                        raise
+                    remaining = get_remaining_time()
+                    if remaining is not None and remaining <= retry_delay:
+                        raise
+                    if not self.budget.withdraw(client_name):
+                        raise
+                self.inc_retried(client_name, req.method, path)
+                await AsyncSleep(retry_delay)
+                attempt += 1
+                delay = retry_delay
+
+        return handle
+
+    def inc_retried(self, client_name: str, method: str, path: str) -> None:
+        if self._metrics:
+            self._metrics.blacksmith_request_retried.labels(
+                client_name=client_name, method=method, path=path
+            ).inc()
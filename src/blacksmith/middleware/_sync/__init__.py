@@ -1,15 +1,30 @@
+from .adaptive_concurrency import SyncAdaptiveConcurrencyMiddleware
+from .adaptive_timeout import SyncAdaptiveTimeoutMiddleware
 from .auth import SyncHTTPAuthorizationMiddleware, SyncHTTPBearerMiddleware
+from .backpressure import SyncBackpressureMiddleware
 from .base import SyncHTTPAddHeadersMiddleware, SyncHTTPMiddleware, SyncMiddleware
+from .bulkhead import SyncBulkheadMiddleware
 from .circuit_breaker import SyncCircuitBreakerMiddleware
+from .deadline import SyncDeadlineMiddleware
+from .hedging import SyncHedgingMiddleware
 from .http_cache import SyncAbstractCache, SyncHTTPCacheMiddleware
 from .logging import SyncLoggingMiddleware
 from .oauth2_token import SyncOAuth2RefreshTokenMiddlewareFactory
 from .prometheus import SyncPrometheusMiddleware
+from .rate_limit import SyncAbstractRateLimitCache, SyncRateLimitMiddleware
+from .retry import SyncRetryMiddleware
+from .single_flight import SyncSingleFlightMiddleware
 from .zipkin import SyncZipkinMiddleware
 
 __all__ = [
+    "SyncAdaptiveConcurrencyMiddleware",
+    "SyncAdaptiveTimeoutMiddleware",
     "SyncAbstractCache",
+    "SyncBackpressureMiddleware",
+    "SyncBulkheadMiddleware",
     "SyncCircuitBreakerMiddleware",
+    "SyncDeadlineMiddleware",
+    "SyncHedgingMiddleware",
     "SyncHTTPAddHeadersMiddleware",
     "SyncHTTPAuthorizationMiddleware",
     "SyncHTTPBearerMiddleware",
@@ -19,5 +34,9 @@ __all__ = [
     "SyncMiddleware",
     "SyncLoggingMiddleware",
     "SyncPrometheusMiddleware",
+    "SyncAbstractRateLimitCache",
+    "SyncRateLimitMiddleware",
+    "SyncRetryMiddleware",
+    "SyncSingleFlightMiddleware",
     "SyncZipkinMiddleware",
 ]
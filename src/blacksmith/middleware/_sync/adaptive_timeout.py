@@ -0,0 +1,82 @@
+"""Derive the timeout of the requests from their observed latency."""
+
+import time
+
+from blacksmith.domain.exceptions import HTTPError, HTTPTimeoutError
+from blacksmith.domain.model.http import HTTPRequest, HTTPResponse, HTTPTimeout
+from blacksmith.domain.model.middleware.latency import LatencyPercentiles
+from blacksmith.typing import ClientName, Path
+
+from .base import SyncHTTPMiddleware, SyncMiddleware
+
+
+class SyncAdaptiveTimeoutMiddleware(SyncHTTPMiddleware):
+    """
+    Set the read timeout of the requests from the observed latencies.
+
+    The read timeout is the percentile of the latencies of the requests of the
+    same client and path, multiplied by a factor, and bounded by a minimum and
+    a maximum timeout.
+    The configured timeout is used until enough latencies have been observed,
+    and the read timeout is only shrunk, it never exceeds the read timeout of
+    the request, which may be set per call or per route.
+
+    The latencies are observed like the :class:`blacksmith.AsyncPrometheusMiddleware`
+    does, the responses and the http errors, and the requests that timed out
+    are observed at their timeout, in order to raise the timeout of a service
+    that is slower than it used to be.
+
+    :param percentile: percentile of the latencies, ``0.99`` for the p99.
+    :param factor: ratio of the timeout to the percentile.
+    :param min_timeout: minimum read timeout, in seconds.
+    :param max_timeout: maximum read timeout, in seconds, bounding the read
+        timeout of the requests further, unbounded by default.
+    :param latencies: observed latencies, shared with other middlewares.
+    """
+
+    def __init__(
+        self,
+        percentile: float = 0.99,
+        factor: float = 2.0,
+        min_timeout: float = 0.5,
+        max_timeout: float | None = None,
+        latencies: LatencyPercentiles | None = None,
+    ) -> None:
+        self.percentile = percentile
+        self.factor = factor
+        self.min_timeout = min_timeout
+        self.max_timeout = max_timeout
+        self.latencies = latencies or LatencyPercentiles()
+
+    def get_timeout(
+        self, client_name: ClientName, path: Path, timeout: HTTPTimeout
+    ) -> HTTPTimeout:
+        """Return the timeout of the request, with the adaptive read timeout."""
+        latency = self.latencies.get_percentile(client_name, path, self.percentile)
+        if latency is None:
+            return timeout
+        read = min(max(latency * self.factor, self.min_timeout), timeout.read)
+        if self.max_timeout is not None:
+            read = min(read, self.max_timeout)
+        return HTTPTimeout(
+            read, timeout.connect, timeout.write, timeout.pool, timeout.total
+        )
+
+    def __call__(self, next: SyncMiddleware) -> SyncMiddleware:
+        def handle(
+            req: HTTPRequest,
+            client_name: ClientName,
+            path: Path,
+            timeout: HTTPTimeout,
+        ) -> HTTPResponse:
+            timeout = self.get_timeout(client_name, path, timeout)
+            start = time.perf_counter()
+            try:
+                resp = next(req, client_name, path, timeout)
+            except (HTTPError, HTTPTimeoutError):
+                self.latencies.observe(client_name, path, time.perf_counter() - start)
+                raise
+            self.latencies.observe(client_name, path, time.perf_counter() - start)
+            return resp
+
+        return handle
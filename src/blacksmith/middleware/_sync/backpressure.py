@@ -0,0 +1,94 @@
+"""Pause the requests while the services ask to."""
+
+from collections.abc import Hashable, Sequence
+
+from httpx import Headers
+
+from blacksmith.domain.exceptions import BackpressureError, HTTPError
+from blacksmith.domain.model.http import HTTPRequest, HTTPResponse, HTTPTimeout
+from blacksmith.domain.model.middleware.backpressure import Backpressure
+from blacksmith.domain.model.middleware.prometheus import PrometheusMetrics
+from blacksmith.domain.model.middleware.retry import parse_retry_after
+from blacksmith.shared_utils.concurrency import SyncSleep
+from blacksmith.typing import ClientName, Path
+
+from .base import SyncHTTPMiddleware, SyncMiddleware
+
+
+class SyncBackpressureMiddleware(SyncHTTPMiddleware):
+    """
+    Pause the requests of a client while the service asks to.
+
+    When a service replies an error with a ``Retry-After`` header, the
+    following requests of the client are delayed until the pause is elapsed,
+    or fail fast, raising :class:`blacksmith.BackpressureError`, if the pause
+    is longer than ``max_delay``.
+
+    :param status_codes: http status codes that may advertise a pause.
+    :param per_path: pause the requests per path template of the client,
+        instead of the whole client.
+    :param max_delay: maximum delay of a request, in seconds, the requests
+        fail fast during the pause by default.
+    :param max_pause: maximum pause honoured, in seconds.
+    :param metrics: count the requests delayed or rejected during a pause.
+    """
+
+    def __init__(
+        self,
+        status_codes: Sequence[int] = (429, 503),
+        per_path: bool = False,
+        max_delay: float = 0.0,
+        max_pause: float = 300.0,
+        metrics: PrometheusMetrics | None = None,
+    ) -> None:
+        self.status_codes = status_codes
+        self.per_path = per_path
+        self.max_delay = max_delay
+        self.max_pause = max_pause
+        self._metrics = metrics
+        self._backpressure = Backpressure()
+
+    def get_key(self, client_name: ClientName, path: Path) -> Hashable:
+        """Return the key of the pause of the request."""
+        return (client_name, path) if self.per_path else client_name
+
+    def get_pause(self, exc: HTTPError) -> float | None:
+        """Return the pause asked by the service, in seconds."""
+        if exc.status_code not in self.status_codes:
+            return None
+        retry_after = Headers(exc.response.headers).get("Retry-After")
+        if retry_after is None:
+            return None
+        delay = parse_retry_after(retry_after)
+        return None if delay is None else min(delay, self.max_pause)
+
+    def __call__(self, next: SyncMiddleware) -> SyncMiddleware:
+        def handle(
+            req: HTTPRequest,
+            client_name: ClientName,
+            path: Path,
+            timeout: HTTPTimeout,
+        ) -> HTTPResponse:
+            key = self.get_key(client_name, path)
+            delay = self._backpressure.get_pause(key)
+            if delay > 0:
+                self.inc_paused(client_name, req.method, path)
+                if delay > self.max_delay:
+                    raise BackpressureError(client_name, delay)
+                SyncSleep(delay)
+
+            try:
+                return next(req, client_name, path, timeout)
+            except HTTPError as exc:
+                pause = self.get_pause(exc)
+                if pause:
+                    self._backpressure.pause(key, pause)
+                raise
+
+        return handle
+
+    def inc_paused(self, client_name: str, method: str, path: str) -> None:
+        if self._metrics:
+            self._metrics.blacksmith_request_paused.labels(
+                client_name=client_name, method=method, path=path
+            ).inc()
@@ -0,0 +1,35 @@
+"""Propagate the deadline of the context to the services."""
+
+from blacksmith.domain.model.deadline import get_remaining_time
+from blacksmith.domain.model.http import HTTPRequest, HTTPResponse, HTTPTimeout
+from blacksmith.typing import ClientName, Path
+
+from .base import SyncHTTPMiddleware, SyncMiddleware
+
+
+class SyncDeadlineMiddleware(SyncHTTPMiddleware):
+    """
+    Propagate the remaining time before the deadline in a header.
+
+    The service receiving the request can bound its own requests using
+    :meth:`blacksmith.Deadline.from_header`.
+
+    :param header: name of the header, the remaining time is in seconds.
+    """
+
+    def __init__(self, header: str = "X-Request-Timeout") -> None:
+        self.header = header
+
+    def __call__(self, next: SyncMiddleware) -> SyncMiddleware:
+        def handle(
+            req: HTTPRequest,
+            client_name: ClientName,
+            path: Path,
+            timeout: HTTPTimeout,
+        ) -> HTTPResponse:
+            remaining = get_remaining_time()
+            if remaining is not None:
+                req.headers[self.header] = f"{max(remaining, 0.0):.3f}"
+            return next(req, client_name, path, timeout)
+
+        return handle
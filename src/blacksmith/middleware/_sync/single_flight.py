@@ -0,0 +1,93 @@
+"""Coalesce identical requests running concurrently."""
+
+from collections.abc import Hashable, Sequence
+from copy import copy
+from urllib.parse import urlencode
+
+from httpx import Headers
+
+from blacksmith.domain.exceptions import HTTPTimeoutError
+from blacksmith.domain.model.http import HTTPRequest, HTTPResponse, HTTPTimeout
+from blacksmith.domain.model.middleware.prometheus import PrometheusMetrics
+from blacksmith.shared_utils.concurrency import SyncSingleFlight
+from blacksmith.typing import ClientName, HTTPMethod, Path
+
+from .base import SyncHTTPMiddleware, SyncMiddleware
+
+
+class SyncSingleFlightMiddleware(SyncHTTPMiddleware):
+    """
+    Coalesce identical safe requests running concurrently.
+
+    The first request is sent, and the identical requests made while it is
+    running wait for its response, instead of being sent. They wait for the
+    response in their own timeout, their total timeout, or their read timeout.
+
+    Requests are identical if they share the method, the url, the querystring,
+    and the value of the ``vary`` headers.
+
+    :param vary: headers that differentiate the requests, all the headers
+        by default.
+    :param methods: coalesced http methods.
+    :param metrics: count the coalesced requests.
+    """
+
+    def __init__(
+        self,
+        vary: Sequence[str] | None = None,
+        methods: Sequence[HTTPMethod] = ("GET", "HEAD"),
+        metrics: PrometheusMetrics | None = None,
+    ) -> None:
+        self._vary = vary
+        self._methods = methods
+        self._metrics = metrics
+        self._flights: SyncSingleFlight[HTTPResponse] = SyncSingleFlight()
+
+    def get_flight_key(self, client_name: ClientName, req: HTTPRequest) -> Hashable:
+        """Build the key that identify identical requests."""
+        qs = urlencode(req.querystring, doseq=True)
+        if self._vary is None:
+            headers = tuple(sorted((k.lower(), v) for k, v in req.headers.items()))
+        else:
+            req_headers = Headers(req.headers)
+            headers = tuple((k, req_headers.get(k, "")) for k in self._vary)
+        return (client_name, req.method, req.url, qs, headers)
+
+    def __call__(self, next: SyncMiddleware) -> SyncMiddleware:
+        def handle(
+            req: HTTPRequest,
+            client_name: ClientName,
+            path: Path,
+            timeout: HTTPTimeout,
+        ) -> HTTPResponse:
+            if req.method not in self._methods:
+                return next(req, client_name, path, timeout)
+
+            def send() -> HTTPResponse:
+                return next(req, client_name, path, timeout)
+
+            # a follower does not wait for the leader longer than its own timeout
+            wait = timeout.read if timeout.total is None else timeout.total
+            try:
+                resp, shared = self._flights(
+                    self.get_flight_key(client_name, req), send, wait
+                )
+            except HTTPTimeoutError:
+                raise
+            except TimeoutError as exc:
+                raise HTTPTimeoutError(
+                    f"{client_name} - {req.method} {path} - "
+                    "Timeout while waiting for an identical request"
+                ) from exc
+            if not shared:
+                return resp
+            self.inc_coalesced(client_name, req.method, path)
+            return copy(resp)
+
+        return handle
+
+    def inc_coalesced(self, client_name: str, method: str, path: str) -> None:
+        if self._metrics:
+            self._metrics.blacksmith_request_coalesced.labels(
+                client_name=client_name, method=method, path=path
+            ).inc()
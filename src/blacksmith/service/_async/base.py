@@ -15,3 +15,11 @@ class AsyncAbstractTransport(AsyncMiddleware):
             if proxies
             else None
         )
+
+    async def aclose(self) -> None:
+        """
+        Release the resources held by the transport, such as connection pools.
+
+        The transport can still be used after being closed, resources will be
+        acquired again on the next request.
+        """
@@ -1,13 +1,19 @@
+import json
+from collections.abc import AsyncIterator, Iterable, Sequence
+from dataclasses import replace
+from functools import partial
 from typing import (
     Any,
     Generic,
     cast,
 )
+from urllib.parse import urljoin
 
 from result import Err, Ok, Result
 
 from blacksmith.domain.error import AbstractErrorParser, TError_co
 from blacksmith.domain.exceptions import (
+    DeadlineExceededError,
     HTTPError,
     NoContractException,
     UnregisteredRouteException,
@@ -22,17 +28,25 @@ from blacksmith.domain.model import (
     Response,
     ResponseBox,
 )
+from blacksmith.domain.model.deadline import get_remaining_time
 from blacksmith.domain.model.params import (
     AbstractCollectionParser,
     TCollectionResponse,
     TResponse,
 )
-from blacksmith.domain.registry import ApiRoutes, HttpCollection, HttpResource
+from blacksmith.domain.registry import (
+    ApiRoutes,
+    BatchGet,
+    HttpCollection,
+    HttpResource,
+)
 from blacksmith.domain.typing import AsyncMiddleware
 from blacksmith.middleware._async.base import AsyncHTTPMiddleware
 from blacksmith.service.http_body_serializer import serialize_request
+from blacksmith.shared_utils.concurrency import AsyncBatch, AsyncMap, AsyncPrefetch
 from blacksmith.shared_utils.introspection import (
     build_pydantic_union,
+    get_field_aliases,
     is_instance_with_union,
 )
 from blacksmith.typing import ClientName, HTTPMethod, Path, ResourceName, Url
@@ -52,9 +66,33 @@ def build_timeout(timeout: ClientTimeout) -> HTTPTimeout:
     return timeout
 
 
+def build_middleware_chain(
+    transport: AsyncMiddleware, middlewares: Sequence[AsyncHTTPMiddleware]
+) -> AsyncMiddleware:
+    """Wrap the transport with the middlewares to build the request handler."""
+    next: AsyncMiddleware = transport
+    for middleware in middlewares:
+        next = middleware(next)
+    return next
+
+
 class AsyncRouteProxy(Generic[TCollectionResponse, TResponse, TError_co]):
     """Proxy from resource to its associate routes."""
 
+    __slots__ = (
+        "_batches",
+        "_handler",
+        "client_name",
+        "collection_parser",
+        "endpoint",
+        "error_parser",
+        "middlewares",
+        "name",
+        "routes",
+        "timeout",
+        "transport",
+    )
+
     client_name: ClientName
     name: ResourceName
     endpoint: Url
@@ -76,6 +114,7 @@ class AsyncRouteProxy(Generic[TCollectionResponse, TResponse, TError_co]):
         collection_parser: type[AbstractCollectionParser],
         error_parser: AbstractErrorParser[TError_co],
         middlewares: list[AsyncHTTPMiddleware],
+        handler: AsyncMiddleware | None = None,
     ) -> None:
         self.client_name = client_name
         self.name = name
@@ -86,6 +125,132 @@ class AsyncRouteProxy(Generic[TCollectionResponse, TResponse, TError_co]):
         self.collection_parser = collection_parser
         self.error_parser = error_parser
         self.middlewares = middlewares
+        self._handler = handler
+        self._batches: dict[
+            str, AsyncBatch[Any, ResponseBox[TResponse, TError_co]]
+        ] = {}
+
+    @property
+    def handler(self) -> AsyncMiddleware:
+        """
+        The transport wrapped by the middlewares.
+
+        It is built once, on the first request, if the client did not provide it.
+        """
+        if self._handler is None:
+            self._handler = build_middleware_chain(self.transport, self.middlewares)
+        return self._handler
+
+    def get_batch(
+        self, group: str, params: dict[str, Any]
+    ) -> AsyncBatch[Any, ResponseBox[TResponse, TError_co]]:
+        """
+        Coalesce the ``get`` of the resource in ``collection_get``.
+
+        The ``get`` are coalesced per group, the ``get`` of a group share the
+        same params, except the key, which are sent in the ``collection_get``.
+        """
+        batch = self._batches.get(group)
+        if batch is None:
+            batch_get = cast(BatchGet, self.routes.batch_get)
+            batch = self._batches[group] = AsyncBatch(
+                partial(self._load_batch, params), batch_get.max_batch_size
+            )
+        return batch
+
+    def _get_batch_params(
+        self, params: Request | dict[Any, Any]
+    ) -> tuple[Any, str, dict[str, Any]] | None:
+        """
+        Split the params of a ``get`` in its key, its group and the other params.
+
+        :return: None if the ``get`` can't be batched.
+        """
+        batch_get = cast(BatchGet, self.routes.batch_get)
+        resource, collection = self.routes.resource, self.routes.collection
+        if resource is None or resource.contract is None:
+            return None
+        if "GET" not in resource.contract:
+            return None
+        if collection is None or collection.contract is None:
+            return None
+        if "GET" not in collection.contract:
+            return None
+
+        build_params = self._build_params("GET", params, resource.contract["GET"][0])
+        key = getattr(build_params, batch_get.key, None)
+        if key is None:
+            return None
+        try:
+            other_params = build_params.model_dump(
+                by_alias=True, exclude={batch_get.key}
+            )
+            group = json.dumps(
+                build_params.model_dump(
+                    mode="json", by_alias=True, exclude={batch_get.key}
+                ),
+                sort_keys=True,
+            )
+        except (TypeError, ValueError):
+            return None
+        # the params that can't be sent in the collection_get are never dropped
+        if not other_params.keys() <= get_field_aliases(collection.contract["GET"][0]):
+            return None
+        return key, group, other_params
+
+    async def _load_batch(
+        self, params: dict[str, Any], keys: list[Any]
+    ) -> list[ResponseBox[TResponse, TError_co]]:
+        batch_get = cast(BatchGet, self.routes.batch_get)
+        resource = self.routes.resource
+        if resource is None or self.routes.collection is None:
+            raise UnregisteredRouteException("GET", self.name, self.client_name)
+        if resource.contract is None or "GET" not in resource.contract:
+            raise NoContractException("GET", self.name, self.client_name)
+
+        path, req, _ = self._prepare_request(
+            "GET",
+            {**params, batch_get.collection_key or batch_get.key: keys},
+            self.routes.collection,
+        )
+        result = await self._handle_req_with_middlewares(
+            req, self._get_timeout(req, None), path
+        )
+        resp_schema = resource.contract["GET"][1]
+        if result.is_err():
+            return [
+                self._prepare_response(result, resp_schema, "GET", resource.path)
+                for _ in keys
+            ]
+
+        resp = result.unwrap()
+        collection_parser = self.routes.collection.collection_parser
+        parsed = (collection_parser or self.collection_parser)(resp)
+        response_key = batch_get.response_key or batch_get.key
+        # keys are compared as strings, the way they are sent in the querystring
+        items = {
+            str(item[response_key]): item
+            for item in parsed.json
+            if item.get(response_key) is not None
+        }
+        boxes: list[ResponseBox[TResponse, TError_co]] = []
+        for key in keys:
+            item = items.get(str(key))
+            item_result: Result[HTTPResponse, HTTPError]
+            if item is None:
+                item_result = Err(
+                    HTTPError(
+                        f"{self.client_name} - GET {resource.path} - 404 Not Found",
+                        req,
+                        HTTPResponse(404, {}, {"detail": "Not Found"}),
+                    )
+                )
+            else:
+                item_result = Ok(HTTPResponse(resp.status_code, resp.headers, item))
+            boxes.append(
+                self._prepare_response(item_result, resp_schema, "GET", resource.path)
+            )
+        return boxes
 
     def _prepare_request(
         self,
@@ -99,22 +264,38 @@ class AsyncRouteProxy(Generic[TCollectionResponse, TResponse, TError_co]):
             raise NoContractException(method, self.name, self.client_name)
 
         param_schema, return_schema = resource.contract[method]
-        build_params: Request
+        build_params = self._build_params(method, params, param_schema)
+        req = serialize_request(method, self.endpoint + resource.path, build_params)
+        req.options = resource.get_options(method)
+        return (resource.path, req, return_schema)
+
+    def _build_params(
+        self,
+        method: HTTPMethod,
+        params: Request | dict[Any, Any] | None,
+        param_schema: type[Request],
+    ) -> Request:
         if isinstance(params, dict):
-            build_params = cast(Request, build_pydantic_union(param_schema, params))
-        elif params is None:
-            build_params = param_schema()
-        elif not is_instance_with_union(params, param_schema):
+            return cast(Request, build_pydantic_union(param_schema, params))
+        if params is None:
+            return param_schema()
+        if not is_instance_with_union(params, param_schema):
             raise WrongRequestTypeException(
                 params.__class__,  # type: ignore
                 method,
                 self.name,
                 self.client_name,
             )
-        else:
-            build_params = params
-        req = serialize_request(method, self.endpoint + resource.path, build_params)
-        return (resource.path, req, return_schema)
+        return params
+
+    def _get_timeout(
+        self, req: HTTPRequest, timeout: ClientTimeout | None
+    ) -> HTTPTimeout:
+        """
+        Return the timeout of the request, the timeout passed to the request,
+        or the timeout of its route, or the timeout of the client.
+        """
+        return build_timeout(timeout or req.options.timeout or self.timeout)
 
     def _prepare_response(
         self,
@@ -138,6 +319,7 @@ class AsyncRouteProxy(Generic[TCollectionResponse, TResponse, TError_co]):
         result: Result[HTTPResponse, HTTPError],
         response_schema: type[Response],
         collection_parser: type[AbstractCollectionParser] | None,
+        batch_size: int = 0,
     ) -> Result[CollectionIterator[TCollectionResponse], TError_co]:
         if result.is_err():
             return Err(self.error_parser(result.unwrap_err()))
@@ -147,18 +329,22 @@ class AsyncRouteProxy(Generic[TCollectionResponse, TResponse, TError_co]):
                     result.unwrap(),
                     response_schema,
                     collection_parser or self.collection_parser,
+                    batch_size,
                 )
             )
 
     async def _handle_req_with_middlewares(
         self, req: HTTPRequest, timeout: HTTPTimeout, path: Path
     ) -> Result[HTTPResponse, HTTPError]:
-        next: AsyncMiddleware = self.transport
-        for middleware in self.middlewares:
-            next = middleware(next)
-
+        remaining = get_remaining_time()
+        if remaining is not None:
+            if remaining <= 0:
+                raise DeadlineExceededError(
+                    f"{self.client_name} - {req.method} {path} - Deadline exceeded"
+                )
+            timeout = timeout.shrink(remaining)
         try:
-            resp = await next(req, self.client_name, path, timeout)
+            resp = await self.handler(req, self.client_name, path, timeout)
         except HTTPError as exc:
             return Err(exc)
         return Ok(resp)
@@ -166,38 +352,112 @@ class AsyncRouteProxy(Generic[TCollectionResponse, TResponse, TError_co]):
     async def _yield_collection_request(
         self,
         method: HTTPMethod,
-        params: Request | None | dict[Any, Any],
-        timeout: HTTPTimeout,
+        params: Request | dict[Any, Any] | None,
+        timeout: ClientTimeout | None,
         collection: HttpCollection,
+        batch_size: int = 0,
     ) -> Result[CollectionIterator[TCollectionResponse], TError_co]:
         path, req, resp_schema = self._prepare_request(method, params, collection)
-        resp = await self._handle_req_with_middlewares(req, timeout, path)
+        resp = await self._handle_req_with_middlewares(
+            req, self._get_timeout(req, timeout), path
+        )
         return self._prepare_collection_response(
-            resp, resp_schema, collection.collection_parser
+            resp, resp_schema, collection.collection_parser, batch_size
+        )
+
+    async def _yield_collection_pages(
+        self,
+        req: HTTPRequest,
+        path: Path,
+        resp_schema: type[Response],
+        timeout: HTTPTimeout,
+        collection: HttpCollection,
+        batch_size: int,
+    ) -> AsyncIterator[Result[CollectionIterator[TCollectionResponse], TError_co]]:
+        while True:
+            resp = await self._handle_req_with_middlewares(req, timeout, path)
+            page: Result[CollectionIterator[TCollectionResponse], TError_co] = (
+                self._prepare_collection_response(
+                    resp, resp_schema, collection.collection_parser, batch_size
+                )
+            )
+            yield page
+            if page.is_err():
+                break
+            next_link = page.unwrap().meta.links.get("next")
+            if not next_link:
+                break
+            next_url = urljoin(req.url, next_link["url"])
+            req = HTTPRequest(
+                method=req.method,
+                # the url is a pattern, formatted with the path parameters
+                url_pattern=next_url.replace("{", "{{").replace("}", "}}"),
+                headers=req.headers,
+                options=req.options,
+            )
+
+    async def _yield_all_collection_pages(
+        self,
+        req: HTTPRequest,
+        path: Path,
+        resp_schema: type[Response],
+        timeout: HTTPTimeout,
+        collection: HttpCollection,
+        offset_param: str,
+        batch_size: int,
+        concurrency: int,
+    ) -> AsyncIterator[Result[CollectionIterator[TCollectionResponse], TError_co]]:
+        async def get_page(
+            req: HTTPRequest,
+        ) -> Result[CollectionIterator[TCollectionResponse], TError_co]:
+            resp = await self._handle_req_with_middlewares(req, timeout, path)
+            return self._prepare_collection_response(
+                resp, resp_schema, collection.collection_parser, batch_size
+            )
+
+        page = await get_page(req)
+        yield page
+        if page.is_err():
+            return
+        meta = page.unwrap().meta
+        if not meta.total_count or not meta.count:
+            return
+        offset = int(cast(int, req.querystring.get(offset_param, 0)))
+        reqs = (
+            replace(req, querystring={**req.querystring, offset_param: page_offset})
+            for page_offset in range(offset + meta.count, meta.total_count, meta.count)
         )
+        async for page in AsyncMap(get_page, reqs, concurrency):
+            yield page
+            if page.is_err():
+                break
 
     async def _collection_request(
         self,
         method: HTTPMethod,
         params: Request | dict[Any, Any],
-        timeout: HTTPTimeout,
+        timeout: ClientTimeout | None,
     ) -> ResponseBox[TResponse, TError_co]:
         path, req, resp_schema = self._prepare_request(
             method, params, self.routes.collection
         )
-        resp = await self._handle_req_with_middlewares(req, timeout, path)
+        resp = await self._handle_req_with_middlewares(
+            req, self._get_timeout(req, timeout), path
+        )
         return self._prepare_response(resp, resp_schema, method, path)
 
     async def _request(
         self,
         method: HTTPMethod,
         params: Request | dict[Any, Any],
-        timeout: HTTPTimeout,
+        timeout: ClientTimeout | None,
     ) -> ResponseBox[TResponse, TError_co]:
         path, req, resp_schema = self._prepare_request(
             method, params, self.routes.resource
         )
-        resp = await self._handle_req_with_middlewares(req, timeout, path)
+        resp = await self._handle_req_with_middlewares(
+            req, self._get_timeout(req, timeout), path
+        )
         return self._prepare_response(resp, resp_schema, method, path)
 
     async def collection_head(
@@ -208,14 +468,13 @@ class AsyncRouteProxy(Generic[TCollectionResponse, TResponse, TError_co]):
         """
         Use to perform an http ``HEAD`` query on the collection_path.
         """
-        return await self._collection_request(
-            "HEAD", params, build_timeout(timeout or self.timeout)
-        )
+        return await self._collection_request("HEAD", params, timeout)
 
     async def collection_get(
         self,
-        params: Request | None | dict[Any, Any] = None,
+        params: Request | dict[Any, Any] | None = None,
         timeout: ClientTimeout | None = None,
+        batch_size: int = 0,
     ) -> Result[CollectionIterator[TCollectionResponse], TError_co]:
         """
         Retrieve a collection of resources.
@@ -232,14 +491,95 @@ class AsyncRouteProxy(Generic[TCollectionResponse, TResponse, TError_co]):
             by passing a :class:`blacksmith.AbstractCollectionParser` on the
             :class:`blacksmith.AsyncClientFactory` (
             or :class:`blacksmith.SyncClientFactory` for the synchronous version).
+
+        :param batch_size: validate the models by batches of ``batch_size`` items,
+            in one pass, instead of one by one. It speeds up the validation of
+            large collections.
         """
         if not self.routes.collection:
             raise UnregisteredRouteException("GET", self.name, self.client_name)
         return await self._yield_collection_request(
             "GET",
             params,
-            build_timeout(timeout or self.timeout),
+            timeout,
+            self.routes.collection,
+            batch_size,
+        )
+
+    def collection_get_pages(
+        self,
+        params: Request | dict[Any, Any] | None = None,
+        timeout: ClientTimeout | None = None,
+        batch_size: int = 0,
+        prefetch: int = 1,
+    ) -> AsyncIterator[Result[CollectionIterator[TCollectionResponse], TError_co]]:
+        """
+        Retrieve a paginated collection of resources, page by page.
+
+        The first page is retrieved like :meth:`collection_get` does, then, the
+        ``next`` links of the ``Link`` header of responses are followed, until the
+        last page, or until an error.
+
+        Every page is returned as the result of :meth:`collection_get`.
+
+        :param prefetch: number of pages retrieved ahead, while the current page
+            is consumed. Set it to ``0`` to retrieve the pages on demand.
+        :param batch_size: see :meth:`collection_get`.
+        """
+        if not self.routes.collection:
+            raise UnregisteredRouteException("GET", self.name, self.client_name)
+        path, req, resp_schema = self._prepare_request(
+            "GET", params, self.routes.collection
+        )
+        pages = self._yield_collection_pages(
+            req,
+            path,
+            resp_schema,
+            self._get_timeout(req, timeout),
+            self.routes.collection,
+            batch_size,
+        )
+        if prefetch > 0:
+            return AsyncPrefetch(pages, prefetch)
+        return pages
+
+    def collection_get_all_pages(
+        self,
+        params: Request | dict[Any, Any] | None = None,
+        timeout: ClientTimeout | None = None,
+        offset_param: str = "offset",
+        batch_size: int = 0,
+        concurrency: int = 4,
+    ) -> AsyncIterator[Result[CollectionIterator[TCollectionResponse], TError_co]]:
+        """
+        Retrieve all the pages of an offset/limit paginated collection.
+
+        The first page is retrieved like :meth:`collection_get` does, then, the
+        other pages are known from the total count of the collection, and are
+        retrieved concurrently, with a new offset in the querystring.
+
+        Every page is returned, in order, as the result of :meth:`collection_get`,
+        the iteration stops after the first page in error.
+
+        :param offset_param: name of the offset in the querystring. The size of
+            the pages is the number of items of the first page.
+        :param concurrency: maximum number of pages retrieved concurrently.
+        :param batch_size: see :meth:`collection_get`.
+        """
+        if not self.routes.collection:
+            raise UnregisteredRouteException("GET", self.name, self.client_name)
+        path, req, resp_schema = self._prepare_request(
+            "GET", params, self.routes.collection
+        )
+        return self._yield_all_collection_pages(
+            req,
+            path,
+            resp_schema,
+            self._get_timeout(req, timeout),
             self.routes.collection,
+            offset_param,
+            batch_size,
+            concurrency,
         )
 
     async def collection_post(
@@ -250,9 +590,7 @@ class AsyncRouteProxy(Generic[TCollectionResponse, TResponse, TError_co]):
         """
         Use to perform an http ``POST`` query on the collection_path.
         """
-        return await self._collection_request(
-            "POST", params, build_timeout(timeout or self.timeout)
-        )
+        return await self._collection_request("POST", params, timeout)
 
     async def collection_put(
         self,
@@ -262,9 +600,7 @@ class AsyncRouteProxy(Generic[TCollectionResponse, TResponse, TError_co]):
         """
         Use to perform an http ``PUT`` query on the collection_path.
         """
-        return await self._collection_request(
-            "PUT", params, build_timeout(timeout or self.timeout)
-        )
+        return await self._collection_request("PUT", params, timeout)
 
     async def collection_patch(
         self,
@@ -274,9 +610,7 @@ class AsyncRouteProxy(Generic[TCollectionResponse, TResponse, TError_co]):
         """
         Use to perform an http ``PATCH`` query on the collection_path.
         """
-        return await self._collection_request(
-            "PATCH", params, build_timeout(timeout or self.timeout)
-        )
+        return await self._collection_request("PATCH", params, timeout)
 
     async def collection_delete(
         self,
@@ -286,9 +620,7 @@ class AsyncRouteProxy(Generic[TCollectionResponse, TResponse, TError_co]):
         """
         Use to perform an http ``DELETE`` query on the collection_path.
         """
-        return await self._collection_request(
-            "DELETE", params, build_timeout(timeout or self.timeout)
-        )
+        return await self._collection_request("DELETE", params, timeout)
 
     async def collection_options(
         self,
@@ -298,9 +630,7 @@ class AsyncRouteProxy(Generic[TCollectionResponse, TResponse, TError_co]):
         """
         Use to perform an http ``OPTIONS`` query on the collection_path.
         """
-        return await self._collection_request(
-            "OPTIONS", params, build_timeout(timeout or self.timeout)
-        )
+        return await self._collection_request("OPTIONS", params, timeout)
 
     async def head(
         self,
@@ -310,9 +640,7 @@ class AsyncRouteProxy(Generic[TCollectionResponse, TResponse, TError_co]):
         """
         Use to perform an http ``HEAD`` query on the path.
         """
-        return await self._request(
-            "HEAD", params, build_timeout(timeout or self.timeout)
-        )
+        return await self._request("HEAD", params, timeout)
 
     async def get(
         self,
@@ -321,12 +649,59 @@ class AsyncRouteProxy(Generic[TCollectionResponse, TResponse, TError_co]):
     ) -> ResponseBox[TResponse, TError_co]:
         """
         Use to perform an http ``GET`` query on the path.
+
+        If the resource has been registered with a ``batch_get``, and the timeout
+        is not overriden, the concurrent ``get`` are coalesced in ``collection_get``,
+        if their params, except the key, are identical, and are accepted by the
+        ``collection_get`` contract.
+        The ``get`` made under a :class:`blacksmith.Deadline` are never coalesced,
+        the ``collection_get`` would run under the deadline of one of them.
         """
-        resp = await self._request(
-            "GET", params, build_timeout(timeout or self.timeout)
-        )
+        if (
+            self.routes.batch_get
+            and timeout is None
+            and AsyncBatch.coalesces
+            and get_remaining_time() is None
+        ):
+            batch_params = self._get_batch_params(params)
+            if batch_params is not None:
+                key, group, other_params = batch_params
+                batch = self.get_batch(group, other_params)
+                try:
+                    return await batch(key)
+                finally:
+                    if not batch.pending and self._batches.get(group) is batch:
+                        self._batches.pop(group, None)
+        resp = await self._request("GET", params, timeout)
         return resp
 
+    async def get_many(
+        self,
+        params: Iterable[Request | dict[Any, Any]],
+        timeout: ClientTimeout | None = None,
+        concurrency: int = 10,
+    ) -> list[Result[ResponseBox[TResponse, TError_co], Exception]]:
+        """
+        Use to perform many http ``GET`` queries on the path, concurrently.
+
+        The results are returned in the order of the params. The http errors
+        are kept in their own response, like :meth:`get` does, and the exceptions
+        raised by a query, such as a :class:`blacksmith.HTTPTimeoutError`,
+        are returned in its own result, the other queries are not interrupted.
+
+        :param concurrency: maximum number of queries running at the same time.
+        """
+
+        async def get(
+            params: Request | dict[Any, Any],
+        ) -> Result[ResponseBox[TResponse, TError_co], Exception]:
+            try:
+                return Ok(await self.get(params, timeout))
+            except Exception as exc:
+                return Err(exc)
+
+        return [resp async for resp in AsyncMap(get, params, concurrency)]
+
     async def post(
         self,
         params: Request | dict[Any, Any],
@@ -335,9 +710,7 @@ class AsyncRouteProxy(Generic[TCollectionResponse, TResponse, TError_co]):
         """
         Use to perform an http ``POST`` query on the path.
         """
-        return await self._request(
-            "POST", params, build_timeout(timeout or self.timeout)
-        )
+        return await self._request("POST", params, timeout)
 
     async def put(
         self,
@@ -347,9 +720,7 @@ class AsyncRouteProxy(Generic[TCollectionResponse, TResponse, TError_co]):
         """
         Use to perform an http ``PUT`` query on the path.
         """
-        return await self._request(
-            "PUT", params, build_timeout(timeout or self.timeout)
-        )
+        return await self._request("PUT", params, timeout)
 
     async def patch(
         self,
@@ -359,9 +730,7 @@ class AsyncRouteProxy(Generic[TCollectionResponse, TResponse, TError_co]):
         """
         Use to perform an http ``PATCH`` query on the path.
         """
-        return await self._request(
-            "PATCH", params, build_timeout(timeout or self.timeout)
-        )
+        return await self._request("PATCH", params, timeout)
 
     async def delete(
         self,
@@ -371,9 +740,7 @@ class AsyncRouteProxy(Generic[TCollectionResponse, TResponse, TError_co]):
         """
         Use to perform an http ``DELETE`` query on the path.
         """
-        return await self._request(
-            "DELETE", params, build_timeout(timeout or self.timeout)
-        )
+        return await self._request("DELETE", params, timeout)
 
     async def options(
         self,
@@ -383,6 +750,4 @@ class AsyncRouteProxy(Generic[TCollectionResponse, TResponse, TError_co]):
         """
         Use to perform an http ``OPTIONS`` query on the path.
         """
-        return await self._request(
-            "OPTIONS", params, build_timeout(timeout or self.timeout)
-        )
+        return await self._request("OPTIONS", params, timeout)
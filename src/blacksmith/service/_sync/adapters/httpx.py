@@ -1,11 +1,13 @@
 from collections.abc import Mapping
 from typing import Any, cast
 
+from httpx import Limits as HttpxLimits
 from httpx import Timeout as HttpxTimeout
 from httpx import TimeoutException
 
 from blacksmith.domain.exceptions import HTTPError, HTTPTimeoutError
 from blacksmith.domain.model import (
+    HTTPPoolLimits,
     HTTPRawResponse,
     HTTPRequest,
     HTTPResponse,
@@ -13,7 +15,8 @@ from blacksmith.domain.model import (
 )
 from blacksmith.service.http_body_serializer import serialize_response
 from blacksmith.service.ports import SyncClient
-from blacksmith.typing import ClientName, Path
+from blacksmith.service.total_timeout import SyncSendWithTotal
+from blacksmith.typing import ClientName, Path, Proxies
 
 from ..base import SyncAbstractTransport
 
@@ -29,10 +32,80 @@ class SyncHttpxTransport(SyncAbstractTransport):
     """
     Transport implemented using `httpx`_.
 
+    The transport owns a long lived http client in order to reuse connections
+    between requests. The client is created on the first request and released
+    when the transport is closed.
+
+    :param verify_certificate: Reject request if certificate are invalid for https
+    :param proxies: configure proxies
+    :param limits: configure the connection pool limits
+    :param lazy_json: keep the raw body of json responses, the response schema
+        is validated from the raw bytes and the json is parsed only if accessed.
+    :param pools: dedicated connection pools of clients, and their limits,
+        the other clients share the connection pool of the transport.
+
     .. _`httpx`: https://www.python-httpx.org/
 
     """
 
+    limits: HTTPPoolLimits
+    lazy_json: bool
+    pools: Mapping[ClientName, HTTPPoolLimits]
+
+    def __init__(
+        self,
+        verify_certificate: bool = True,
+        proxies: Proxies | None = None,
+        limits: HTTPPoolLimits | None = None,
+        lazy_json: bool = False,
+        pools: Mapping[ClientName, HTTPPoolLimits] | None = None,
+    ):
+        super().__init__(verify_certificate, proxies)
+        self.limits = limits or HTTPPoolLimits()
+        self.lazy_json = lazy_json
+        self.pools = pools or {}
+        self._client: SyncClient | None = None
+        self._clients: dict[ClientName, SyncClient] = {}
+
+    def _build_client(self, limits: HTTPPoolLimits) -> SyncClient:
+        return SyncClient(
+            verify=self.verify_certificate,
+            mounts=self.proxies,
+            limits=HttpxLimits(
+                max_connections=limits.max_connections,
+                max_keepalive_connections=limits.max_keepalive_connections,
+                keepalive_expiry=limits.keepalive_expiry,
+            ),
+        )
+
+    @property
+    def client(self) -> SyncClient:
+        """The http client, created on demand."""
+        if self._client is None:
+            self._client = self._build_client(self.limits)
+        return self._client
+
+    def get_client(self, client_name: ClientName) -> SyncClient:
+        """The http client of the client name, with its dedicated pool if any."""
+        if client_name not in self.pools:
+            return self.client
+        client = self._clients.get(client_name)
+        if client is None:
+            client = self._clients[client_name] = self._build_client(
+                self.pools[client_name]
+            )
+        return client
+
+    def close(self) -> None:
+        """Close the http clients and their connection pools."""
+        clients = list(self._clients.values())
+        self._clients.clear()
+        if self._client is not None:
+            clients.append(self._client)
+            self._client = None
+        for client in clients:
+            client.close()
+
     def __call__(
         self,
         req: HTTPRequest,
@@ -41,31 +114,50 @@ class SyncHttpxTransport(SyncAbstractTransport):
         timeout: HTTPTimeout,
     ) -> HTTPResponse:
         headers = build_headers(req)
-        with SyncClient(
-            verify=self.verify_certificate,
-            mounts=self.proxies,
-        ) as client:
-            try:
-                kwargs: dict[str, Any] = (
-                    {"data": req.body, "files": req.attachments}
-                    if req.attachments
-                    else {"content": req.body}
-                )
+        client = self.get_client(client_name)
+        if timeout.total is not None:
+            timeout = timeout.shrink(timeout.total)
+        try:
+            kwargs: dict[str, Any] = (
+                {"data": req.body, "files": req.attachments}
+                if req.attachments
+                else {"content": req.body}
+            )
+            httpx_timeout = HttpxTimeout(
+                timeout.read,
+                connect=timeout.connect,
+                write=timeout.write,
+                pool=timeout.pool,
+            )
+            if timeout.total is None:
                 r = client.request(  # type: ignore
                     req.method,
                     req.url,
                     params=req.querystring,
                     headers=headers,
-                    timeout=HttpxTimeout(timeout.read, connect=timeout.connect),
+                    timeout=httpx_timeout,
                     **kwargs,
                 )
-            except TimeoutException as exc:
-                raise HTTPTimeoutError(
-                    f"{client_name} - {req.method} {path} - "
-                    f"{exc.__class__.__name__} while calling {req.method} {req.url}"
-                ) from exc
+            else:
+                r = SyncSendWithTotal(
+                    client,
+                    client.build_request(
+                        req.method,
+                        req.url,
+                        params=req.querystring,
+                        headers=headers,
+                        timeout=httpx_timeout,
+                        **kwargs,
+                    ),
+                    timeout.total,
+                )
+        except TimeoutException as exc:
+            raise HTTPTimeoutError(
+                f"{client_name} - {req.method} {path} - "
+                f"{exc.__class__.__name__} while calling {req.method} {req.url}"
+            ) from exc
 
-        resp = serialize_response(cast(HTTPRawResponse, r))
+        resp = serialize_response(cast(HTTPRawResponse, r), self.lazy_json)
         if not r.is_success:
             raise HTTPError(
                 f"{client_name} - {req.method} {path} - "
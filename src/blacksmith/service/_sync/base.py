@@ -15,3 +15,11 @@ class SyncAbstractTransport(SyncMiddleware):
             if proxies
             else None
         )
+
+    def close(self) -> None:
+        """
+        Release the resources held by the transport, such as connection pools.
+
+        The transport can still be used after being closed, resources will be
+        acquired again on the next request.
+        """
@@ -1,18 +1,30 @@
+import time
+from collections.abc import Mapping
 from typing import Any, Generic
 
 from blacksmith.domain.error import AbstractErrorParser, TError_co, default_error_parser
-from blacksmith.domain.exceptions import UnregisteredResourceException
-from blacksmith.domain.model.http import HTTPTimeout
+from blacksmith.domain.exceptions import (
+    UnregisteredResourceException,
+    UnregisteredServiceException,
+)
+from blacksmith.domain.model.http import HTTPPoolLimits, HTTPTimeout
+from blacksmith.domain.model.middleware.prometheus import PrometheusMetrics
 from blacksmith.domain.model.params import AbstractCollectionParser, CollectionParser
 from blacksmith.domain.registry import Registry, Resources
 from blacksmith.domain.registry import registry as default_registry
+from blacksmith.domain.typing import SyncMiddleware
 from blacksmith.middleware._sync.base import SyncHTTPMiddleware
 from blacksmith.sd._sync.base import SyncAbstractServiceDiscovery
 from blacksmith.service._sync.adapters.httpx import SyncHttpxTransport
-from blacksmith.typing import ClientName, Proxies, ResourceName, Url
+from blacksmith.typing import ClientName, Proxies, ResourceName, Service, Url
 
 from .base import SyncAbstractTransport
-from .route_proxy import ClientTimeout, SyncRouteProxy, build_timeout
+from .route_proxy import (
+    ClientTimeout,
+    SyncRouteProxy,
+    build_middleware_chain,
+    build_timeout,
+)
 
 default_timeout = HTTPTimeout()
 
@@ -22,12 +34,14 @@ class SyncClient(Generic[TError_co]):
     Client representation for the client name.
 
     A client will have dymanic property, based on the registered resources.
+
+    The route proxies of the resources are built on their first access, then
+    they are kept on the client.
     """
 
     name: ClientName
     endpoint: Url
     resources: Resources
-    transport: SyncAbstractTransport
     timeout: HTTPTimeout
     collection_parser: type[AbstractCollectionParser]
     middlewares: list[SyncHTTPMiddleware]
@@ -42,20 +56,53 @@ class SyncClient(Generic[TError_co]):
         collection_parser: type[AbstractCollectionParser],
         middlewares: list[SyncHTTPMiddleware],
         error_parser: AbstractErrorParser[TError_co],
+        handler: SyncMiddleware | None = None,
     ) -> None:
         self.name = name
         self.endpoint = endpoint
         self.resources = resources
-        self.transport = transport
+        self._transport = transport
         self.timeout = timeout
         self.collection_parser = collection_parser
         self.error_parser = error_parser
         self.middlewares = middlewares.copy()
+        self._handler = handler
+        self._route_proxies: set[ResourceName] = set()
+
+    @property
+    def transport(self) -> SyncAbstractTransport:
+        return self._transport
+
+    @transport.setter
+    def transport(self, transport: SyncAbstractTransport) -> None:
+        self._transport = transport
+        self._handler = None
+        self._clear_route_proxies()
+
+    @property
+    def handler(self) -> SyncMiddleware:
+        """The transport wrapped by the middlewares, built once per client."""
+        if self._handler is None:
+            self._handler = build_middleware_chain(self.transport, self.middlewares)
+        return self._handler
 
     def add_middleware(self, middleware: SyncHTTPMiddleware) -> "SyncClient[TError_co]":
-        self.middlewares.insert(0, middleware)
+        """
+        Add a middleware to the client and return the client for chaining.
+
+        ..note:: Route proxies retrieved before the call of this method are
+            not altered.
+        """
+        self.middlewares = [middleware, *self.middlewares]
+        self._handler = None
+        self._clear_route_proxies()
         return self
 
+    def _clear_route_proxies(self) -> None:
+        for name in self._route_proxies:
+            del self.__dict__[name]
+        self._route_proxies.clear()
+
     def __getattr__(self, name: ResourceName) -> SyncRouteProxy[Any, Any, TError_co]:
         """
         The client has attributes that are the registered resource.
@@ -63,7 +110,7 @@ class SyncClient(Generic[TError_co]):
         The resource are registered using the :func:`blacksmith.register` function.
         """
         try:
-            return SyncRouteProxy(
+            proxy: SyncRouteProxy[Any, Any, TError_co] = SyncRouteProxy(
                 self.name,
                 name,
                 self.endpoint,
@@ -73,9 +120,14 @@ class SyncClient(Generic[TError_co]):
                 self.collection_parser,
                 self.error_parser,
                 self.middlewares,
+                self.handler,
             )
         except KeyError as exc:
             raise UnregisteredResourceException(name, self.name) from exc
+        # next access is a plain attribute read, __getattr__ is not called.
+        self.__dict__[name] = proxy
+        self._route_proxies.add(name)
+        return proxy
 
 
 class SyncClientFactory(Generic[TError_co]):
@@ -90,13 +142,23 @@ class SyncClientFactory(Generic[TError_co]):
     :param proxies: configure proxies,
         this parameter is ignored if the transport has been passed
     :param verify_certificate: Reject request if certificate are invalid for https
+    :param limits: configure the connection pool limits,
+        this parameter is ignored if the transport has been passed
+    :param lazy_json: validate the responses from their raw json bodies,
+        this parameter is ignored if the transport has been passed
+    :param pools: dedicated connection pools of clients, and their limits,
+        this parameter is ignored if the transport has been passed
     :param collection_parser: use to customize the collection parser
         default use :class:`blacksmith.domain.model.params.CollectionParser`
+    :param endpoint_cache_ttl: number of seconds the endpoints returned by the
+        service discovery are kept in cache. Disabled by default.
+    :param unregistered_service_cache_ttl: number of seconds an unregistered
+        service is kept in cache. Disabled by default.
+    :param metrics: metrics to count the endpoint cache hits and misses.
     """
 
     sd: SyncAbstractServiceDiscovery
     registry: Registry
-    transport: SyncAbstractTransport
     timeout: HTTPTimeout
     collection_parser: type[AbstractCollectionParser]
     middlewares: list[SyncHTTPMiddleware]
@@ -112,12 +174,21 @@ class SyncClientFactory(Generic[TError_co]):
         verify_certificate: bool = False,
         collection_parser: type[AbstractCollectionParser] = CollectionParser,
         error_parser: AbstractErrorParser[TError_co] | None = None,
+        limits: HTTPPoolLimits | None = None,
+        endpoint_cache_ttl: float = 0.0,
+        unregistered_service_cache_ttl: float = 0.0,
+        metrics: PrometheusMetrics | None = None,
+        lazy_json: bool = False,
+        pools: Mapping[ClientName, HTTPPoolLimits] | None = None,
     ) -> None:
         self.sd = sd
         self.registry = registry
-        self.transport = transport or SyncHttpxTransport(
+        self._transport = transport or SyncHttpxTransport(
             verify_certificate=verify_certificate,
             proxies=proxies,
+            limits=limits,
+            lazy_json=lazy_json,
+            pools=pools,
         )
         self.timeout = build_timeout(timeout)
         self.collection_parser = collection_parser
@@ -125,6 +196,32 @@ class SyncClientFactory(Generic[TError_co]):
         # so the default_error_parser assume than TError_co, is HTTPError here
         self.error_parser = error_parser or default_error_parser  # type: ignore
         self.middlewares = []
+        self._handler: SyncMiddleware | None = None
+        self.endpoint_cache_ttl = endpoint_cache_ttl
+        self.unregistered_service_cache_ttl = unregistered_service_cache_ttl
+        self.metrics = metrics
+        # expiration time and endpoint, None for an unregistered service
+        self._endpoints: dict[Service, tuple[float, Url | None]] = {}
+
+    @property
+    def transport(self) -> SyncAbstractTransport:
+        return self._transport
+
+    @transport.setter
+    def transport(self, transport: SyncAbstractTransport) -> None:
+        self._transport = transport
+        self._handler = None
+
+    @property
+    def handler(self) -> SyncMiddleware:
+        """
+        The transport wrapped by the middlewares.
+
+        It is built once and shared by the clients created by the factory.
+        """
+        if self._handler is None:
+            self._handler = build_middleware_chain(self.transport, self.middlewares)
+        return self._handler
 
     def add_middleware(
         self, middleware: SyncHTTPMiddleware
@@ -132,19 +229,62 @@ class SyncClientFactory(Generic[TError_co]):
         """
         Add a middleware to the client factory and return the client for chaining.
 
-        ..note:: Clients created before the call of this method will also be
-            altered. The middleware stack is a reference for all clients.
+        ..note:: Clients created before the call of this method are not altered,
+            every client has its own copy of the middleware stack.
         """
         self.middlewares.insert(0, middleware)
+        self._handler = None
         return self
 
     def initialize(self) -> None:
         for middleware in self.middlewares:
             middleware.initialize()
 
+    def close(self) -> None:
+        """
+        Release the resources of the transport, such as its connection pool.
+
+        Clients created by the factory share the transport, they must not be used
+        while the factory is being closed.
+        """
+        self.transport.close()
+
+    def get_endpoint(self, client_name: ClientName, srv: Service) -> Url:
+        """
+        Get the endpoint of the service from the service discovery.
+
+        Endpoints are kept in cache, according to the factory cache ttl.
+
+        :raises UnregisteredServiceException: if the service is not registered
+            in the service discovery.
+        """
+        if not self.endpoint_cache_ttl and not self.unregistered_service_cache_ttl:
+            return self.sd.get_endpoint(srv[0], srv[1])
+
+        now = time.monotonic()
+        cached = self._endpoints.get(srv)
+        if cached and cached[0] > now:
+            if self.metrics:
+                self.metrics.blacksmith_endpoint_cache_hit.labels(client_name).inc()
+            if cached[1] is None:
+                raise UnregisteredServiceException(srv[0], srv[1])
+            return cached[1]
+
+        if self.metrics:
+            self.metrics.blacksmith_endpoint_cache_miss.labels(client_name).inc()
+        try:
+            endpoint = self.sd.get_endpoint(srv[0], srv[1])
+        except UnregisteredServiceException:
+            if self.unregistered_service_cache_ttl:
+                self._endpoints[srv] = (now + self.unregistered_service_cache_ttl, None)
+            raise
+        if self.endpoint_cache_ttl:
+            self._endpoints[srv] = (now + self.endpoint_cache_ttl, endpoint)
+        return endpoint
+
     def __call__(self, client_name: ClientName) -> SyncClient[TError_co]:
         srv, resources = self.registry.get_service(client_name)
-        endpoint = self.sd.get_endpoint(srv[0], srv[1])
+        endpoint = self.get_endpoint(client_name, srv)
         return SyncClient(
             client_name,
             endpoint,
@@ -154,4 +294,5 @@ class SyncClientFactory(Generic[TError_co]):
             self.collection_parser,
             self.middlewares,
             self.error_parser,
+            self.handler,
         )
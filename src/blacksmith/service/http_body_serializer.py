@@ -1,10 +1,16 @@
 import abc
 import json
-from collections.abc import Callable, Mapping, Sequence
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from dataclasses import is_dataclass
+from datetime import date, time, timedelta
+from decimal import Decimal
+from functools import cache
 from typing import (
     TYPE_CHECKING,
     Any,
+    TypeVar,
     cast,
+    get_args,
 )
 from urllib.parse import parse_qs, urlencode
 
@@ -162,6 +168,154 @@ def serialize_part(
     }
 
 
+LEGACY_JSON_TYPES: tuple[type[Any], ...] = (
+    SecretStr,
+    SecretBytes,
+    Decimal,
+    timedelta,
+    float,
+    date,
+    time,
+)
+"""
+Types that pydantic does not serialize to json as the :class:`JSONEncoder`.
+
+Secrets are revealed by blacksmith, decimals and timedeltas are serialized to
+numbers by the :class:`JSONEncoder`, and to strings by pydantic.
+Infinite floats are serialized to ``Infinity`` by the :class:`JSONEncoder`,
+and to ``null`` by pydantic, UTC datetimes and times ends with ``+00:00``
+with the :class:`JSONEncoder`, and with ``Z`` with pydantic.
+"""
+
+
+def is_json_native(typ: Any) -> bool:
+    """
+    Return True if pydantic serialize the type to json as the :class:`JSONEncoder`.
+
+    Types that may hold any value, such as ``Any``, ``object`` or an unparametrized
+    ``dict``, are not native, and nested models neither, because they are dumped
+    with the ``exclude_none`` or ``exclude_unset`` flag of their parent field.
+    """
+    if typ is Any or typ is object or isinstance(typ, TypeVar):
+        return False
+    args = get_args(typ)
+    if args:
+        return all(is_json_native(arg) for arg in args)
+    if isinstance(typ, type):
+        if issubclass(typ, LEGACY_JSON_TYPES) or issubclass(typ, BaseModel):
+            return False
+        if is_dataclass(typ):
+            return False
+        # unparametrized containers hold any value
+        return not issubclass(typ, Iterable) or issubclass(typ, str | bytes)
+    return True
+
+
+class SerializationPlan:
+    """
+    Serialization plan of a :class:`blacksmith.Request` subclass.
+
+    The location of every fields is computed once per request class, then
+    request models are dumped in a single pass, and values are split by location.
+    """
+
+    fields_by_loc: dict[HttpLocation, dict[IntStr, Any]]
+    """Field names per location, the attachments are never dumped."""
+    keys: list[tuple[str, HttpLocation]]
+    """Serialized key (alias) and location of the dumped fields, in model order."""
+    names: set[str]
+    """Name of the dumped fields."""
+    body_names: set[str]
+    """Name of the fields of the body."""
+    json_body: bool
+    """True if the body can be serialized to json by pydantic."""
+
+    def __init__(self, request_cls: type[Request]) -> None:
+        self.fields_by_loc = {
+            HEADER: {},
+            PATH: {},
+            QUERY: {},
+            BODY: {},
+            ATTACHMENT: {},
+        }
+        self.keys = []
+        self.names = set()
+        self.body_names = set()
+        for name, field in request_cls.model_fields.items():
+            loc = get_location(field)
+            self.fields_by_loc[loc][name] = ...
+            if loc != ATTACHMENT:
+                self.keys.append((field.serialization_alias or name, loc))
+                self.names.add(name)
+            if loc == BODY:
+                self.body_names.add(name)
+        self.json_body = not self.fields_by_loc[ATTACHMENT] and all(
+            is_json_native(request_cls.model_fields[name].annotation)
+            for name in self.body_names
+        )
+
+    def split(
+        self, req: Request, with_body: bool = True
+    ) -> dict[HttpLocation, dict[str, Any]]:
+        """
+        Dump the request and split the values by location.
+
+        Fields explicitly set are always serialized, even if None,
+        other fields are serialized if they are not None.
+        """
+        names = self.names if with_body else self.names - self.body_names
+        fields_set = req.model_fields_set & names
+        fields_unset = names - fields_set
+        values: dict[str, Any] = {}
+        if fields_unset:
+            values.update(
+                req.model_dump(include=fields_unset, by_alias=True, exclude_none=True)
+            )
+        if fields_set:
+            values.update(
+                req.model_dump(include=fields_set, by_alias=True, exclude_unset=True)
+            )
+        parts: dict[HttpLocation, dict[str, Any]] = {
+            HEADER: {},
+            PATH: {},
+            QUERY: {},
+            BODY: {},
+        }
+        for key, loc in self.keys:
+            if key in values:
+                parts[loc][key] = values[key]
+        return parts
+
+    def dump_json_body(self, req: Request) -> bytes:
+        """
+        Serialize the body to json bytes using pydantic-core.
+
+        The fields are selected as :meth:`split` does, and serialized in a single
+        pass, in the order of the model.
+        """
+        fields_set = req.model_fields_set & self.body_names
+        include = fields_set | {
+            name
+            for name in self.body_names - fields_set
+            if getattr(req, name) is not None
+        }
+        return req.__pydantic_serializer__.to_json(req, include=include, by_alias=True)
+
+
+@cache
+def get_serialization_plan(request_cls: type[Request]) -> SerializationPlan:
+    """Get the serialization plan of a request class, computed once."""
+    return SerializationPlan(request_cls)
+
+
+def serialize_values(
+    values: dict[str, Any], loc: HttpLocation
+) -> dict[str, simpletypes]:
+    """Serialize dumped values of a request for the given location."""
+    dump_complex_to_json = loc not in (BODY, QUERY)
+    return {k: get_value(v, dump_complex_to_json) for k, v in values.items()}
+
+
 _SERIALIZERS: list[AbstractHttpBodySerializer] = [
     JsonRequestSerializer(),
     UrlencodedRequestSerializer(),
@@ -196,13 +350,28 @@ def serialize_request_body(
     """
     if not body and not content_type:
         return ""
-    content_type = content_type or "application/json"
+    return serialize_body(
+        req, serialize_part(req, body, BODY), content_type or "application/json"
+    )
+
+
+def get_body_serializer(
+    req: "Request", content_type: str
+) -> AbstractHttpBodySerializer:
+    """Get the registered serializer of the content type."""
     for serializer in _SERIALIZERS:
         if serializer.accept(content_type):
-            return serializer.serialize(serialize_part(req, body, "body"))
+            return serializer
     raise UnregisteredContentTypeException(content_type, req)
 
 
+def serialize_body(
+    req: "Request", body: dict[str, Any], content_type: str
+) -> RequestBody:
+    """Serialize the body values with the serializer of the content type."""
+    return get_body_serializer(req, content_type).serialize(body)
+
+
 def serialize_request_attachment(
     req: "Request",
     attachments: dict[str, Attachment],
@@ -237,53 +406,63 @@ def serialize_request(
     serialized by a registered serializer.
     """
     req = HTTPRequest(method=method, url_pattern=url_pattern)
-    fields_by_loc: dict[HttpLocation, dict[IntStr, Any]] = {
-        HEADER: {},
-        PATH: {},
-        QUERY: {},
-        BODY: {},
-        ATTACHMENT: {},
-    }
-    for name, field in get_fields(request_model).items():
-        loc = get_location(field)
-        fields_by_loc[loc].update({name: ...})
+    plan = get_serialization_plan(request_model.__class__)
+    parts = plan.split(request_model, with_body=not plan.json_body)
 
-    headers = serialize_part(request_model, fields_by_loc[HEADER], HEADER)
+    headers = serialize_values(parts[HEADER], HEADER)
     req.headers = {key: str(val) for key, val in headers.items()}
-    req.path = serialize_part(request_model, fields_by_loc[PATH], PATH)
+    req.path = serialize_values(parts[PATH], PATH)
     req.querystring = cast(
         dict[str, simpletypes | list[simpletypes]],
-        serialize_part(request_model, fields_by_loc[QUERY], QUERY),
+        serialize_values(parts[QUERY], QUERY),
     )
 
     req.attachments = serialize_request_attachment(
         request_model,
-        fields_by_loc[ATTACHMENT],
+        plan.fields_by_loc[ATTACHMENT],
     )
     if req.attachments:
-        req.body = serialize_part(request_model, fields_by_loc[BODY], ATTACHMENT)
+        req.body = serialize_values(parts[BODY], ATTACHMENT)
+        return req
+
+    content_type = cast(str | None, headers.get("Content-Type"))
+    if not plan.fields_by_loc[BODY] and not content_type:
+        req.body = ""
+        return req
+
+    serializer = get_body_serializer(request_model, content_type or "application/json")
+    if plan.json_body and type(serializer) is JsonRequestSerializer:
+        # the json is built by pydantic-core, without intermediate python objects
+        req.body = plan.dump_json_body(request_model)
     else:
-        req.body = serialize_request_body(
-            request_model,
-            fields_by_loc[BODY],
-            cast(str | None, headers.get("Content-Type")),
-        )
-
+        if plan.json_body:
+            parts = plan.split(request_model)
+        req.body = serializer.serialize(serialize_values(parts[BODY], BODY))
     return req
 
 
-def serialize_response(resp: HTTPRawResponse) -> HTTPResponse:
+def serialize_response(resp: HTTPRawResponse, lazy_json: bool = False) -> HTTPResponse:
     """
     Deserialize an http response to the http intermediate representation that will
     become the pydantic based response.
     Basically it parse json bytes a a python structure. But this function is here
     to supports serializations format depending on the content-type.
+
+    :param lazy_json: keep the raw content of json responses instead of parsing it,
+        the json is parsed on demand, and the response schema is validated from
+        the raw content.
     """
     json_: Json = ""
     if resp.status_code != 204:
         content_type = resp.headers.get("Content-Type") or "application/json"
         for serializer in _SERIALIZERS:
             if serializer.accept(content_type):
+                if lazy_json and type(serializer) is JsonRequestSerializer:
+                    return HTTPResponse(
+                        status_code=resp.status_code,
+                        headers=resp.headers,
+                        content=resp.content,
+                    )
                 try:
                     json_ = serializer.deserialize(resp.content, resp.encoding)
                 except Exception:
@@ -0,0 +1,76 @@
+"""
+Total timeout of the httpx transports.
+
+httpx has no total timeout, the asynchronous and the synchronous transports
+enforce it differently, so, as the concurrency primitives, both versions are
+written here, and their names differ by their prefix only.
+"""
+
+import time
+
+from httpx import Request as HttpxRequest
+from httpx import Response as HttpxResponse
+from httpx import TimeoutException
+
+from blacksmith.service.ports import AsyncClient, SyncClient
+from blacksmith.shared_utils.concurrency import AsyncWaitFor
+
+
+class TotalTimeout(TimeoutException):
+    """The response has not been read in the total timeout."""
+
+
+async def AsyncSendWithTotal(
+    client: AsyncClient, request: HttpxRequest, total: float
+) -> HttpxResponse:
+    """
+    Send the request, and read the response, in the total time.
+
+    The request is cancelled when the total time is exceeded, whatever its phase.
+    """
+
+    async def send() -> HttpxResponse:
+        return await client.send(request)
+
+    try:
+        return await AsyncWaitFor(send, total)
+    except TimeoutError:
+        raise TotalTimeout("Total timeout exceeded", request=request) from None
+
+
+def SyncSendWithTotal(
+    client: SyncClient, request: HttpxRequest, total: float
+) -> HttpxResponse:
+    """
+    Send the request, and read the response, in the total time.
+
+    The response is streamed, and the total time is checked between its chunks,
+    in order to stop reading the responses trickling in. The read timeout of
+    the body is shrunk to the remaining time when the body is read, httpcore
+    applies it to every chunk of the body.
+    The response is always closed, on the thread of the caller.
+    """
+    deadline = time.monotonic() + total
+    r = client.send(request, stream=True)
+    try:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise TotalTimeout("Total timeout exceeded", request=request)
+        timeouts = request.extensions.get("timeout")
+        if timeouts is not None:
+            timeouts["read"] = min(timeouts.get("read") or remaining, remaining)
+        chunks: list[bytes] = []
+        for chunk in r.iter_raw():
+            if time.monotonic() > deadline:
+                raise TotalTimeout("Total timeout exceeded", request=request)
+            chunks.append(chunk)
+    finally:
+        r.close()
+    # the raw content is decoded by the response, as if it has been read.
+    return HttpxResponse(
+        r.status_code,
+        headers=r.headers,
+        content=b"".join(chunks),
+        request=request,
+        extensions=r.extensions,
+    )
@@ -0,0 +1,601 @@
+"""
+Concurrency primitives.
+
+The asynchronous and the synchronous versions share the same signature,
+the synchronous code is generated from the asynchronous code, and their
+names differ by their prefix only.
+"""
+
+import asyncio
+import queue
+import threading
+import time
+from collections import deque
+from collections.abc import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Hashable,
+    Iterable,
+    Iterator,
+)
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from contextvars import copy_context
+from functools import partial
+from typing import Any, ClassVar, Generic, TypeVar, cast
+
+T = TypeVar("T")
+U = TypeVar("U")
+
+_END: Any = object()
+
+
+async def AsyncSleep(delay: float) -> None:
+    """Wait for the delay, in seconds."""
+    await asyncio.sleep(delay)
+
+
+def SyncSleep(delay: float) -> None:
+    """Wait for the delay, in seconds."""
+    time.sleep(delay)
+
+
+async def AsyncWaitFor(func: Callable[[], Awaitable[T]], timeout: float) -> T:
+    """
+    Call func, and cancel it if it is not complete after the timeout.
+
+    There is no synchronous version, a synchronous call can't be cancelled.
+
+    :raises TimeoutError: if the timeout is exceeded.
+    """
+    try:
+        return await asyncio.wait_for(func(), timeout)
+    except asyncio.TimeoutError:
+        raise TimeoutError() from None
+
+
+async def AsyncPrefetch(iterator: AsyncIterator[T], size: int) -> AsyncIterator[T]:
+    """
+    Consume the iterator in a task, ahead of the caller.
+
+    At most ``size`` items are consumed before the caller ask for them.
+    The task stops if the caller stop iterating.
+    """
+    slots = asyncio.Semaphore(size)
+    items: asyncio.Queue[tuple[Any, BaseException | None]] = asyncio.Queue()
+
+    async def produce() -> None:
+        try:
+            while True:
+                await slots.acquire()
+                try:
+                    item = await iterator.__anext__()
+                except StopAsyncIteration:
+                    break
+                items.put_nowait((item, None))
+        except Exception as exc:
+            items.put_nowait((_END, exc))
+        else:
+            items.put_nowait((_END, None))
+
+    task = asyncio.create_task(produce())
+    try:
+        while True:
+            item, exc = await items.get()
+            if exc:
+                raise exc
+            if item is _END:
+                break
+            slots.release()
+            yield item
+    finally:
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+
+def SyncPrefetch(iterator: Iterator[T], size: int) -> Iterator[T]:
+    """
+    Consume the iterator in a thread, ahead of the caller.
+
+    At most ``size`` items are consumed before the caller ask for them.
+    The thread stops if the caller stop iterating.
+    """
+    slots = threading.Semaphore(size)
+    items: queue.SimpleQueue[tuple[Any, BaseException | None]] = queue.SimpleQueue()
+    stopped = threading.Event()
+
+    def produce() -> None:
+        try:
+            while True:
+                slots.acquire()
+                if stopped.is_set():
+                    break
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    break
+                items.put((item, None))
+        except Exception as exc:
+            items.put((_END, exc))
+        else:
+            items.put((_END, None))
+
+    thread = threading.Thread(target=copy_context().run, args=(produce,), daemon=True)
+    thread.start()
+    try:
+        while True:
+            item, exc = items.get()
+            if exc:
+                raise exc
+            if item is _END:
+                break
+            slots.release()
+            yield item
+    finally:
+        stopped.set()
+        slots.release()
+
+
+async def AsyncMap(
+    func: Callable[[T], Awaitable[U]], items: Iterable[T], concurrency: int
+) -> AsyncIterator[U]:
+    """
+    Call func for every items concurrently, and yield the results in order.
+
+    At most ``concurrency`` calls are running at the same time.
+    Pending calls are cancelled if the caller stop iterating.
+    """
+    pending: deque[asyncio.Future[U]] = deque()
+    try:
+        for item in items:
+            pending.append(asyncio.ensure_future(func(item)))
+            if len(pending) >= concurrency:
+                yield await pending.popleft()
+        while pending:
+            yield await pending.popleft()
+    finally:
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+
+def SyncMap(
+    func: Callable[[T], U], items: Iterable[T], concurrency: int
+) -> Iterator[U]:
+    """
+    Call func for every items concurrently, and yield the results in order.
+
+    At most ``concurrency`` calls are running at the same time, in threads,
+    using a copy of the context of the caller.
+    Pending calls are cancelled if the caller stop iterating.
+    """
+    pending: deque[Future[U]] = deque()
+    with ThreadPoolExecutor(concurrency) as executor:
+        try:
+            for item in items:
+                pending.append(executor.submit(copy_context().run, func, item))
+                if len(pending) >= concurrency:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+class AsyncBatch(Generic[T, U]):
+    """
+    Coalesce the calls made in the same iteration of the event loop.
+
+    The keys of the calls are loaded together, using the ``load`` function,
+    which returns the values in the order of the keys.
+
+    :param load: load the values of the keys.
+    :param max_size: maximum number of keys loaded together.
+    """
+
+    coalesces: ClassVar[bool] = True
+    """True if the calls are coalesced."""
+
+    def __init__(
+        self, load: Callable[[list[T]], Awaitable[list[U]]], max_size: int
+    ) -> None:
+        self.load = load
+        self.max_size = max_size
+        self._keys: list[T] = []
+        self._futures: list[asyncio.Future[U]] = []
+        self._handle: asyncio.Handle | None = None
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    @property
+    def pending(self) -> int:
+        """Number of keys waiting for the next load."""
+        return len(self._keys)
+
+    async def __call__(self, key: T) -> U:
+        loop = asyncio.get_running_loop()
+        if self._handle is None:
+            self._handle = loop.call_soon(self._flush)
+        future: asyncio.Future[U] = loop.create_future()
+        self._keys.append(key)
+        self._futures.append(future)
+        if len(self._keys) >= self.max_size:
+            self._flush()
+        return await future
+
+    def _flush(self) -> None:
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        keys, futures = self._keys, self._futures
+        self._keys, self._futures = [], []
+        task = asyncio.ensure_future(self._load(keys, futures))
+        # keep a reference of the task until it is done
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _load(self, keys: list[T], futures: list[asyncio.Future[U]]) -> None:
+        try:
+            values = await self.load(keys)
+        except Exception as exc:
+            for future in futures:
+                if not future.done():
+                    future.set_exception(exc)
+        else:
+            for future, value in zip(futures, values, strict=True):
+                if not future.done():
+                    future.set_result(value)
+
+
+class SyncBatch(Generic[T, U]):
+    """
+    Load the keys one by one, the synchronous calls are never coalesced.
+
+    :param load: load the values of the keys.
+    :param max_size: unused, for compatibility with the asynchronous version.
+    """
+
+    coalesces: ClassVar[bool] = False
+    """True if the calls are coalesced."""
+
+    def __init__(self, load: Callable[[list[T]], list[U]], max_size: int) -> None:
+        self.load = load
+        self.max_size = max_size
+
+    @property
+    def pending(self) -> int:
+        """Number of keys waiting for the next load, always 0."""
+        return 0
+
+    def __call__(self, key: T) -> U:
+        return self.load([key])[0]
+
+
+class AsyncSingleFlight(Generic[U]):
+    """
+    Share the result of a call between the concurrent calls of the same key.
+
+    The first call of a key, the leader, runs the function, the calls made
+    while it is running, the followers, wait for its result.
+    """
+
+    def __init__(self) -> None:
+        self._flights: dict[Hashable, asyncio.Future[U]] = {}
+
+    async def __call__(
+        self,
+        key: Hashable,
+        func: Callable[[], Awaitable[U]],
+        timeout: float | None = None,
+    ) -> tuple[U, bool]:
+        """
+        Run the function, or wait for the result of the running one.
+
+        :param timeout: maximum time a follower waits for the result of the
+            leader, in seconds, unbounded by default.
+        :raises TimeoutError: if the follower timeout is exceeded.
+        :return: the result, and True if it has been shared by a leader.
+        """
+        flight = self._flights.get(key)
+        if flight is not None:
+            try:
+                if timeout is None:
+                    return await asyncio.shield(flight), True
+                # the leader keeps running for the other followers.
+                return await AsyncWaitFor(
+                    partial(asyncio.shield, flight), timeout
+                ), True
+            except asyncio.CancelledError:
+                if not flight.cancelled():
+                    raise
+                # the leader has been cancelled, not the follower.
+                return await self(key, func, timeout)
+
+        flight = asyncio.get_running_loop().create_future()
+        self._flights[key] = flight
+        try:
+            result = await func()
+        except asyncio.CancelledError:
+            flight.cancel()
+            raise
+        except BaseException as exc:
+            flight.set_exception(exc)
+            # followers may not exist, the exception is marked as retrieved.
+            flight.exception()
+            raise
+        else:
+            flight.set_result(result)
+            return result, False
+        finally:
+            del self._flights[key]
+
+
+class SyncSingleFlight(Generic[U]):
+    """
+    Share the result of a call between the concurrent calls of the same key.
+
+    The first call of a key, the leader, runs the function, the calls made
+    while it is running, in other threads, wait for its result.
+    """
+
+    def __init__(self) -> None:
+        self._flights: dict[Hashable, Future[U]] = {}
+        self._lock = threading.Lock()
+
+    def __call__(
+        self,
+        key: Hashable,
+        func: Callable[[], U],
+        timeout: float | None = None,
+    ) -> tuple[U, bool]:
+        """
+        Run the function, or wait for the result of the running one.
+
+        :param timeout: maximum time a follower waits for the result of the
+            leader, in seconds, unbounded by default.
+        :raises TimeoutError: if the follower timeout is exceeded.
+        :return: the result, and True if it has been shared by a leader.
+        """
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight is None:
+                flight = self._flights[key] = Future()
+                leader = True
+            else:
+                leader = False
+        if not leader:
+            try:
+                return flight.result(timeout), True
+            except FuturesTimeoutError:
+                raise TimeoutError() from None
+
+        try:
+            result = func()
+        except BaseException as exc:
+            flight.set_exception(exc)
+            raise
+        else:
+            flight.set_result(result)
+            return result, False
+        finally:
+            with self._lock:
+                del self._flights[key]
+
+
+async def AsyncHedge(
+    func: Callable[[], Awaitable[U]], delay: float, can_hedge: Callable[[], bool]
+) -> tuple[U, bool]:
+    """
+    Call func, and call it again if it is not complete after the delay.
+
+    The first successful call wins, and the other one is cancelled.
+
+    :param can_hedge: called once the delay is expired, to decide if func
+        is called again.
+    :return: the result, and True if it has been returned by the second call.
+    """
+    first = asyncio.ensure_future(func())
+    tasks = [first]
+    try:
+        done, _ = await asyncio.wait(tasks, timeout=delay)
+        if done or not can_hedge():
+            return await first, False
+
+        second = asyncio.ensure_future(func())
+        tasks.append(second)
+        pending = set(tasks)
+        error: BaseException | None = None
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in tasks:
+                if task not in done:
+                    continue
+                exc = task.exception()
+                if exc is None:
+                    return task.result(), task is second
+                if error is None or task is first:
+                    error = exc
+        raise cast(BaseException, error)
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def SyncHedge(
+    func: Callable[[], U], delay: float, can_hedge: Callable[[], bool]
+) -> tuple[U, bool]:
+    """
+    Call func, and call it again if it is not complete after the delay.
+
+    The calls are made in threads, the first successful call wins, the other
+    one can't be cancelled and its result is ignored.
+
+    :param can_hedge: called once the delay is expired, to decide if func
+        is called again.
+    :return: the result, and True if it has been returned by the second call.
+    """
+    executor = ThreadPoolExecutor(2)
+    try:
+        first = executor.submit(copy_context().run, func)
+        done, _ = wait([first], timeout=delay)
+        if done or not can_hedge():
+            return first.result(), False
+
+        second = executor.submit(copy_context().run, func)
+        futures = [first, second]
+        pending = set(futures)
+        error: BaseException | None = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in futures:
+                if future not in done:
+                    continue
+                exc = future.exception()
+                if exc is None:
+                    return future.result(), future is second
+                if error is None or future is first:
+                    error = exc
+        raise cast(BaseException, error)
+    finally:
+        executor.shutdown(wait=False)
+
+
+class AsyncLimiter:
+    """
+    Bound the number of concurrent calls, the excess calls wait in a queue.
+
+    The limit can be changed while calls are running.
+
+    :param limit: maximum number of concurrent calls.
+    :param max_queue: maximum number of calls waiting for a slot.
+    :param queue_timeout: maximum time waiting for a slot, in seconds,
+        None to wait forever.
+    """
+
+    def __init__(
+        self, limit: int, max_queue: int = 0, queue_timeout: float | None = None
+    ) -> None:
+        self._limit = limit
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.inflight = 0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+
+    @property
+    def limit(self) -> int:
+        return self._limit
+
+    @limit.setter
+    def limit(self, value: int) -> None:
+        self._limit = value
+        self._wake()
+
+    @property
+    def queued(self) -> int:
+        """Number of calls waiting for a slot."""
+        return len(self._waiters)
+
+    async def acquire(self) -> bool:
+        """Acquire a slot, return False if the queue is full or timed out."""
+        if self.inflight < self._limit and not self._waiters:
+            self.inflight += 1
+            return True
+        if len(self._waiters) >= self.max_queue:
+            return False
+
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter), self.queue_timeout)
+        except (asyncio.TimeoutError, asyncio.CancelledError) as exc:
+            if waiter.done():
+                # the slot has been given while the call was leaving the queue.
+                self.release()
+            else:
+                self._waiters.remove(waiter)
+                waiter.cancel()
+            if isinstance(exc, asyncio.CancelledError):
+                raise
+            return False
+        return True
+
+    def release(self) -> None:
+        """Release a slot acquired."""
+        self.inflight -= 1
+        self._wake()
+
+    def _wake(self) -> None:
+        while self._waiters and self.inflight < self._limit:
+            self.inflight += 1
+            self._waiters.popleft().set_result(None)
+
+
+class SyncLimiter:
+    """
+    Bound the number of concurrent calls, the excess calls wait in a queue.
+
+    The limit can be changed while calls are running.
+
+    :param limit: maximum number of concurrent calls.
+    :param max_queue: maximum number of calls waiting for a slot.
+    :param queue_timeout: maximum time waiting for a slot, in seconds,
+        None to wait forever.
+    """
+
+    def __init__(
+        self, limit: int, max_queue: int = 0, queue_timeout: float | None = None
+    ) -> None:
+        self._limit = limit
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.inflight = 0
+        self._queued = 0
+        self._cond = threading.Condition()
+
+    @property
+    def limit(self) -> int:
+        return self._limit
+
+    @limit.setter
+    def limit(self, value: int) -> None:
+        with self._cond:
+            self._limit = value
+            self._cond.notify_all()
+
+    @property
+    def queued(self) -> int:
+        """Number of calls waiting for a slot."""
+        return self._queued
+
+    def acquire(self) -> bool:
+        """Acquire a slot, return False if the queue is full or timed out."""
+        with self._cond:
+            if self.inflight < self._limit and not self._queued:
+                self.inflight += 1
+                return True
+            if self._queued >= self.max_queue:
+                return False
+
+            self._queued += 1
+            try:
+                acquired = self._cond.wait_for(
+                    lambda: self.inflight < self._limit, self.queue_timeout
+                )
+            finally:
+                self._queued -= 1
+            if acquired:
+                self.inflight += 1
+            return acquired
+
+    def release(self) -> None:
+        """Release a slot acquired."""
+        with self._cond:
+            self.inflight -= 1
+            self._cond.notify()
@@ -1,11 +1,15 @@
-from collections.abc import Mapping
+from collections.abc import Mapping, Sequence
+from functools import cache
 from typing import (
+    Annotated,
     Any,
+    Literal,
     Union,
+    get_args,
     get_origin,
 )
 
-from pydantic import ValidationError
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
 
 try:
     from types import UnionType  # type: ignore
@@ -28,19 +32,111 @@ def is_union(typ: type[Any]) -> bool:
 def is_instance_with_union(val: Any, typ: type[Any]) -> bool:
     # isinstance does not support union type in old interpreter,
     if is_union(typ):
-        r = [isinstance(val, t) for t in typ.__args__]  # type: ignore
-        return any(r)
+        return isinstance(val, get_args(typ))
     return isinstance(val, typ)
 
 
+def get_discriminator(members: tuple[type[Any], ...]) -> str | None:
+    """
+    Return the name of the field that discriminate the models of a union.
+
+    The discriminator is a required field declared in every models with a literal
+    type, with distinct values, if any. A field with a default can be missing from
+    the payload, and can't discriminate it.
+    """
+    if not all(isinstance(m, type) and issubclass(m, BaseModel) for m in members):
+        return None
+    for name in members[0].model_fields:
+        tags: set[Any] = set()
+        for member in members:
+            field = member.model_fields.get(name)
+            if field is None or not field.is_required():
+                break
+            if get_origin(field.annotation) is not Literal:
+                break
+            values = set(get_args(field.annotation))
+            if tags & values:
+                break
+            tags |= values
+        else:
+            return name
+    return None
+
+
+def get_union_annotation(typ: Any) -> Any:
+    """
+    Annotate the union in order to validate it in one pass.
+
+    Models of the union are discriminated if possible, otherwise, the first
+    model that validate is used, as the members were tried in order.
+    """
+    discriminator = get_discriminator(get_args(typ))
+    if discriminator:
+        return Annotated[typ, Field(discriminator=discriminator)]
+    return Annotated[typ, Field(union_mode="left_to_right")]
+
+
+@cache
+def get_union_adapter(typ: Any) -> TypeAdapter[Any]:
+    """Compile the union to a type adapter."""
+    return TypeAdapter(get_union_annotation(typ))
+
+
+@cache
+def get_list_adapter(typ: Any) -> TypeAdapter[list[Any]]:
+    """Compile a list of model, or union of models, to a type adapter."""
+    if is_union(typ):
+        typ = get_union_annotation(typ)
+    return TypeAdapter(list[typ])  # type: ignore
+
+
+def _build_pydantic_union_members(typ: Any, params: Mapping[str, Any]) -> Any:
+    # validate the members one by one, in order to raise the same
+    # validation error than the last member of the union.
+    err: Exception | None = None
+    for t in typ.__args__:  # type: ignore
+        try:
+            return build_pydantic_union(t, params)  # type: ignore
+        except ValidationError as e:
+            err = e
+    if err:
+        raise err
+
+
 def build_pydantic_union(typ: Any, params: Mapping[str, Any]) -> Any:
     if is_union(typ):
-        err: Exception | None = None
-        for t in typ.__args__:  # type: ignore
-            try:
-                return build_pydantic_union(t, params)  # type: ignore
-            except ValidationError as e:
-                err = e
-        if err:
-            raise err
+        try:
+            return get_union_adapter(typ).validate_python(params)
+        except ValidationError:
+            return _build_pydantic_union_members(typ, params)
     return typ.model_validate(params)
+
+
+def build_pydantic_union_from_json(typ: Any, content: bytes) -> Any:
+    if is_union(typ):
+        try:
+            return get_union_adapter(typ).validate_json(content)
+        except ValidationError:
+            # avoid circular import
+            from blacksmith.domain.model.http import parse_json_body
+
+            return _build_pydantic_union_members(typ, parse_json_body(content))
+    return typ.model_validate_json(content)
+
+
+def get_field_aliases(typ: Any) -> set[str]:
+    """
+    Return the names of the fields, or their alias, accepted by every models
+    of the union.
+    """
+    members = get_args(typ) if is_union(typ) else (typ,)
+    return set.intersection(
+        *(
+            {field.alias or name for name, field in member.model_fields.items()}
+            for member in members
+        )
+    )
+
+
+def build_pydantic_list(typ: Any, params: Sequence[Any]) -> list[Any]:
+    return get_list_adapter(typ).validate_python(params)
@@ -1,4 +1,5 @@
-from collections.abc import Iterable
+import asyncio
+from collections.abc import AsyncIterator, Iterable
 from enum import Enum
 from multiprocessing import Process
 from typing import Annotated
@@ -9,7 +10,7 @@ import uvicorn
 from fastapi import FastAPI, File, Form, HTTPException, Request, UploadFile
 from pydantic import BaseModel
 from pydantic.fields import Field
-from starlette.responses import Response
+from starlette.responses import Response, StreamingResponse
 
 app = FastAPI()
 
@@ -108,6 +109,16 @@ async def upload_complex(
     }
 
 
+@app.get("/trickle")
+async def trickle():
+    async def content() -> AsyncIterator[bytes]:
+        for _ in range(20):
+            await asyncio.sleep(0.1)
+            yield b" "
+
+    return StreamingResponse(content(), media_type="application/json")
+
+
 def run_server(port: int):
     uvicorn.run(app, port=port)
 
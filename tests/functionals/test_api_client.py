@@ -1,3 +1,5 @@
+import threading
+import time
 from enum import Enum
 from typing import Any
 
@@ -20,7 +22,10 @@ from blacksmith import (
     ResponseBox,
     register,
 )
-from blacksmith.domain.exceptions import NoContractException
+from blacksmith.domain.exceptions import HTTPTimeoutError, NoContractException
+from blacksmith.domain.model import HTTPRequest, HTTPTimeout
+from blacksmith.service._async.adapters.httpx import AsyncHttpxTransport
+from blacksmith.service._sync.adapters.httpx import SyncHttpxTransport
 
 
 class SizeEnum(str, Enum):
@@ -230,6 +235,7 @@ async def test_crud(dummy_api_endpoint: str):
         str(no_contract_exc.value)
         == "Unregistered route 'PUT' in resource 'item' in client 'api'"
     )
+    await cli.aclose()
 
 
 async def test_attachment(dummy_api_endpoint: str):
@@ -245,6 +251,7 @@ async def test_attachment(dummy_api_endpoint: str):
     assert resp.unwrap() == UploadedFile(
         foobar="FooBar", filename="bar.xml", content="<ok/>"
     )
+    await cli.aclose()
 
 
 async def test_attachment_json(dummy_api_endpoint: str):
@@ -261,3 +268,36 @@ async def test_attachment_json(dummy_api_endpoint: str):
     assert resp.unwrap() == UploadedFile(
         foobar='{"name": "foo", "value": 42}', filename="bar.xml", content="<ok/>"
     )
+    await cli.aclose()
+
+
+def test_sync_total_timeout_trickle(dummy_api_endpoint: str):
+    transport = SyncHttpxTransport()
+    threads = threading.active_count()
+    for _ in range(5):
+        start = time.perf_counter()
+        with pytest.raises(HTTPTimeoutError):
+            transport(
+                HTTPRequest("GET", f"{dummy_api_endpoint}/trickle"),
+                "api",
+                "/trickle",
+                HTTPTimeout(read=1, total=0.3),
+            )
+        assert time.perf_counter() - start < 0.6
+    # the responses are read and closed by the caller, no thread is left behind
+    assert threading.active_count() == threads
+    transport.close()
+
+
+async def test_async_total_timeout_trickle(dummy_api_endpoint: str):
+    transport = AsyncHttpxTransport()
+    start = time.perf_counter()
+    with pytest.raises(HTTPTimeoutError):
+        await transport(
+            HTTPRequest("GET", f"{dummy_api_endpoint}/trickle"),
+            "api",
+            "/trickle",
+            HTTPTimeout(read=1, total=0.3),
+        )
+    assert time.perf_counter() - start < 0.6
+    await transport.aclose()
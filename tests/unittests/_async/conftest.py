@@ -1,5 +1,6 @@
 import json
 import logging
+import time
 from collections.abc import Mapping, Sequence
 from datetime import timedelta
 from typing import (
@@ -12,11 +13,16 @@ import pytest
 
 from blacksmith.domain.exceptions import HTTPError
 from blacksmith.domain.model import HTTPRequest, HTTPResponse, HTTPTimeout
+from blacksmith.domain.model.middleware.rate_limit import RateLimit
 from blacksmith.domain.model.middleware.zipkin import AbstractTraceContext
 from blacksmith.middleware._async import AsyncMiddleware
 from blacksmith.middleware._async.auth import AsyncHTTPAuthorizationMiddleware
 from blacksmith.middleware._async.base import AsyncHTTPAddHeadersMiddleware
 from blacksmith.middleware._async.http_cache import AsyncAbstractCache
+from blacksmith.middleware._async.rate_limit import (
+    RESERVE_SCRIPT,
+    AsyncAbstractRateLimitCache,
+)
 from blacksmith.sd._async.adapters.consul import AsyncConsulDiscovery, _registry
 from blacksmith.sd._async.adapters.nomad import AsyncNomadDiscovery
 from blacksmith.sd._async.adapters.router import AsyncRouterDiscovery
@@ -257,6 +263,32 @@ def fake_http_middleware_cache_with_data(
     return AsyncFakeHttpMiddlewareCache(params["initial_cache"])
 
 
+class AsyncFakeRateLimitCache(AsyncAbstractRateLimitCache):
+    """Run the reservation script, in python, with the clock of the test."""
+
+    def __init__(self) -> None:
+        self.val: dict[str, float] = {}
+        self.ttl: dict[str, float] = {}
+
+    async def eval(self, script: str, numkeys: int, *keys_and_args: Any) -> Any:
+        assert script == RESERVE_SCRIPT
+        name, rate, burst, max_delay = keys_and_args
+        now = time.time()
+        if self.ttl.get(name, now) < now:
+            del self.val[name]
+        reservation = RateLimit(rate, burst).reserve(self.val.get(name), now, max_delay)
+        if reservation is None:
+            return None
+        delay, self.val[name] = reservation
+        self.ttl[name] = self.val[name] + 1.0
+        return str(delay).encode()
+
+
+@pytest.fixture
+def fake_rate_limit_cache() -> AsyncFakeRateLimitCache:
+    return AsyncFakeRateLimitCache()
+
+
 class Trace(AbstractTraceContext):
     name: str
     kind: str
@@ -1,13 +1,20 @@
+import time
+from collections.abc import AsyncIterator
 from typing import Any
 from unittest import mock
 
 import pytest
-from httpx import Headers, Response
+from httpx import Headers, MockTransport, Response
+from httpx import ReadTimeout as HttpxReadTimeout
+from httpx import Request as HttpxRequest
+from httpx import Timeout as HttpxTimeout
 from httpx import TimeoutException as HttpxTimeoutException
 
 from blacksmith.domain.exceptions import HTTPError
-from blacksmith.domain.model import HTTPRequest, HTTPTimeout
+from blacksmith.domain.model import HTTPPoolLimits, HTTPRequest, HTTPTimeout
 from blacksmith.service._async.adapters.httpx import AsyncHttpxTransport, build_headers
+from blacksmith.service.ports import AsyncClient
+from tests.unittests.time import AsyncSleep
 
 headers = Headers()
 headers["Content-Type"] = "application/json"
@@ -136,3 +143,174 @@ async def test_query_http_not_json(patch: Any) -> None:
     assert str(ctx.value) == "cli - POST / - 500 Internal Server Error"
     assert ctx.value.status_code == 500
     assert ctx.value.json == {"error": "internal server error"}
+
+
+@mock.patch(
+    "httpx._client.AsyncClient.request",
+    return_value=dummy_response,
+)
+async def test_query_http_lazy_json(patch: Any) -> None:
+    transport = AsyncHttpxTransport(lazy_json=True)
+    resp = await transport(
+        HTTPRequest(method="GET", url_pattern="/"), "cli", "/", HTTPTimeout()
+    )
+    assert resp.status_code == 200
+    assert resp.content == b'{"name":"Alice"}'
+    assert resp.json == dummy_json
+
+
+@mock.patch(
+    "httpx._client.AsyncClient.request",
+    return_value=dummy_response,
+)
+async def test_query_http_reuse_client(patch: Any) -> None:
+    transport = AsyncHttpxTransport()
+    await transport(
+        HTTPRequest(method="GET", url_pattern="/"), "cli", "/", HTTPTimeout()
+    )
+    client = transport.client
+    await transport(
+        HTTPRequest(method="GET", url_pattern="/"), "cli", "/", HTTPTimeout()
+    )
+    assert transport.client is client
+    assert patch.call_count == 2
+
+
+async def test_transport_aclose() -> None:
+    transport = AsyncHttpxTransport()
+    client = transport.client
+    await transport.aclose()
+    assert client.is_closed
+    assert transport.client is not client
+    await transport.aclose()
+
+
+async def test_transport_limits() -> None:
+    transport = AsyncHttpxTransport(
+        limits=HTTPPoolLimits(
+            max_connections=10, max_keepalive_connections=5, keepalive_expiry=2.0
+        )
+    )
+    pool = transport.client._transport._pool  # type: ignore
+    assert pool._max_connections == 10  # type: ignore
+    assert pool._max_keepalive_connections == 5  # type: ignore
+    assert pool._keepalive_expiry == 2.0  # type: ignore
+    await transport.aclose()
+
+
+async def test_transport_pools() -> None:
+    transport = AsyncHttpxTransport(pools={"api": HTTPPoolLimits(max_connections=2)})
+    assert transport.get_client("other") is transport.client
+    client = transport.get_client("api")
+    assert client is not transport.client
+    assert transport.get_client("api") is client
+    pool = client._transport._pool  # type: ignore
+    assert pool._max_connections == 2  # type: ignore
+
+    shared_client = transport.client
+    await transport.aclose()
+    assert client.is_closed
+    assert shared_client.is_closed
+    assert transport.get_client("api") is not client
+    await transport.aclose()
+
+
+@mock.patch(
+    "httpx._client.AsyncClient.request",
+    return_value=dummy_response,
+)
+async def test_query_http_pools(patch: Any) -> None:
+    transport = AsyncHttpxTransport(pools={"api": HTTPPoolLimits()})
+    await transport(
+        HTTPRequest(method="GET", url_pattern="/"), "api", "/", HTTPTimeout()
+    )
+    assert transport._client is None
+    assert list(transport._clients) == ["api"]
+    await transport.aclose()
+
+
+@mock.patch(
+    "httpx._client.AsyncClient.request",
+    return_value=dummy_response,
+)
+async def test_query_http_timeouts(patch: Any) -> None:
+    transport = AsyncHttpxTransport()
+    await transport(
+        HTTPRequest(method="GET", url_pattern="/"),
+        "cli",
+        "/",
+        HTTPTimeout(10, 5, write=2, pool=1),
+    )
+    assert patch.call_args.kwargs["timeout"] == HttpxTimeout(
+        10, connect=5, write=2, pool=1
+    )
+
+
+async def trickle(request: HttpxRequest, *delays: float) -> AsyncIterator[bytes]:
+    # the read timeout is applied to every chunk, as a socket does
+    read = request.extensions["timeout"]["read"]
+    for delay, chunk in zip(delays, (b'{"name": ', b'"Alice"}'), strict=True):
+        if read is not None and delay > read:
+            await AsyncSleep(read)
+            raise HttpxReadTimeout("ReadTimeout", request=request)
+        await AsyncSleep(delay)
+        yield chunk
+
+
+def mock_client(*delays: float) -> AsyncClient:
+    def handler(request: HttpxRequest) -> Response:
+        return Response(
+            200,
+            headers={"Content-Type": "application/json"},
+            content=trickle(request, *delays),
+        )
+
+    return AsyncClient(transport=MockTransport(handler))
+
+
+async def test_query_http_total_timeout() -> None:
+    transport = AsyncHttpxTransport()
+    transport._client = mock_client(0, 0)
+    resp = await transport(
+        HTTPRequest(method="GET", url_pattern="http://dummy/"),
+        "cli",
+        "/",
+        HTTPTimeout(total=1),
+    )
+    assert resp.status_code == 200
+    assert resp.json == dummy_json
+    await transport.aclose()
+
+
+async def test_query_http_total_timeout_exceeded() -> None:
+    transport = AsyncHttpxTransport()
+    transport._client = mock_client(0.05, 0.05)
+    with pytest.raises(TimeoutError) as ctx:
+        await transport(
+            HTTPRequest(method="GET", url_pattern="http://dummy/slow"),
+            "cli",
+            "/slow",
+            HTTPTimeout(total=0.02),
+        )
+    # the read timeout of the body is shrunk to the total timeout in sync mode
+    assert str(ctx.value) in (
+        "cli - GET /slow - TotalTimeout while calling GET http://dummy/slow",
+        "cli - GET /slow - ReadTimeout while calling GET http://dummy/slow",
+    )
+    await transport.aclose()
+
+
+async def test_query_http_total_timeout_in_chunk() -> None:
+    transport = AsyncHttpxTransport()
+    # the second chunk straddles the total timeout, and not the read timeout
+    transport._client = mock_client(0, 0.5)
+    start = time.perf_counter()
+    with pytest.raises(TimeoutError):
+        await transport(
+            HTTPRequest(method="GET", url_pattern="http://dummy/slow"),
+            "cli",
+            "/slow",
+            HTTPTimeout(read=2, total=0.1),
+        )
+    assert time.perf_counter() - start < 0.4
+    await transport.aclose()
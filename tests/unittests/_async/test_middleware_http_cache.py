@@ -1,9 +1,15 @@
+from dataclasses import replace
 from typing import Any
 
 import pytest
 from prometheus_client import CollectorRegistry  # type: ignore
 
-from blacksmith.domain.model.http import HTTPRequest, HTTPResponse, HTTPTimeout
+from blacksmith.domain.model.http import (
+    HTTPRequest,
+    HTTPResponse,
+    HTTPTimeout,
+    RouteOptions,
+)
 from blacksmith.domain.model.middleware.http_cache import CacheControlPolicy
 from blacksmith.domain.model.middleware.prometheus import PrometheusMetrics
 from blacksmith.domain.typing import AsyncMiddleware
@@ -237,6 +243,22 @@ async def test_cache_middleware_policy_handle(
     )
 
 
+async def test_cache_middleware_route_options(
+    cachable_response: AsyncMiddleware,
+    fake_http_middleware_cache: AsyncAbstractCache,
+    dummy_http_request: HTTPRequest,
+    dummy_timeout: HTTPTimeout,
+) -> None:
+    caching = AsyncHTTPCacheMiddleware(fake_http_middleware_cache)
+    next = caching(cachable_response)
+    req = replace(dummy_http_request, options=RouteOptions(cache=False))
+    resp = await next(req, "dummy", "/dummies/{name}", dummy_timeout)
+    assert fake_http_middleware_cache.val == {}  # type: ignore
+    assert resp == HTTPResponse(
+        200, {"cache-control": "max-age=42, public"}, json="Cache Me"
+    )
+
+
 async def test_cache_middleware_metrics_helpers(
     fake_http_middleware_cache: AsyncAbstractCache,
     prometheus_registry: CollectorRegistry,
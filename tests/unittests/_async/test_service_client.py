@@ -12,10 +12,12 @@ from blacksmith.domain.exceptions import (
     NoContractException,
     UnregisteredResourceException,
     UnregisteredRouteException,
+    UnregisteredServiceException,
     WrongRequestTypeException,
 )
 from blacksmith.domain.model import (
     CollectionParser,
+    HTTPPoolLimits,
     HTTPRequest,
     HTTPResponse,
     HTTPTimeout,
@@ -26,16 +28,18 @@ from blacksmith.domain.registry import ApiRoutes
 from blacksmith.middleware._async.auth import AsyncHTTPAuthorizationMiddleware
 from blacksmith.middleware._async.base import AsyncHTTPMiddleware
 from blacksmith.middleware._async.prometheus import AsyncPrometheusMiddleware
+from blacksmith.sd._async.adapters.static import AsyncStaticDiscovery
 from blacksmith.sd._async.base import AsyncAbstractServiceDiscovery
 from blacksmith.service._async.base import AsyncAbstractTransport
 from blacksmith.service._async.client import AsyncClient, AsyncClientFactory
-from blacksmith.typing import ClientName, Path, Proxies
+from blacksmith.typing import ClientName, Path, Proxies, ServiceName, Url, Version
 from tests.unittests.dummy_registry import (
     GetParam,
     GetResponse,
     PostParam,
     dummy_registry,
 )
+from tests.unittests.time import AsyncSleep
 
 
 class MyErrorFormat(BaseModel):
@@ -138,6 +142,31 @@ async def test_client(static_sd: AsyncAbstractServiceDiscovery):
     )
 
 
+async def test_client_route_proxy_cache(
+    static_sd: AsyncAbstractServiceDiscovery, dummy_middleware: AsyncHTTPMiddleware
+):
+    tp = FakeTimeoutTransport()
+    client_factory: AsyncClientFactory[Any] = AsyncClientFactory(
+        static_sd, tp, registry=dummy_registry
+    )
+    cli = await client_factory("api")
+    proxy = cli.dummies
+    assert cli.dummies is proxy
+    assert "dummies" in cli.__dict__
+
+    cli.add_middleware(dummy_middleware)
+    assert cli.dummies is not proxy
+    assert cli.dummies.middlewares == [dummy_middleware]
+    proxy = cli.dummies
+
+    cli.transport = FakeTimeoutTransport()
+    assert cli.dummies is not proxy
+    assert cli.dummies.transport is cli.transport
+
+    with pytest.raises(UnregisteredResourceException):
+        cli.daemon  # noqa: B018
+
+
 async def test_client_timeout(static_sd: AsyncAbstractServiceDiscovery):
     routes = ApiRoutes(
         "/dummies/{name}", {"GET": (GetParam, GetResponse)}, None, None, None
@@ -182,6 +211,35 @@ def test_client_factory_configure_transport(static_sd: AsyncAbstractServiceDisco
     assert client_factory.transport.verify_certificate is False
 
 
+def test_client_factory_configure_limits(static_sd: AsyncAbstractServiceDiscovery):
+    limits = HTTPPoolLimits(max_connections=10)
+    client_factory: AsyncClientFactory[Any] = AsyncClientFactory(
+        static_sd, limits=limits
+    )
+    assert client_factory.transport.limits == limits  # type: ignore
+
+
+def test_client_factory_configure_pools(static_sd: AsyncAbstractServiceDiscovery):
+    pools = {"api": HTTPPoolLimits(max_connections=10)}
+    client_factory: AsyncClientFactory[Any] = AsyncClientFactory(static_sd, pools=pools)
+    assert client_factory.transport.pools == pools  # type: ignore
+
+
+async def test_client_factory_aclose(static_sd: AsyncAbstractServiceDiscovery):
+    class ClosableTransport(FakeTimeoutTransport):
+        closed = 0
+
+        async def aclose(self) -> None:
+            self.closed += 1
+
+    tp = ClosableTransport()
+    client_factory: AsyncClientFactory[Any] = AsyncClientFactory(
+        static_sd, tp, registry=dummy_registry
+    )
+    await client_factory.aclose()
+    assert tp.closed == 1
+
+
 def test_client_factory_configure_proxies(static_sd: AsyncAbstractServiceDiscovery):
     proxies: Proxies = {
         "http://": "http://localhost:8030",
@@ -252,6 +310,95 @@ async def test_client_add_middleware(
     assert client_factory.middlewares == [prom]
 
 
+async def test_client_factory_handler_cache(
+    static_sd: AsyncAbstractServiceDiscovery, dummy_middleware: AsyncHTTPMiddleware
+):
+    tp = FakeTimeoutTransport()
+    auth = AsyncHTTPAuthorizationMiddleware("Bearer", "abc")
+    client_factory: AsyncClientFactory[Any] = AsyncClientFactory(
+        static_sd, tp, registry=dummy_registry
+    ).add_middleware(auth)
+
+    handler = client_factory.handler
+    assert client_factory.handler is handler
+
+    cli = await client_factory("api")
+    cli2 = await client_factory("api")
+    assert cli.handler is handler
+    assert cli2.handler is handler
+    assert cli.dummies.handler is handler
+
+    client_factory.add_middleware(dummy_middleware)
+    assert client_factory.handler is not handler
+    assert cli.handler is handler
+
+    cli.add_middleware(dummy_middleware)
+    assert cli.handler is not handler
+    assert cli.dummies.handler is cli.handler
+    assert cli2.handler is handler
+
+
+class CountingDiscovery(AsyncStaticDiscovery):
+    def __init__(self) -> None:
+        super().__init__({("dummy", "v1"): "https://dummy.v1/"})
+        self.calls = 0
+
+    async def get_endpoint(self, service: ServiceName, version: Version) -> Url:
+        self.calls += 1
+        return await super().get_endpoint(service, version)
+
+
+async def test_client_factory_no_endpoint_cache() -> None:
+    sd = CountingDiscovery()
+    client_factory: AsyncClientFactory[Any] = AsyncClientFactory(
+        sd, FakeTimeoutTransport(), registry=dummy_registry
+    )
+    await client_factory("api")
+    await client_factory("api")
+    assert sd.calls == 2
+
+
+async def test_client_factory_endpoint_cache(metrics: PrometheusMetrics) -> None:
+    sd = CountingDiscovery()
+    client_factory: AsyncClientFactory[Any] = AsyncClientFactory(
+        sd,
+        FakeTimeoutTransport(),
+        registry=dummy_registry,
+        endpoint_cache_ttl=0.05,
+        metrics=metrics,
+    )
+    cli = await client_factory("api")
+    assert cli.endpoint == "https://dummy.v1/"
+    cli = await client_factory("api")
+    assert cli.endpoint == "https://dummy.v1/"
+    assert sd.calls == 1
+
+    await AsyncSleep(0.06)
+    await client_factory("api")
+    assert sd.calls == 2
+
+    hits = metrics.blacksmith_endpoint_cache_hit.labels("api")._value.get()  # type: ignore
+    miss = metrics.blacksmith_endpoint_cache_miss.labels("api")._value.get()  # type: ignore
+    assert (hits, miss) == (1, 2)
+
+
+async def test_client_factory_unregistered_service_cache() -> None:
+    sd = CountingDiscovery()
+    sd.endpoints = {}
+    client_factory: AsyncClientFactory[Any] = AsyncClientFactory(
+        sd,
+        FakeTimeoutTransport(),
+        registry=dummy_registry,
+        unregistered_service_cache_ttl=60,
+    )
+    with pytest.raises(UnregisteredServiceException):
+        await client_factory("api")
+    with pytest.raises(UnregisteredServiceException) as ctx:
+        await client_factory("api")
+    assert str(ctx.value) == "Unregistered service 'dummy/v1'"
+    assert sd.calls == 1
+
+
 async def test_client_factory_initialize_middlewares(
     echo_middleware: AsyncAbstractTransport,
     static_sd: AsyncAbstractServiceDiscovery,
@@ -1,5 +1,6 @@
 import json
 import logging
+import time
 from collections.abc import Mapping, Sequence
 from datetime import timedelta
 from typing import (
@@ -12,11 +13,16 @@ import pytest
 
 from blacksmith.domain.exceptions import HTTPError
 from blacksmith.domain.model import HTTPRequest, HTTPResponse, HTTPTimeout
+from blacksmith.domain.model.middleware.rate_limit import RateLimit
 from blacksmith.domain.model.middleware.zipkin import AbstractTraceContext
 from blacksmith.middleware._sync import SyncMiddleware
 from blacksmith.middleware._sync.auth import SyncHTTPAuthorizationMiddleware
 from blacksmith.middleware._sync.base import SyncHTTPAddHeadersMiddleware
 from blacksmith.middleware._sync.http_cache import SyncAbstractCache
+from blacksmith.middleware._sync.rate_limit import (
+    RESERVE_SCRIPT,
+    SyncAbstractRateLimitCache,
+)
 from blacksmith.sd._sync.adapters.consul import SyncConsulDiscovery, _registry
 from blacksmith.sd._sync.adapters.nomad import SyncNomadDiscovery
 from blacksmith.sd._sync.adapters.router import SyncRouterDiscovery
@@ -257,6 +263,32 @@ def fake_http_middleware_cache_with_data(
     return SyncFakeHttpMiddlewareCache(params["initial_cache"])
 
 
+class SyncFakeRateLimitCache(SyncAbstractRateLimitCache):
+    """Run the reservation script, in python, with the clock of the test."""
+
+    def __init__(self) -> None:
+        self.val: dict[str, float] = {}
+        self.ttl: dict[str, float] = {}
+
+    def eval(self, script: str, numkeys: int, *keys_and_args: Any) -> Any:
+        assert script == RESERVE_SCRIPT
+        name, rate, burst, max_delay = keys_and_args
+        now = time.time()
+        if self.ttl.get(name, now) < now:
+            del self.val[name]
+        reservation = RateLimit(rate, burst).reserve(self.val.get(name), now, max_delay)
+        if reservation is None:
+            return None
+        delay, self.val[name] = reservation
+        self.ttl[name] = self.val[name] + 1.0
+        return str(delay).encode()
+
+
+@pytest.fixture
+def fake_rate_limit_cache() -> SyncFakeRateLimitCache:
+    return SyncFakeRateLimitCache()
+
+
 class Trace(AbstractTraceContext):
     name: str
     kind: str
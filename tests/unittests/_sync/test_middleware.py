@@ -1,4 +1,5 @@
 import logging
+import time
 from typing import Any, cast
 
 import prometheus_client
@@ -15,18 +16,47 @@ from purgatory.domain.model import OpenedState
 from purgatory.service._sync.circuitbreaker import SyncCircuitBreakerFactory
 
 from blacksmith import SyncLoggingMiddleware, __version__
-from blacksmith.domain.exceptions import HTTPError
+from blacksmith.domain.exceptions import (
+    BackpressureError,
+    ConcurrencyLimitError,
+    HTTPError,
+    HTTPTimeoutError,
+    RateLimitError,
+)
+from blacksmith.domain.model.deadline import Deadline
 from blacksmith.domain.model.http import HTTPRequest, HTTPResponse, HTTPTimeout
+from blacksmith.domain.model.middleware.adaptive_limit import AdaptiveLimit
+from blacksmith.domain.model.middleware.budget import Budget
+from blacksmith.domain.model.middleware.bulkhead import Bulkhead
 from blacksmith.domain.model.middleware.circuit_breaker import exclude_httpx_4xx
+from blacksmith.domain.model.middleware.latency import LatencyPercentiles
 from blacksmith.domain.model.middleware.prometheus import PrometheusMetrics
+from blacksmith.domain.model.middleware.rate_limit import RateLimit
+from blacksmith.domain.model.middleware.retry import RetryPolicy
 from blacksmith.domain.typing import SyncMiddleware
+from blacksmith.middleware._sync.adaptive_concurrency import (
+    SyncAdaptiveConcurrencyMiddleware,
+)
+from blacksmith.middleware._sync.adaptive_timeout import (
+    SyncAdaptiveTimeoutMiddleware,
+)
 from blacksmith.middleware._sync.auth import SyncHTTPAuthorizationMiddleware
+from blacksmith.middleware._sync.backpressure import SyncBackpressureMiddleware
 from blacksmith.middleware._sync.base import (
     SyncHTTPAddHeadersMiddleware,
     SyncHTTPMiddleware,
 )
+from blacksmith.middleware._sync.bulkhead import SyncBulkheadMiddleware
 from blacksmith.middleware._sync.circuit_breaker import SyncCircuitBreakerMiddleware
+from blacksmith.middleware._sync.deadline import SyncDeadlineMiddleware
+from blacksmith.middleware._sync.hedging import SyncHedgingMiddleware
 from blacksmith.middleware._sync.prometheus import SyncPrometheusMiddleware
+from blacksmith.middleware._sync.rate_limit import (
+    SyncAbstractRateLimitCache,
+    SyncRateLimitMiddleware,
+)
+from blacksmith.middleware._sync.retry import SyncRetryMiddleware
+from blacksmith.middleware._sync.single_flight import SyncSingleFlightMiddleware
 from blacksmith.middleware._sync.zipkin import SyncZipkinMiddleware
 from tests.unittests.time import SyncSleep
 
@@ -683,3 +713,772 @@ def test_logging_middleware_broken(
         next(req, "dummy", "/", dummy_timeout)
 
     assert log.logs == expected_logs  # type: ignore
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        pytest.param(
+            {
+                "vary": None,
+                "requests": [
+                    HTTPRequest("GET", "/dummy/{name}", path={"name": "a"}),
+                    HTTPRequest("GET", "/dummy/a"),
+                ],
+                "identical": True,
+            },
+            id="same url",
+        ),
+        pytest.param(
+            {
+                "vary": None,
+                "requests": [
+                    HTTPRequest("GET", "/dummy", querystring={"q": "a"}),
+                    HTTPRequest("GET", "/dummy", querystring={"q": "b"}),
+                ],
+                "identical": False,
+            },
+            id="querystring",
+        ),
+        pytest.param(
+            {
+                "vary": None,
+                "requests": [
+                    HTTPRequest("GET", "/dummy", headers={"X-Req-Id": "1"}),
+                    HTTPRequest("GET", "/dummy", headers={"X-Req-Id": "2"}),
+                ],
+                "identical": False,
+            },
+            id="headers",
+        ),
+        pytest.param(
+            {
+                "vary": ["authorization"],
+                "requests": [
+                    HTTPRequest(
+                        "GET",
+                        "/dummy",
+                        headers={"X-Req-Id": "1", "Authorization": "Bearer x"},
+                    ),
+                    HTTPRequest(
+                        "GET",
+                        "/dummy",
+                        headers={"X-Req-Id": "2", "Authorization": "Bearer x"},
+                    ),
+                ],
+                "identical": True,
+            },
+            id="vary",
+        ),
+        pytest.param(
+            {
+                "vary": ["authorization"],
+                "requests": [
+                    HTTPRequest("GET", "/dummy", headers={"Authorization": "x"}),
+                    HTTPRequest("GET", "/dummy", headers={"Authorization": "y"}),
+                ],
+                "identical": False,
+            },
+            id="vary distinct",
+        ),
+    ],
+)
+def test_single_flight_key(params: dict[str, Any]):
+    middleware = SyncSingleFlightMiddleware(vary=params["vary"])
+    req1, req2 = params["requests"]
+    key1 = middleware.get_flight_key("dummy", req1)
+    key2 = middleware.get_flight_key("dummy", req2)
+    assert (key1 == key2) is params["identical"]
+
+
+def test_single_flight_middleware(
+    dummy_http_request: HTTPRequest,
+    dummy_timeout: HTTPTimeout,
+    metrics: PrometheusMetrics,
+    prometheus_registry: CollectorRegistry,
+):
+    calls: list[HTTPRequest] = []
+
+    def next(
+        req: HTTPRequest,
+        client_name: str,
+        path: str,
+        timeout: HTTPTimeout,
+    ) -> HTTPResponse:
+        calls.append(req)
+        return HTTPResponse(200, {}, json={"method": req.method})
+
+    middleware = SyncSingleFlightMiddleware(metrics=metrics)
+    handle = middleware(next)
+    resp = handle(dummy_http_request, "dummy", "/dummy/{name}", dummy_timeout)
+    assert resp.json == {"method": "GET"}
+    resp = handle(HTTPRequest("POST", "/dummy"), "dummy", "/dummy", dummy_timeout)
+    assert resp.json == {"method": "POST"}
+    assert len(calls) == 2
+
+    val = prometheus_registry.get_sample_value(
+        "blacksmith_request_coalesced_total",
+        labels={"client_name": "dummy", "method": "GET", "path": "/dummy/{name}"},
+    )
+    assert val is None
+
+
+def test_single_flight_middleware_follower_timeout(
+    dummy_http_request: HTTPRequest,
+):
+    errors: list[HTTPTimeoutError] = []
+    elapsed: list[float] = []
+
+    def next(
+        req: HTTPRequest,
+        client_name: str,
+        path: str,
+        timeout: HTTPTimeout,
+    ) -> HTTPResponse:
+        # an identical request, with a shorter timeout, waits for the leader
+        start = time.perf_counter()
+        try:
+            handle(req, client_name, path, HTTPTimeout(read=0.1, total=0.1))
+        except HTTPTimeoutError as exc:
+            errors.append(exc)
+        elapsed.append(time.perf_counter() - start)
+        return HTTPResponse(200, {}, json={"method": req.method})
+
+    handle = SyncSingleFlightMiddleware()(next)
+    resp = handle(dummy_http_request, "dummy", "/dummy/{name}", HTTPTimeout(read=2))
+    assert resp.json == {"method": "GET"}
+    assert [str(err) for err in errors] == [
+        "dummy - GET /dummy/{name} - Timeout while waiting for an identical request"
+    ]
+    assert elapsed[0] < 0.5
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        pytest.param(
+            {
+                "method": "GET",
+                "latencies": [0.2, 0],
+                "expected": 1,
+                "hedged": 1.0,
+                "won": 1.0,
+            },
+            id="hedged",
+        ),
+        pytest.param(
+            {
+                "method": "GET",
+                "latencies": [0, 0],
+                "expected": 0,
+                "hedged": None,
+                "won": None,
+            },
+            id="fast",
+        ),
+        pytest.param(
+            {
+                "method": "POST",
+                "latencies": [0.05, 0],
+                "expected": 0,
+                "hedged": None,
+                "won": None,
+            },
+            id="not idempotent",
+        ),
+    ],
+)
+def test_hedging_middleware(
+    params: dict[str, Any],
+    dummy_timeout: HTTPTimeout,
+    metrics: PrometheusMetrics,
+    prometheus_registry: CollectorRegistry,
+):
+    calls: list[int] = []
+
+    def next(
+        req: HTTPRequest,
+        client_name: str,
+        path: str,
+        timeout: HTTPTimeout,
+    ) -> HTTPResponse:
+        idx = len(calls)
+        calls.append(idx)
+        SyncSleep(params["latencies"][idx])
+        return HTTPResponse(200, {}, json=idx)
+
+    middleware = SyncHedgingMiddleware(delay=0.02, metrics=metrics)
+    handle = middleware(next)
+    resp = handle(
+        HTTPRequest(params["method"], "/dummies"), "dummy", "/dummies", dummy_timeout
+    )
+    assert resp.json == params["expected"]
+
+    labels = {"client_name": "dummy", "method": params["method"], "path": "/dummies"}
+    val = prometheus_registry.get_sample_value(
+        "blacksmith_hedged_request_total", labels=labels
+    )
+    assert val == params["hedged"]
+    val = prometheus_registry.get_sample_value(
+        "blacksmith_hedged_request_won_total", labels=labels
+    )
+    assert val == params["won"]
+
+
+def test_hedging_middleware_delay():
+    latencies = LatencyPercentiles(min_samples=2)
+    middleware = SyncHedgingMiddleware(delay=0.5, percentile=0.9, latencies=latencies)
+    assert middleware.get_delay("dummy", "/") == 0.5
+    latencies.observe("dummy", "/", 0.1)
+    latencies.observe("dummy", "/", 0.2)
+    assert middleware.get_delay("dummy", "/") == 0.2
+    assert (
+        SyncHedgingMiddleware(delay=0.5, latencies=latencies).get_delay("dummy", "/")
+        == 0.5
+    )
+
+
+def test_adaptive_timeout_middleware_get_timeout():
+    latencies = LatencyPercentiles(min_samples=2)
+    middleware = SyncAdaptiveTimeoutMiddleware(
+        percentile=0.9, factor=2.0, min_timeout=0.5, latencies=latencies
+    )
+    timeout = HTTPTimeout(30.0, 5.0, total=60.0)
+    assert middleware.get_timeout("dummy", "/", timeout) == timeout
+    latencies.observe("dummy", "/", 0.1)
+    latencies.observe("dummy", "/", 1.0)
+    assert middleware.get_timeout("dummy", "/", timeout) == HTTPTimeout(
+        2.0, 5.0, write=30.0, pool=30.0, total=60.0
+    )
+    # bounded by the configured read timeout
+    assert middleware.get_timeout("dummy", "/", HTTPTimeout(1.0)) == HTTPTimeout(1.0)
+
+    latencies = LatencyPercentiles(min_samples=2, refresh_every=1)
+    middleware = SyncAdaptiveTimeoutMiddleware(
+        max_timeout=10.0, min_timeout=0.5, latencies=latencies
+    )
+    latencies.observe("dummy", "/", 0.01)
+    latencies.observe("dummy", "/", 0.02)
+    assert middleware.get_timeout("dummy", "/", HTTPTimeout(1.0)).read == 0.5
+    latencies.observe("dummy", "/", 20.0)
+    latencies.observe("dummy", "/", 20.0)
+    assert middleware.get_timeout("dummy", "/", HTTPTimeout(30.0)).read == 10.0
+    # the timeout of the request, per call or per route, is never exceeded
+    assert middleware.get_timeout("dummy", "/", HTTPTimeout(1.0)).read == 1.0
+    assert middleware.get_timeout("dummy", "/", HTTPTimeout(0.2)).read == 0.2
+
+
+def test_adaptive_timeout_middleware():
+    timeouts: list[HTTPTimeout] = []
+
+    def next(
+        req: HTTPRequest,
+        client_name: str,
+        path: str,
+        timeout: HTTPTimeout,
+    ) -> HTTPResponse:
+        timeouts.append(timeout)
+        if req.method == "DELETE":
+            raise HTTPTimeoutError("timeout")
+        if req.method == "POST":
+            raise HTTPError("boom", req, HTTPResponse(500, {}, json=None))
+        return HTTPResponse(200, {}, json=None)
+
+    latencies = LatencyPercentiles(min_samples=3)
+    middleware = SyncAdaptiveTimeoutMiddleware(min_timeout=1.0, latencies=latencies)
+    handle = middleware(next)
+    handle(HTTPRequest("GET", "/"), "dummy", "/", HTTPTimeout())
+    with pytest.raises(HTTPError):
+        handle(HTTPRequest("POST", "/"), "dummy", "/", HTTPTimeout())
+    with pytest.raises(HTTPTimeoutError):
+        handle(HTTPRequest("DELETE", "/"), "dummy", "/", HTTPTimeout())
+    handle(HTTPRequest("GET", "/"), "dummy", "/", HTTPTimeout())
+    assert timeouts[:3] == [HTTPTimeout()] * 3
+    assert timeouts[3] == HTTPTimeout(1.0, write=30.0, pool=30.0)
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        pytest.param(
+            {
+                "method": "GET",
+                "errors": [503, 502],
+                "budget": Budget(),
+                "expected": 2,
+                "retried": 2.0,
+            },
+            id="recovered",
+        ),
+        pytest.param(
+            {
+                "method": "GET",
+                "errors": [503, 503, 503],
+                "budget": Budget(),
+                "expected": 503,
+                "retried": 2.0,
+            },
+            id="max attempts",
+        ),
+        pytest.param(
+            {
+                "method": "GET",
+                "errors": [503, 503],
+                "budget": Budget(max_tokens=1),
+                "expected": 503,
+                "retried": 1.0,
+            },
+            id="budget exhausted",
+        ),
+        pytest.param(
+            {
+                "method": "GET",
+                "errors": [500],
+                "budget": Budget(),
+                "expected": 500,
+                "retried": None,
+            },
+            id="not transient",
+        ),
+        pytest.param(
+            {
+                "method": "POST",
+                "errors": [503],
+                "budget": Budget(),
+                "expected": 503,
+                "retried": None,
+            },
+            id="not idempotent",
+        ),
+    ],
+)
+def test_retry_middleware(
+    params: dict[str, Any],
+    dummy_timeout: HTTPTimeout,
+    metrics: PrometheusMetrics,
+    prometheus_registry: CollectorRegistry,
+):
+    calls: list[int] = []
+
+    def next(
+        req: HTTPRequest,
+        client_name: str,
+        path: str,
+        timeout: HTTPTimeout,
+    ) -> HTTPResponse:
+        idx = len(calls)
+        calls.append(idx)
+        if idx < len(params["errors"]):
+            raise HTTPError(
+                "boom",
+                req,
+                HTTPResponse(params["errors"][idx], {}, json=None),
+            )
+        return HTTPResponse(200, {}, json=idx)
+
+    middleware = SyncRetryMiddleware(
+        RetryPolicy(base_delay=0.001, max_delay=0.002),
+        budget=params["budget"],
+        metrics=metrics,
+    )
+    handle = middleware(next)
+    req = HTTPRequest(params["method"], "/dummies")
+    try:
+        resp = handle(req, "dummy", "/dummies", dummy_timeout)
+    except HTTPError as exc:
+        assert exc.status_code == params["expected"]
+    else:
+        assert resp.json == params["expected"]
+
+    labels = {"client_name": "dummy", "method": params["method"], "path": "/dummies"}
+    val = prometheus_registry.get_sample_value(
+        "blacksmith_request_retried_total", labels=labels
+    )
+    assert val == params["retried"]
+
+
+def test_retry_middleware_timeout(dummy_timeout: HTTPTimeout):
+    calls: list[int] = []
+
+    def next(
+        req: HTTPRequest,
+        client_name: str,
+        path: str,
+        timeout: HTTPTimeout,
+    ) -> HTTPResponse:
+        calls.append(len(calls))
+        if len(calls) == 1:
+            raise HTTPTimeoutError("boom")
+        return HTTPResponse(200, {}, json="ok")
+
+    middleware = SyncRetryMiddleware(RetryPolicy(base_delay=0.001, max_delay=0.002))
+    handle = middleware(next)
+    resp = handle(HTTPRequest("GET", "/"), "dummy", "/", dummy_timeout)
+    assert resp.json == "ok"
+    assert calls == [0, 1]
+
+
+def test_retry_middleware_retry_after(dummy_timeout: HTTPTimeout):
+    calls: list[int] = []
+
+    def next(
+        req: HTTPRequest,
+        client_name: str,
+        path: str,
+        timeout: HTTPTimeout,
+    ) -> HTTPResponse:
+        calls.append(len(calls))
+        raise HTTPError("boom", req, HTTPResponse(503, {"Retry-After": "60"}, None))
+
+    middleware = SyncRetryMiddleware(RetryPolicy(max_retry_after=30))
+    handle = middleware(next)
+    with pytest.raises(HTTPError):
+        handle(HTTPRequest("GET", "/"), "dummy", "/", dummy_timeout)
+    assert calls == [0]
+
+
+def test_adaptive_concurrency_middleware(
+    dummy_timeout: HTTPTimeout,
+    metrics: PrometheusMetrics,
+    prometheus_registry: CollectorRegistry,
+):
+    middleware = SyncAdaptiveConcurrencyMiddleware(
+        AdaptiveLimit(initial_limit=1), metrics=metrics
+    )
+    errors: list[Exception] = []
+
+    def next(
+        req: HTTPRequest,
+        client_name: str,
+        path: str,
+        timeout: HTTPTimeout,
+    ) -> HTTPResponse:
+        if req.method == "GET":
+            # the limit is reached while the request is running
+            try:
+                handle(HTTPRequest("HEAD", "/"), "dummy", "/", timeout)
+            except ConcurrencyLimitError as exc:
+                errors.append(exc)
+            # other clients have their own limit
+            handle(HTTPRequest("HEAD", "/"), "other", "/", timeout)
+        return HTTPResponse(200, {}, json="ok")
+
+    handle = middleware(next)
+    resp = handle(HTTPRequest("GET", "/"), "dummy", "/", dummy_timeout)
+    assert resp.json == "ok"
+    assert [str(err) for err in errors] == [
+        "Concurrency limit of 1 requests reached for client 'dummy'"
+    ]
+
+    labels = {"client_name": "dummy"}
+    val = prometheus_registry.get_sample_value(
+        "blacksmith_concurrency_rejected_total", labels=labels
+    )
+    assert val == 1.0
+    val = prometheus_registry.get_sample_value(
+        "blacksmith_concurrency_limit", labels=labels
+    )
+    # the limit was used
+    assert val == 2.0
+    val = prometheus_registry.get_sample_value(
+        "blacksmith_concurrency_queue_depth", labels=labels
+    )
+    assert val == 0.0
+
+
+def test_adaptive_concurrency_middleware_dropped(dummy_timeout: HTTPTimeout):
+    middleware = SyncAdaptiveConcurrencyMiddleware(
+        AdaptiveLimit(initial_limit=10, backoff_ratio=0.5)
+    )
+
+    def next(
+        req: HTTPRequest,
+        client_name: str,
+        path: str,
+        timeout: HTTPTimeout,
+    ) -> HTTPResponse:
+        raise HTTPError("boom", req, HTTPResponse(503, {}, json=None))
+
+    handle = middleware(next)
+    with pytest.raises(HTTPError):
+        handle(HTTPRequest("GET", "/"), "dummy", "/", dummy_timeout)
+    assert middleware.get_limiter("dummy").limit == 5
+
+
+def test_rate_limit_middleware(
+    echo_middleware: SyncMiddleware,
+    dummy_timeout: HTTPTimeout,
+    metrics: PrometheusMetrics,
+    prometheus_registry: CollectorRegistry,
+):
+    middleware = SyncRateLimitMiddleware(
+        {"dummy": RateLimit(rate=100), "api": RateLimit(rate=100, per_path=True)},
+        metrics=metrics,
+    )
+    handle = middleware(echo_middleware)
+    for client_name, path in [
+        ("dummy", "/a"),
+        ("dummy", "/b"),
+        ("api", "/a"),
+        ("api", "/b"),
+        ("other", "/a"),
+        ("other", "/a"),
+    ]:
+        req = HTTPRequest("GET", path, body="{}")
+        resp = handle(req, client_name, path, dummy_timeout)
+        assert resp.status_code == 200
+
+    def throttled(client_name: str, path: str) -> float | None:
+        return prometheus_registry.get_sample_value(
+            "blacksmith_request_throttled_total",
+            labels={"client_name": client_name, "method": "GET", "path": path},
+        )
+
+    assert throttled("dummy", "/a") is None
+    assert throttled("dummy", "/b") == 1.0
+    assert throttled("api", "/a") is None
+    assert throttled("api", "/b") is None
+    assert throttled("other", "/a") is None
+
+
+def test_rate_limit_middleware_max_delay(
+    echo_middleware: SyncMiddleware, dummy_timeout: HTTPTimeout
+):
+    middleware = SyncRateLimitMiddleware({"dummy": RateLimit(rate=1)}, max_delay=0.1)
+    handle = middleware(echo_middleware)
+    handle(HTTPRequest("GET", "/", body="{}"), "dummy", "/", dummy_timeout)
+    with pytest.raises(RateLimitError) as ctx:
+        handle(HTTPRequest("GET", "/", body="{}"), "dummy", "/", dummy_timeout)
+    assert str(ctx.value) == "Rate limit of client 'dummy' exceeded"
+
+
+def test_rate_limit_middleware_shared(
+    fake_rate_limit_cache: SyncAbstractRateLimitCache,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    now = 1000.0
+    monkeypatch.setattr(time, "time", lambda: now)
+    limit = RateLimit(rate=4, burst=2)
+    middleware = SyncRateLimitMiddleware(
+        {"dummy": limit}, cache=fake_rate_limit_cache, max_delay=0.5
+    )
+    delays = [middleware.reserve("dummy", limit) for _ in range(5)]
+    assert delays == [0, 0, 0.25, 0.5, None]
+    # the key expires after the burst is refilled
+    assert fake_rate_limit_cache.val == {  # type: ignore
+        "blacksmith:rate_limit:dummy": 1001.0
+    }
+    assert fake_rate_limit_cache.ttl == {  # type: ignore
+        "blacksmith:rate_limit:dummy": 1002.0
+    }
+
+    now = 1001.0
+    assert middleware.reserve("dummy", limit) == 0
+
+
+def test_rate_limit_middleware_shared_quota(
+    fake_rate_limit_cache: SyncAbstractRateLimitCache,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    now = 1000.0
+    monkeypatch.setattr(time, "time", lambda: now)
+    limit = RateLimit(rate=1, burst=2)
+    middleware = SyncRateLimitMiddleware(
+        {"dummy": limit}, cache=fake_rate_limit_cache, max_reservation=3.0
+    )
+    starts: list[float] = []
+    for now in (1000.0, 1000.0, 1000.0, 1001.5, 1002.0, 1002.5, 1003.0, 1003.5):
+        delay = middleware.reserve("dummy", limit)
+        if delay is not None:
+            starts.append(now + delay)
+    # the reservations are bounded by max_reservation, and never overbooked
+    assert starts == [1000.0, 1000.0, 1001.0, 1002.0, 1003.0, 1004.0, 1005.0, 1006.0]
+    now = 1003.5
+    assert middleware.reserve("dummy", limit) is None
+
+
+def test_backpressure_middleware(
+    dummy_timeout: HTTPTimeout,
+    metrics: PrometheusMetrics,
+    prometheus_registry: CollectorRegistry,
+):
+    responses = [
+        HTTPResponse(429, {"Retry-After": "60"}, json=None),
+        HTTPResponse(503, {}, json=None),
+        HTTPResponse(200, {}, json="ok"),
+    ]
+
+    def next(
+        req: HTTPRequest,
+        client_name: str,
+        path: str,
+        timeout: HTTPTimeout,
+    ) -> HTTPResponse:
+        if client_name == "other":
+            return HTTPResponse(200, {}, json="ok")
+        resp = responses.pop(0)
+        if resp.status_code >= 400:
+            raise HTTPError("boom", req, resp)
+        return resp
+
+    middleware = SyncBackpressureMiddleware(metrics=metrics)
+    handle = middleware(next)
+    req = HTTPRequest("GET", "/")
+    with pytest.raises(HTTPError):
+        handle(req, "dummy", "/", dummy_timeout)
+
+    with pytest.raises(BackpressureError) as ctx:
+        handle(req, "dummy", "/", dummy_timeout)
+    assert ctx.value.delay == pytest.approx(60, abs=1)
+    # the request has not been sent
+    assert len(responses) == 2
+
+    # other clients are not paused
+    resp = handle(req, "other", "/", dummy_timeout)
+    assert resp.json == "ok"
+
+    val = prometheus_registry.get_sample_value(
+        "blacksmith_request_paused_total",
+        labels={"client_name": "dummy", "method": "GET", "path": "/"},
+    )
+    assert val == 1.0
+
+
+def test_backpressure_middleware_delay(dummy_timeout: HTTPTimeout):
+    responses = [
+        HTTPResponse(503, {"Retry-After": "0"}, json=None),
+        HTTPResponse(503, {"Retry-After": "60"}, json=None),
+        HTTPResponse(200, {}, json="ok"),
+    ]
+
+    def next(
+        req: HTTPRequest,
+        client_name: str,
+        path: str,
+        timeout: HTTPTimeout,
+    ) -> HTTPResponse:
+        resp = responses.pop(0)
+        if resp.status_code >= 400:
+            raise HTTPError("boom", req, resp)
+        return resp
+
+    middleware = SyncBackpressureMiddleware(
+        per_path=True, max_delay=0.1, max_pause=0.01
+    )
+    handle = middleware(next)
+    for _ in range(2):
+        with pytest.raises(HTTPError):
+            handle(HTTPRequest("GET", "/"), "dummy", "/", dummy_timeout)
+    assert middleware.get_key("dummy", "/") == ("dummy", "/")
+
+    # the pause is bounded by max_pause, and the request is delayed
+    resp = handle(HTTPRequest("GET", "/"), "dummy", "/", dummy_timeout)
+    assert resp.json == "ok"
+
+
+def test_bulkhead_middleware(
+    dummy_timeout: HTTPTimeout,
+    metrics: PrometheusMetrics,
+    prometheus_registry: CollectorRegistry,
+):
+    middleware = SyncBulkheadMiddleware(
+        {"dummy": Bulkhead(max_inflight=1)},
+        metrics=metrics,
+    )
+    errors: list[Exception] = []
+
+    def next(
+        req: HTTPRequest,
+        client_name: str,
+        path: str,
+        timeout: HTTPTimeout,
+    ) -> HTTPResponse:
+        if req.method == "GET":
+            # the bulkhead is full while the request is running
+            try:
+                handle(HTTPRequest("HEAD", "/"), "dummy", "/", timeout)
+            except ConcurrencyLimitError as exc:
+                errors.append(exc)
+            # other clients are not limited
+            handle(HTTPRequest("HEAD", "/"), "other", "/", timeout)
+        return HTTPResponse(200, {}, json="ok")
+
+    handle = middleware(next)
+    resp = handle(HTTPRequest("GET", "/"), "dummy", "/", dummy_timeout)
+    assert resp.json == "ok"
+    assert len(errors) == 1
+    assert middleware.get_limiter("other") is None
+
+    labels = {"client_name": "dummy"}
+    val = prometheus_registry.get_sample_value(
+        "blacksmith_bulkhead_rejected_total", labels=labels
+    )
+    assert val == 1.0
+    val = prometheus_registry.get_sample_value(
+        "blacksmith_bulkhead_queue_wait_seconds_count", labels=labels
+    )
+    assert val == 2.0
+
+
+def test_bulkhead_middleware_queue_timeout(dummy_timeout: HTTPTimeout):
+    middleware = SyncBulkheadMiddleware(
+        {}, default=Bulkhead(max_inflight=1, max_queue=1, queue_timeout=0.01)
+    )
+    errors: list[Exception] = []
+
+    def next(
+        req: HTTPRequest,
+        client_name: str,
+        path: str,
+        timeout: HTTPTimeout,
+    ) -> HTTPResponse:
+        if req.method == "GET":
+            try:
+                handle(HTTPRequest("HEAD", "/"), "dummy", "/", timeout)
+            except ConcurrencyLimitError as exc:
+                errors.append(exc)
+        return HTTPResponse(200, {}, json="ok")
+
+    handle = middleware(next)
+    resp = handle(HTTPRequest("GET", "/"), "dummy", "/", dummy_timeout)
+    assert resp.json == "ok"
+    assert len(errors) == 1
+    limiter = middleware.get_limiter("dummy")
+    assert limiter is not None
+    assert (limiter.inflight, limiter.queued) == (0, 0)
+
+
+def test_retry_middleware_deadline(dummy_timeout: HTTPTimeout):
+    timeouts: list[HTTPTimeout] = []
+
+    def next(
+        req: HTTPRequest,
+        client_name: str,
+        path: str,
+        timeout: HTTPTimeout,
+    ) -> HTTPResponse:
+        timeouts.append(timeout)
+        raise HTTPError("boom", req, HTTPResponse(503, {"Retry-After": "1"}, None))
+
+    middleware = SyncRetryMiddleware()
+    handle = middleware(next)
+    with Deadline(0.5):
+        with pytest.raises(HTTPError):
+            handle(HTTPRequest("GET", "/"), "dummy", "/", dummy_timeout)
+    # the service asked to retry after the deadline
+    assert len(timeouts) == 1
+    assert timeouts[0].read <= 0.5
+
+
+def test_deadline_middleware(echo_middleware: SyncMiddleware):
+    middleware = SyncDeadlineMiddleware()
+    handle = middleware(echo_middleware)
+    req = HTTPRequest("GET", "/", body="{}")
+    resp = handle(req, "dummy", "/", HTTPTimeout())
+    assert "X-Request-Timeout" not in resp.headers
+
+    with Deadline(2):
+        resp = handle(req, "dummy", "/", HTTPTimeout())
+    deadline = Deadline.from_header(resp.headers["X-Request-Timeout"])
+    assert deadline.timeout is not None
+    assert 1 < deadline.timeout <= 2
@@ -12,10 +12,12 @@ from blacksmith.domain.exceptions import (
     NoContractException,
     UnregisteredResourceException,
     UnregisteredRouteException,
+    UnregisteredServiceException,
     WrongRequestTypeException,
 )
 from blacksmith.domain.model import (
     CollectionParser,
+    HTTPPoolLimits,
     HTTPRequest,
     HTTPResponse,
     HTTPTimeout,
@@ -26,16 +28,18 @@ from blacksmith.domain.registry import ApiRoutes
 from blacksmith.middleware._sync.auth import SyncHTTPAuthorizationMiddleware
 from blacksmith.middleware._sync.base import SyncHTTPMiddleware
 from blacksmith.middleware._sync.prometheus import SyncPrometheusMiddleware
+from blacksmith.sd._sync.adapters.static import SyncStaticDiscovery
 from blacksmith.sd._sync.base import SyncAbstractServiceDiscovery
 from blacksmith.service._sync.base import SyncAbstractTransport
 from blacksmith.service._sync.client import SyncClient, SyncClientFactory
-from blacksmith.typing import ClientName, Path, Proxies
+from blacksmith.typing import ClientName, Path, Proxies, ServiceName, Url, Version
 from tests.unittests.dummy_registry import (
     GetParam,
     GetResponse,
     PostParam,
     dummy_registry,
 )
+from tests.unittests.time import SyncSleep
 
 
 class MyErrorFormat(BaseModel):
@@ -138,6 +142,31 @@ def test_client(static_sd: SyncAbstractServiceDiscovery):
     )
 
 
+def test_client_route_proxy_cache(
+    static_sd: SyncAbstractServiceDiscovery, dummy_middleware: SyncHTTPMiddleware
+):
+    tp = FakeTimeoutTransport()
+    client_factory: SyncClientFactory[Any] = SyncClientFactory(
+        static_sd, tp, registry=dummy_registry
+    )
+    cli = client_factory("api")
+    proxy = cli.dummies
+    assert cli.dummies is proxy
+    assert "dummies" in cli.__dict__
+
+    cli.add_middleware(dummy_middleware)
+    assert cli.dummies is not proxy
+    assert cli.dummies.middlewares == [dummy_middleware]
+    proxy = cli.dummies
+
+    cli.transport = FakeTimeoutTransport()
+    assert cli.dummies is not proxy
+    assert cli.dummies.transport is cli.transport
+
+    with pytest.raises(UnregisteredResourceException):
+        cli.daemon  # noqa: B018
+
+
 def test_client_timeout(static_sd: SyncAbstractServiceDiscovery):
     routes = ApiRoutes(
         "/dummies/{name}", {"GET": (GetParam, GetResponse)}, None, None, None
@@ -182,6 +211,33 @@ def test_client_factory_configure_transport(static_sd: SyncAbstractServiceDiscov
     assert client_factory.transport.verify_certificate is False
 
 
+def test_client_factory_configure_limits(static_sd: SyncAbstractServiceDiscovery):
+    limits = HTTPPoolLimits(max_connections=10)
+    client_factory: SyncClientFactory[Any] = SyncClientFactory(static_sd, limits=limits)
+    assert client_factory.transport.limits == limits  # type: ignore
+
+
+def test_client_factory_configure_pools(static_sd: SyncAbstractServiceDiscovery):
+    pools = {"api": HTTPPoolLimits(max_connections=10)}
+    client_factory: SyncClientFactory[Any] = SyncClientFactory(static_sd, pools=pools)
+    assert client_factory.transport.pools == pools  # type: ignore
+
+
+def test_client_factory_aclose(static_sd: SyncAbstractServiceDiscovery):
+    class ClosableTransport(FakeTimeoutTransport):
+        closed = 0
+
+        def close(self) -> None:
+            self.closed += 1
+
+    tp = ClosableTransport()
+    client_factory: SyncClientFactory[Any] = SyncClientFactory(
+        static_sd, tp, registry=dummy_registry
+    )
+    client_factory.close()
+    assert tp.closed == 1
+
+
 def test_client_factory_configure_proxies(static_sd: SyncAbstractServiceDiscovery):
     proxies: Proxies = {
         "http://": "http://localhost:8030",
@@ -250,6 +306,95 @@ def test_client_add_middleware(
     assert client_factory.middlewares == [prom]
 
 
+def test_client_factory_handler_cache(
+    static_sd: SyncAbstractServiceDiscovery, dummy_middleware: SyncHTTPMiddleware
+):
+    tp = FakeTimeoutTransport()
+    auth = SyncHTTPAuthorizationMiddleware("Bearer", "abc")
+    client_factory: SyncClientFactory[Any] = SyncClientFactory(
+        static_sd, tp, registry=dummy_registry
+    ).add_middleware(auth)
+
+    handler = client_factory.handler
+    assert client_factory.handler is handler
+
+    cli = client_factory("api")
+    cli2 = client_factory("api")
+    assert cli.handler is handler
+    assert cli2.handler is handler
+    assert cli.dummies.handler is handler
+
+    client_factory.add_middleware(dummy_middleware)
+    assert client_factory.handler is not handler
+    assert cli.handler is handler
+
+    cli.add_middleware(dummy_middleware)
+    assert cli.handler is not handler
+    assert cli.dummies.handler is cli.handler
+    assert cli2.handler is handler
+
+
+class CountingDiscovery(SyncStaticDiscovery):
+    def __init__(self) -> None:
+        super().__init__({("dummy", "v1"): "https://dummy.v1/"})
+        self.calls = 0
+
+    def get_endpoint(self, service: ServiceName, version: Version) -> Url:
+        self.calls += 1
+        return super().get_endpoint(service, version)
+
+
+def test_client_factory_no_endpoint_cache() -> None:
+    sd = CountingDiscovery()
+    client_factory: SyncClientFactory[Any] = SyncClientFactory(
+        sd, FakeTimeoutTransport(), registry=dummy_registry
+    )
+    client_factory("api")
+    client_factory("api")
+    assert sd.calls == 2
+
+
+def test_client_factory_endpoint_cache(metrics: PrometheusMetrics) -> None:
+    sd = CountingDiscovery()
+    client_factory: SyncClientFactory[Any] = SyncClientFactory(
+        sd,
+        FakeTimeoutTransport(),
+        registry=dummy_registry,
+        endpoint_cache_ttl=0.05,
+        metrics=metrics,
+    )
+    cli = client_factory("api")
+    assert cli.endpoint == "https://dummy.v1/"
+    cli = client_factory("api")
+    assert cli.endpoint == "https://dummy.v1/"
+    assert sd.calls == 1
+
+    SyncSleep(0.06)
+    client_factory("api")
+    assert sd.calls == 2
+
+    hits = metrics.blacksmith_endpoint_cache_hit.labels("api")._value.get()  # type: ignore
+    miss = metrics.blacksmith_endpoint_cache_miss.labels("api")._value.get()  # type: ignore
+    assert (hits, miss) == (1, 2)
+
+
+def test_client_factory_unregistered_service_cache() -> None:
+    sd = CountingDiscovery()
+    sd.endpoints = {}
+    client_factory: SyncClientFactory[Any] = SyncClientFactory(
+        sd,
+        FakeTimeoutTransport(),
+        registry=dummy_registry,
+        unregistered_service_cache_ttl=60,
+    )
+    with pytest.raises(UnregisteredServiceException):
+        client_factory("api")
+    with pytest.raises(UnregisteredServiceException) as ctx:
+        client_factory("api")
+    assert str(ctx.value) == "Unregistered service 'dummy/v1'"
+    assert sd.calls == 1
+
+
 def test_client_factory_initialize_middlewares(
     echo_middleware: SyncAbstractTransport,
     static_sd: SyncAbstractServiceDiscovery,
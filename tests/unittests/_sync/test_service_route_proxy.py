@@ -1,12 +1,15 @@
-from typing import Any
+from typing import Any, cast
+from urllib.parse import urlencode
 
 import pytest
-from pydantic import BaseModel, Field
-from result import Result
+from pydantic import BaseModel, Field, ValidationError
+from result import Err, Ok, Result
 
-from blacksmith import Request
+from blacksmith import HeaderField, PathInfoField, QueryStringField, Request
 from blacksmith.domain.exceptions import (
+    DeadlineExceededError,
     HTTPError,
+    HTTPTimeoutError,
     NoContractException,
     UnregisteredRouteException,
     WrongRequestTypeException,
@@ -16,13 +19,20 @@ from blacksmith.domain.model import (
     HTTPRequest,
     HTTPResponse,
     HTTPTimeout,
+    RouteOptions,
 )
+from blacksmith.domain.model.deadline import Deadline
 from blacksmith.domain.model.params import CollectionIterator
-from blacksmith.domain.registry import ApiRoutes
+from blacksmith.domain.registry import ApiRoutes, BatchGet
+from blacksmith.domain.typing import SyncMiddleware
 from blacksmith.middleware._sync.auth import SyncHTTPAuthorizationMiddleware
-from blacksmith.middleware._sync.base import SyncHTTPAddHeadersMiddleware
+from blacksmith.middleware._sync.base import (
+    SyncHTTPAddHeadersMiddleware,
+    SyncHTTPMiddleware,
+)
 from blacksmith.service._sync.base import SyncAbstractTransport
 from blacksmith.service._sync.route_proxy import SyncRouteProxy, build_timeout
+from blacksmith.shared_utils.concurrency import SyncBatch
 from blacksmith.typing import ClientName, Path
 from tests.unittests.dummy_registry import GetParam, GetResponse, PostParam
 
@@ -53,6 +63,29 @@ class FakeTransport(SyncAbstractTransport):
         return self.resp
 
 
+class PaginatedTransport(SyncAbstractTransport):
+    def __init__(self, pages: dict[str, HTTPResponse]) -> None:
+        super().__init__()
+        self.pages = pages
+        self.requests: list[HTTPRequest] = []
+
+    def __call__(
+        self,
+        req: HTTPRequest,
+        client_name: ClientName,
+        path: Path,
+        timeout: HTTPTimeout,
+    ) -> HTTPResponse:
+        self.requests.append(req)
+        url = req.url
+        if req.querystring:
+            url += f"?{urlencode(req.querystring)}"
+        resp = self.pages[url]
+        if resp.status_code >= 400:
+            raise HTTPError(f"{resp.status_code} blah", req, resp)
+        return resp
+
+
 def test_build_timeout() -> None:
     timeout = build_timeout(HTTPTimeout())
     assert timeout == HTTPTimeout(30.0, 15.0)
@@ -99,6 +132,51 @@ def test_route_proxy_prepare_middleware(
         "Eggs": "egg",
         "foo": "bar",
     }
+    handler = proxy.handler
+    proxy._handle_req_with_middlewares(
+        dummy_http_request,
+        HTTPTimeout(4.2),
+        "/",
+    )
+    assert proxy.handler is handler
+
+
+class RenameMiddleware(SyncHTTPMiddleware):
+    def __call__(self, next: SyncMiddleware) -> SyncMiddleware:
+        def handle(
+            req: HTTPRequest,
+            client_name: ClientName,
+            path: Path,
+            timeout: HTTPTimeout,
+        ) -> HTTPResponse:
+            resp = next(req, client_name, path, timeout)
+            resp.json = {**resp.json, "name": "bob"}  # type: ignore
+            return resp
+
+        return handle
+
+
+def test_route_proxy_middleware_rewrite_lazy_json() -> None:
+    tp = FakeTransport(HTTPResponse(200, {}, content=b'{"name": "alice", "age": 24}'))
+    proxy: SyncRouteProxy[Any, GetResponse, MyErrorFormat] = SyncRouteProxy(
+        "dummy",
+        "dummies",
+        "http://dummy",
+        ApiRoutes(
+            "/dummies/{name}",
+            {"GET": (GetParam, GetResponse)},
+            None,
+            None,
+            None,
+        ),
+        transport=tp,
+        timeout=HTTPTimeout(),
+        collection_parser=CollectionParser,
+        middlewares=[RenameMiddleware()],
+        error_parser=error_parser,
+    )
+    resp = proxy.get({"name": "alice"})
+    assert resp.unwrap() == GetResponse(name="bob", age=24)
 
 
 def test_route_proxy_prepare_unregistered_method_resource() -> None:
@@ -305,6 +383,599 @@ def test_route_proxy_collection_get() -> None:
     assert lresp == [{"name": "alice"}, {"name": "bob"}]
 
 
+def test_route_proxy_collection_get_batch() -> None:
+    httpresp = HTTPResponse(
+        200,
+        {"Total-Count": "10"},
+        [{"name": "alice", "age": 24}, {"name": "bob", "age": 42}],
+    )
+    tp = FakeTransport(httpresp)
+
+    proxy: SyncRouteProxy[Any, Any, Any] = SyncRouteProxy(
+        "dummy",
+        "dummies",
+        "http://dummy/",
+        ApiRoutes(
+            None,
+            None,
+            collection_path="/",
+            collection_contract={"GET": (Request, GetResponse)},
+            collection_parser=None,
+        ),
+        transport=tp,
+        timeout=HTTPTimeout(),
+        collection_parser=CollectionParser,
+        middlewares=[],
+        error_parser=error_parser,
+    )
+    result: Result[CollectionIterator[GetResponse], MyErrorFormat] = (
+        proxy.collection_get(batch_size=10)
+    )
+    resp = result.unwrap()
+    assert resp.batch_size == 10
+    assert list(resp) == [
+        GetResponse(name="alice", age=24),
+        GetResponse(name="bob", age=42),
+    ]
+
+
+@pytest.mark.parametrize("prefetch", [0, 1, 3])
+def test_route_proxy_collection_get_pages(prefetch: int) -> None:
+    tp = PaginatedTransport(
+        {
+            "http://dummy/": HTTPResponse(
+                200,
+                {"link": '<http://dummy/?page=2>; rel="next"'},
+                [{"name": "alice"}],
+            ),
+            "http://dummy/?page=2": HTTPResponse(
+                200,
+                {"link": '</?page=3>; rel="next"'},
+                [{"name": "bob"}],
+            ),
+            "http://dummy/?page=3": HTTPResponse(200, {}, [{"name": "charlie"}]),
+        }
+    )
+    proxy: SyncRouteProxy[Any, Any, Any] = SyncRouteProxy(
+        "dummy",
+        "dummies",
+        "http://dummy",
+        ApiRoutes(
+            None,
+            None,
+            collection_path="/",
+            collection_contract={"GET": (Request, None)},
+            collection_parser=None,
+        ),
+        transport=tp,
+        timeout=HTTPTimeout(),
+        collection_parser=CollectionParser,
+        middlewares=[],
+        error_parser=error_parser,
+    )
+    items: list[Any] = []
+    for page in proxy.collection_get_pages(prefetch=prefetch):
+        items.extend(page.unwrap())
+    assert items == [{"name": "alice"}, {"name": "bob"}, {"name": "charlie"}]
+    assert [req.url for req in tp.requests] == [
+        "http://dummy/",
+        "http://dummy/?page=2",
+        "http://dummy/?page=3",
+    ]
+
+
+def test_route_proxy_collection_get_pages_error() -> None:
+    tp = PaginatedTransport(
+        {
+            "http://dummy/": HTTPResponse(
+                200,
+                {"link": '<http://dummy/?page=2>; rel="next"'},
+                [{"name": "alice"}],
+            ),
+            "http://dummy/?page=2": HTTPResponse(
+                422, {}, {"message": "Bad Request", "detail": "Error detail"}
+            ),
+        }
+    )
+    proxy: SyncRouteProxy[Any, Any, Any] = SyncRouteProxy(
+        "dummy",
+        "dummies",
+        "http://dummy",
+        ApiRoutes(
+            None,
+            None,
+            collection_path="/",
+            collection_contract={"GET": (Request, None)},
+            collection_parser=None,
+        ),
+        transport=tp,
+        timeout=HTTPTimeout(),
+        collection_parser=CollectionParser,
+        middlewares=[],
+        error_parser=error_parser,
+    )
+    pages = [page for page in proxy.collection_get_pages()]
+    assert len(pages) == 2
+    assert pages[0].is_ok()
+    assert pages[1].unwrap_err() == MyErrorFormat(
+        message="Bad Request", detail="Error detail"
+    )
+
+
+def test_route_proxy_collection_get_pages_unregistered() -> None:
+    proxy: SyncRouteProxy[Any, Any, Any] = SyncRouteProxy(
+        "dummy",
+        "dummies",
+        "http://dummy/",
+        ApiRoutes("/", {"GET": (Request, None)}, None, None, None),
+        transport=FakeTransport(HTTPResponse(200, {}, [])),
+        timeout=HTTPTimeout(),
+        collection_parser=CollectionParser,
+        middlewares=[],
+        error_parser=error_parser,
+    )
+    with pytest.raises(UnregisteredRouteException):
+        proxy.collection_get_pages()
+
+
+@pytest.mark.parametrize("concurrency", [1, 2, 10])
+def test_route_proxy_collection_get_all_pages(concurrency: int) -> None:
+    tp = PaginatedTransport(
+        {
+            "http://dummy/": HTTPResponse(
+                200, {"Total-Count": "5"}, [{"name": "alice"}, {"name": "bob"}]
+            ),
+            "http://dummy/?offset=2": HTTPResponse(
+                200, {"Total-Count": "5"}, [{"name": "charlie"}, {"name": "dave"}]
+            ),
+            "http://dummy/?offset=4": HTTPResponse(
+                200, {"Total-Count": "5"}, [{"name": "eve"}]
+            ),
+        }
+    )
+    proxy: SyncRouteProxy[Any, Any, Any] = SyncRouteProxy(
+        "dummy",
+        "dummies",
+        "http://dummy",
+        ApiRoutes(
+            None,
+            None,
+            collection_path="/",
+            collection_contract={"GET": (Request, None)},
+            collection_parser=None,
+        ),
+        transport=tp,
+        timeout=HTTPTimeout(),
+        collection_parser=CollectionParser,
+        middlewares=[],
+        error_parser=error_parser,
+    )
+    items: list[Any] = []
+    for page in proxy.collection_get_all_pages(concurrency=concurrency):
+        items.extend(page.unwrap())
+    assert items == [
+        {"name": "alice"},
+        {"name": "bob"},
+        {"name": "charlie"},
+        {"name": "dave"},
+        {"name": "eve"},
+    ]
+    assert [req.querystring for req in tp.requests] == [
+        {},
+        {"offset": 2},
+        {"offset": 4},
+    ]
+
+
+def test_route_proxy_collection_get_all_pages_error() -> None:
+    tp = PaginatedTransport(
+        {
+            "http://dummy/": HTTPResponse(
+                200, {"Total-Count": "5"}, [{"name": "alice"}, {"name": "bob"}]
+            ),
+            "http://dummy/?offset=2": HTTPResponse(
+                422, {}, {"message": "Bad Request", "detail": "Error detail"}
+            ),
+            "http://dummy/?offset=4": HTTPResponse(
+                200, {"Total-Count": "5"}, [{"name": "eve"}]
+            ),
+        }
+    )
+    proxy: SyncRouteProxy[Any, Any, Any] = SyncRouteProxy(
+        "dummy",
+        "dummies",
+        "http://dummy",
+        ApiRoutes(
+            None,
+            None,
+            collection_path="/",
+            collection_contract={"GET": (Request, None)},
+            collection_parser=None,
+        ),
+        transport=tp,
+        timeout=HTTPTimeout(),
+        collection_parser=CollectionParser,
+        middlewares=[],
+        error_parser=error_parser,
+    )
+    pages = [page for page in proxy.collection_get_all_pages(concurrency=1)]
+    assert len(pages) == 2
+    assert pages[1].unwrap_err() == MyErrorFormat(
+        message="Bad Request", detail="Error detail"
+    )
+
+
+@pytest.mark.parametrize("concurrency", [1, 2, 10])
+def test_route_proxy_get_many(concurrency: int) -> None:
+    tp = PaginatedTransport(
+        {
+            "http://dummy/dummies/alice": HTTPResponse(
+                200, {}, {"name": "alice", "age": 24}
+            ),
+            "http://dummy/dummies/bob": HTTPResponse(
+                422, {}, {"message": "Bad Request", "detail": "Error detail"}
+            ),
+            "http://dummy/dummies/charlie": HTTPResponse(
+                200, {}, {"name": "charlie", "age": 42}
+            ),
+        }
+    )
+    proxy: SyncRouteProxy[Any, GetResponse, MyErrorFormat] = SyncRouteProxy(
+        "dummy",
+        "dummies",
+        "http://dummy",
+        ApiRoutes(
+            "/dummies/{name}",
+            {"GET": (GetParam, GetResponse)},
+            None,
+            None,
+            None,
+        ),
+        transport=tp,
+        timeout=HTTPTimeout(),
+        collection_parser=CollectionParser,
+        middlewares=[],
+        error_parser=error_parser,
+    )
+    resps = proxy.get_many(
+        [{"name": "alice"}, GetParam(name="bob"), {"name": "charlie"}],
+        concurrency=concurrency,
+    )
+    assert [resp.unwrap().as_result() for resp in resps] == [
+        Ok(GetResponse(name="alice", age=24)),
+        Err(MyErrorFormat(message="Bad Request", detail="Error detail")),
+        Ok(GetResponse(name="charlie", age=42)),
+    ]
+
+
+class SlowTransport(SyncAbstractTransport):
+    def __call__(
+        self,
+        req: HTTPRequest,
+        client_name: ClientName,
+        path: Path,
+        timeout: HTTPTimeout,
+    ) -> HTTPResponse:
+        if req.url.endswith("bob"):
+            raise HTTPTimeoutError(f"{req.url} timed out")
+        return HTTPResponse(200, {}, {"name": req.url.rsplit("/", 1)[-1], "age": 1})
+
+
+def test_route_proxy_get_many_error() -> None:
+    proxy: SyncRouteProxy[Any, GetResponse, MyErrorFormat] = SyncRouteProxy(
+        "dummy",
+        "dummies",
+        "http://dummy",
+        ApiRoutes(
+            "/dummies/{name}",
+            {"GET": (GetParam, GetResponse)},
+            None,
+            None,
+            None,
+        ),
+        transport=SlowTransport(),
+        timeout=HTTPTimeout(),
+        collection_parser=CollectionParser,
+        middlewares=[],
+        error_parser=error_parser,
+    )
+    resps = proxy.get_many(
+        [{"name": "alice"}, {"name": "bob"}, {"name": "charlie"}], concurrency=1
+    )
+    assert resps[0].unwrap().unwrap() == GetResponse(name="alice", age=1)
+    err = resps[1].unwrap_err()
+    assert isinstance(err, HTTPTimeoutError)
+    assert str(err) == "http://dummy/dummies/bob timed out"
+    assert resps[2].unwrap().unwrap() == GetResponse(name="charlie", age=1)
+
+
+class DummiesRequest(Request):
+    names: list[str] = QueryStringField(alias="name")
+
+
+class DummyCollectionTransport(SyncAbstractTransport):
+    def __init__(self, dummies: list[dict[str, Any]]) -> None:
+        super().__init__()
+        self.dummies = dummies
+        self.requests: list[HTTPRequest] = []
+
+    def __call__(
+        self,
+        req: HTTPRequest,
+        client_name: ClientName,
+        path: Path,
+        timeout: HTTPTimeout,
+    ) -> HTTPResponse:
+        self.requests.append(req)
+        if path == "/dummies":
+            names = cast(list[str], req.querystring["name"])
+            # the dummies without a name are always part of the collection
+            return HTTPResponse(
+                200,
+                {},
+                [
+                    dummy
+                    for dummy in self.dummies
+                    if dummy.get("name", names[0]) in names
+                ],
+            )
+        for dummy in self.dummies:
+            if "name" in dummy and req.url.endswith(f"/{dummy['name']}"):
+                return HTTPResponse(200, {}, dummy)
+        raise HTTPError(
+            "404 Not Found", req, HTTPResponse(404, {}, {"detail": "Not Found"})
+        )
+
+
+def test_route_proxy_batch_get() -> None:
+    tp = DummyCollectionTransport(
+        [{"name": "alice", "age": 24}, {"name": "bob", "age": 42}]
+    )
+    proxy: SyncRouteProxy[Any, GetResponse, MyErrorFormat] = SyncRouteProxy(
+        "dummy",
+        "dummies",
+        "http://dummy",
+        ApiRoutes(
+            "/dummies/{name}",
+            {"GET": (GetParam, GetResponse)},
+            "/dummies",
+            {"GET": (DummiesRequest, GetResponse)},
+            None,
+            BatchGet("name", max_batch_size=2),
+        ),
+        transport=tp,
+        timeout=HTTPTimeout(),
+        collection_parser=CollectionParser,
+        middlewares=[],
+        error_parser=error_parser,
+    )
+    resps = proxy.get_many(
+        [{"name": "alice"}, GetParam(name="charlie"), {"name": "bob"}]
+    )
+    assert resps[0].unwrap().unwrap() == GetResponse(name="alice", age=24)
+    assert resps[1].unwrap().raw_result.unwrap_err().status_code == 404
+    assert resps[1].unwrap().raw_result.unwrap_err().json == {"detail": "Not Found"}
+    assert resps[2].unwrap().unwrap() == GetResponse(name="bob", age=42)
+    if SyncBatch.coalesces:
+        assert {req.url for req in tp.requests} == {"http://dummy/dummies"}
+    else:
+        # the synchronous gets are never batched
+        assert sorted(req.url for req in tp.requests) == [
+            "http://dummy/dummies/alice",
+            "http://dummy/dummies/bob",
+            "http://dummy/dummies/charlie",
+        ]
+
+    resp = proxy.get({"name": "bob"}, timeout=10.0)
+    assert resp.unwrap() == GetResponse(name="bob", age=42)
+    assert tp.requests[-1].url == "http://dummy/dummies/bob"
+
+
+class TimeoutTransport(SyncAbstractTransport):
+    def __init__(self) -> None:
+        super().__init__()
+        self.timeouts: list[HTTPTimeout] = []
+
+    def __call__(
+        self,
+        req: HTTPRequest,
+        client_name: ClientName,
+        path: Path,
+        timeout: HTTPTimeout,
+    ) -> HTTPResponse:
+        self.timeouts.append(timeout)
+        return HTTPResponse(200, {}, {})
+
+
+def test_route_proxy_route_options() -> None:
+    tp = TimeoutTransport()
+    proxy: SyncRouteProxy[Any, GetResponse, MyErrorFormat] = SyncRouteProxy(
+        "dummy",
+        "dummies",
+        "http://dummy",
+        ApiRoutes(
+            "/dummies/{name}",
+            {"GET": (GetParam, GetResponse), "DELETE": (GetParam, None)},
+            "/dummies",
+            {"GET": (Request, GetResponse)},
+            None,
+            options={"GET": RouteOptions(timeout=HTTPTimeout(1.0))},
+            collection_options=RouteOptions(timeout=HTTPTimeout(60.0)),
+        ),
+        transport=tp,
+        timeout=HTTPTimeout(),
+        collection_parser=CollectionParser,
+        middlewares=[],
+        error_parser=error_parser,
+    )
+    proxy.get({"name": "alice"})
+    proxy.delete({"name": "alice"})
+    proxy.get({"name": "alice"}, timeout=10.0)
+    proxy.collection_get()
+    for _ in proxy.collection_get_pages():
+        pass
+    assert tp.timeouts == [
+        HTTPTimeout(1.0),
+        HTTPTimeout(),
+        HTTPTimeout(10.0),
+        HTTPTimeout(60.0),
+        HTTPTimeout(60.0),
+    ]
+
+
+class TenantGetParam(Request):
+    name: str = PathInfoField()
+    tenant: str = HeaderField(alias="X-Tenant")
+    fields: str | None = QueryStringField(None)
+
+
+class TenantDummiesRequest(Request):
+    names: list[str] = QueryStringField(alias="name")
+    tenant: str = HeaderField(alias="X-Tenant")
+    fields: str | None = QueryStringField(None)
+
+
+def test_route_proxy_batch_get_params() -> None:
+    tp = DummyCollectionTransport(
+        [{"name": "alice", "age": 24}, {"name": "bob", "age": 42}]
+    )
+    proxy: SyncRouteProxy[Any, GetResponse, MyErrorFormat] = SyncRouteProxy(
+        "dummy",
+        "dummies",
+        "http://dummy",
+        ApiRoutes(
+            "/dummies/{name}",
+            {"GET": (TenantGetParam, GetResponse)},
+            "/dummies",
+            {"GET": (TenantDummiesRequest, GetResponse)},
+            None,
+            BatchGet("name"),
+        ),
+        transport=tp,
+        timeout=HTTPTimeout(),
+        collection_parser=CollectionParser,
+        middlewares=[],
+        error_parser=error_parser,
+    )
+    resps = proxy.get_many(
+        [
+            {"name": "alice", "X-Tenant": "A", "fields": "name"},
+            {"name": "bob", "X-Tenant": "B", "fields": "name"},
+            {"name": "bob", "X-Tenant": "A", "fields": "name"},
+        ]
+    )
+    assert [resp.unwrap().unwrap().name for resp in resps] == ["alice", "bob", "bob"]
+    if SyncBatch.coalesces:
+        # the gets are batched per tenant, the other params are forwarded
+        assert {
+            (req.headers["X-Tenant"], name)
+            for req in tp.requests
+            for name in cast(list[str], req.querystring["name"])
+        } == {("A", "alice"), ("A", "bob"), ("B", "bob")}
+        assert {req.querystring["fields"] for req in tp.requests} == {"name"}
+        assert {req.url for req in tp.requests} == {"http://dummy/dummies"}
+    else:
+        assert sorted((req.url, req.headers["X-Tenant"]) for req in tp.requests) == [
+            ("http://dummy/dummies/alice", "A"),
+            ("http://dummy/dummies/bob", "A"),
+            ("http://dummy/dummies/bob", "B"),
+        ]
+    assert proxy._batches == {}
+
+    with pytest.raises(ValidationError):
+        proxy.get({"X-Tenant": "A"})
+
+
+def test_route_proxy_batch_get_deadline() -> None:
+    tp = DummyCollectionTransport(
+        [{"name": "alice", "age": 24}, {"name": "bob", "age": 42}]
+    )
+    proxy: SyncRouteProxy[Any, GetResponse, MyErrorFormat] = SyncRouteProxy(
+        "dummy",
+        "dummies",
+        "http://dummy",
+        ApiRoutes(
+            "/dummies/{name}",
+            {"GET": (GetParam, GetResponse)},
+            "/dummies",
+            {"GET": (DummiesRequest, GetResponse)},
+            None,
+            BatchGet("name"),
+        ),
+        transport=tp,
+        timeout=HTTPTimeout(),
+        collection_parser=CollectionParser,
+        middlewares=[],
+        error_parser=error_parser,
+    )
+    # the collection_get would run under the deadline of one of the gets
+    with Deadline(10):
+        resps = proxy.get_many([{"name": "alice"}, {"name": "bob"}])
+    assert [resp.unwrap().unwrap().name for resp in resps] == ["alice", "bob"]
+    assert sorted(req.url for req in tp.requests) == [
+        "http://dummy/dummies/alice",
+        "http://dummy/dummies/bob",
+    ]
+
+
+def test_route_proxy_batch_get_missing_response_key() -> None:
+    tp = DummyCollectionTransport([{"age": 0}, {"name": "alice", "age": 24}])
+    proxy: SyncRouteProxy[Any, GetResponse, MyErrorFormat] = SyncRouteProxy(
+        "dummy",
+        "dummies",
+        "http://dummy",
+        ApiRoutes(
+            "/dummies/{name}",
+            {"GET": (GetParam, GetResponse)},
+            "/dummies",
+            {"GET": (DummiesRequest, GetResponse)},
+            None,
+            BatchGet("name"),
+        ),
+        transport=tp,
+        timeout=HTTPTimeout(),
+        collection_parser=CollectionParser,
+        middlewares=[],
+        error_parser=error_parser,
+    )
+    resps = proxy.get_many([{"name": "alice"}, {"name": "bob"}])
+    assert resps[0].unwrap().unwrap() == GetResponse(name="alice", age=24)
+    assert resps[1].unwrap().raw_result.unwrap_err().status_code == 404
+
+
+def test_route_proxy_batch_get_unbatchable_params() -> None:
+    tp = DummyCollectionTransport(
+        [{"name": "alice", "age": 24}, {"name": "bob", "age": 42}]
+    )
+    proxy: SyncRouteProxy[Any, GetResponse, MyErrorFormat] = SyncRouteProxy(
+        "dummy",
+        "dummies",
+        "http://dummy",
+        ApiRoutes(
+            "/dummies/{name}",
+            {"GET": (TenantGetParam, GetResponse)},
+            "/dummies",
+            # the tenant can't be sent in the collection_get
+            {"GET": (DummiesRequest, GetResponse)},
+            None,
+            BatchGet("name"),
+        ),
+        transport=tp,
+        timeout=HTTPTimeout(),
+        collection_parser=CollectionParser,
+        middlewares=[],
+        error_parser=error_parser,
+    )
+    resps = proxy.get_many(
+        [{"name": "alice", "X-Tenant": "A"}, {"name": "bob", "X-Tenant": "B"}]
+    )
+    assert [resp.unwrap().unwrap().name for resp in resps] == ["alice", "bob"]
+    assert sorted((req.url, req.headers["X-Tenant"]) for req in tp.requests) == [
+        ("http://dummy/dummies/alice", "A"),
+        ("http://dummy/dummies/bob", "B"),
+    ]
+
+
 def test_route_proxy_collection_get_with_parser() -> None:
     class MyCollectionParser(CollectionParser):
         total_count_header: str = "X-Total-Count"
@@ -669,3 +1340,36 @@ def test_unregistered_collection(echo_middleware: SyncAbstractTransport):
             str(ctx.value) == f"Unregistered route '{verb.upper()}' "
             f"in resource 'dummies' in client 'dummy'"
         )
+
+
+def test_route_proxy_deadline() -> None:
+    tp = TimeoutTransport()
+    proxy: SyncRouteProxy[Any, Any, Any] = SyncRouteProxy(
+        "dummy",
+        "dummies",
+        "http://dummy/",
+        ApiRoutes(
+            path="/",
+            contract={"GET": (Request, None)},
+            collection_contract=None,
+            collection_path=None,
+            collection_parser=None,
+        ),
+        transport=tp,
+        timeout=HTTPTimeout(10, 5),
+        collection_parser=CollectionParser,
+        middlewares=[],
+        error_parser=error_parser,
+    )
+    proxy.get({})
+    with Deadline(2):
+        proxy.get({})
+    assert tp.timeouts[0] == HTTPTimeout(10, 5)
+    assert tp.timeouts[1].read <= 2
+    assert tp.timeouts[1].connect <= 2
+
+    with Deadline(0):
+        with pytest.raises(DeadlineExceededError) as ctx:
+            proxy.get({})
+    assert str(ctx.value) == "dummy - GET / - Deadline exceeded"
+    assert len(tp.timeouts) == 2
@@ -0,0 +1,505 @@
+import asyncio
+import contextvars
+import threading
+import time
+from collections.abc import AsyncIterator, Iterator
+from typing import Any
+
+import pytest
+
+from blacksmith.shared_utils.concurrency import (
+    AsyncBatch,
+    AsyncHedge,
+    AsyncLimiter,
+    AsyncMap,
+    AsyncPrefetch,
+    AsyncSingleFlight,
+    AsyncWaitFor,
+    SyncBatch,
+    SyncHedge,
+    SyncLimiter,
+    SyncMap,
+    SyncPrefetch,
+    SyncSingleFlight,
+)
+
+
+async def test_async_prefetch() -> None:
+    produced: list[int] = []
+
+    async def gen() -> AsyncIterator[int]:
+        for i in range(5):
+            produced.append(i)
+            yield i
+
+    consumed = []
+    async for i in AsyncPrefetch(gen(), 2):
+        consumed.append(i)
+        # the caller consumed i, 2 items may have been consumed ahead.
+        assert len(produced) <= i + 3
+    assert consumed == [0, 1, 2, 3, 4]
+
+
+async def test_async_prefetch_break() -> None:
+    produced: list[int] = []
+
+    async def gen() -> AsyncIterator[int]:
+        for i in range(100):
+            produced.append(i)
+            yield i
+
+    prefetch = AsyncPrefetch(gen(), 1)
+    async for i in prefetch:
+        if i == 3:
+            break
+    await prefetch.aclose()  # type: ignore
+    assert len(produced) <= 5
+
+
+async def test_async_prefetch_error() -> None:
+    async def gen() -> AsyncIterator[int]:
+        yield 1
+        raise ValueError("boom")
+
+    consumed = []
+    with pytest.raises(ValueError):
+        async for i in AsyncPrefetch(gen(), 1):
+            consumed.append(i)
+    assert consumed == [1]
+
+
+def test_sync_prefetch() -> None:
+    def gen() -> Iterator[int]:
+        yield from range(5)
+
+    assert list(SyncPrefetch(gen(), 2)) == [0, 1, 2, 3, 4]
+
+
+def test_sync_prefetch_error() -> None:
+    def gen() -> Iterator[int]:
+        yield 1
+        raise ValueError("boom")
+
+    consumed = []
+    with pytest.raises(ValueError):
+        for i in SyncPrefetch(gen(), 1):
+            consumed.append(i)
+    assert consumed == [1]
+
+
+async def test_async_map() -> None:
+    running = 0
+    max_running = 0
+
+    async def double(i: int) -> int:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(running, max_running)
+        # the first items are the slowest
+        await asyncio.sleep(0.001 * (10 - i))
+        running -= 1
+        return i * 2
+
+    results = [i async for i in AsyncMap(double, range(10), 3)]
+    assert results == [i * 2 for i in range(10)]
+    assert max_running == 3
+
+
+async def test_async_map_break() -> None:
+    started: list[int] = []
+
+    async def identity(i: int) -> int:
+        started.append(i)
+        await asyncio.sleep(0)
+        return i
+
+    results = AsyncMap(identity, range(100), 2)
+    async for i in results:
+        if i == 3:
+            break
+    await results.aclose()  # type: ignore
+    assert len(started) <= 6
+
+
+def test_sync_map() -> None:
+    lock = threading.Lock()
+    running = 0
+    max_running = 0
+
+    def double(i: int) -> int:
+        nonlocal running, max_running
+        with lock:
+            running += 1
+            max_running = max(running, max_running)
+        time.sleep(0.001 * (10 - i))
+        with lock:
+            running -= 1
+        return i * 2
+
+    results = list(SyncMap(double, range(10), 3))
+    assert results == [i * 2 for i in range(10)]
+    assert max_running <= 3
+
+
+def test_sync_map_error() -> None:
+    def fail(i: int) -> int:
+        if i == 2:
+            raise ValueError("boom")
+        return i
+
+    consumed = []
+    with pytest.raises(ValueError):
+        for i in SyncMap(fail, range(5), 2):
+            consumed.append(i)
+    assert consumed == [0, 1]
+
+
+async def test_async_batch() -> None:
+    loaded: list[list[int]] = []
+
+    async def load(keys: list[int]) -> list[int]:
+        loaded.append(keys)
+        return [key * 2 for key in keys]
+
+    batch = AsyncBatch(load, 3)
+    assert batch.pending == 0
+    results = await asyncio.gather(*(batch(i) for i in range(5)))
+    assert results == [0, 2, 4, 6, 8]
+    assert loaded == [[0, 1, 2], [3, 4]]
+    assert batch.pending == 0
+
+    assert await batch(5) == 10
+    assert loaded[-1] == [5]
+
+
+async def test_async_batch_error() -> None:
+    async def load(keys: list[int]) -> list[int]:
+        raise ValueError("boom")
+
+    batch = AsyncBatch(load, 10)
+    results = await asyncio.gather(batch(1), batch(2), return_exceptions=True)
+    assert [type(res) for res in results] == [ValueError, ValueError]
+
+
+def test_sync_batch() -> None:
+    loaded: list[list[int]] = []
+
+    def load(keys: list[int]) -> list[int]:
+        loaded.append(keys)
+        return [key * 2 for key in keys]
+
+    batch = SyncBatch(load, 3)
+    assert [batch(i) for i in range(3)] == [0, 2, 4]
+    assert loaded == [[0], [1], [2]]
+
+
+async def test_async_single_flight() -> None:
+    calls: list[str] = []
+
+    async def load(key: str) -> str:
+        calls.append(key)
+        await asyncio.sleep(0.01)
+        return key.upper()
+
+    flights: AsyncSingleFlight[str] = AsyncSingleFlight()
+    results = await asyncio.gather(
+        flights("a", lambda: load("a")),
+        flights("a", lambda: load("a")),
+        flights("b", lambda: load("b")),
+    )
+    assert results == [("A", False), ("A", True), ("B", False)]
+    assert calls == ["a", "b"]
+
+    # the flight is over, the next call is a new leader
+    assert await flights("a", lambda: load("a")) == ("A", False)
+
+
+async def test_async_single_flight_error() -> None:
+    async def fail() -> str:
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    flights: AsyncSingleFlight[str] = AsyncSingleFlight()
+    results = await asyncio.gather(
+        flights("a", fail), flights("a", fail), return_exceptions=True
+    )
+    assert [type(res) for res in results] == [ValueError, ValueError]
+
+    with pytest.raises(ValueError):
+        await flights("a", fail)
+
+
+async def test_async_single_flight_leader_cancelled() -> None:
+    calls = 0
+
+    async def load() -> str:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return "a"
+
+    flights: AsyncSingleFlight[str] = AsyncSingleFlight()
+    leader = asyncio.ensure_future(flights("a", load))
+    await asyncio.sleep(0)
+    follower = asyncio.ensure_future(flights("a", load))
+    await asyncio.sleep(0)
+    leader.cancel()
+    assert await follower == ("a", False)
+    assert calls == 2
+
+
+async def test_async_single_flight_follower_timeout() -> None:
+    async def load() -> str:
+        await asyncio.sleep(0.2)
+        return "A"
+
+    flights: AsyncSingleFlight[str] = AsyncSingleFlight()
+    leader = asyncio.ensure_future(flights("a", load))
+    await asyncio.sleep(0)
+    start = time.perf_counter()
+    with pytest.raises(TimeoutError):
+        await flights("a", load, 0.05)
+    assert time.perf_counter() - start < 0.15
+    # the leader is not cancelled by the follower
+    assert await leader == ("A", False)
+
+
+def test_sync_single_flight_follower_timeout() -> None:
+    started = threading.Event()
+
+    def load() -> str:
+        started.set()
+        time.sleep(0.2)
+        return "A"
+
+    flights: SyncSingleFlight[str] = SyncSingleFlight()
+    results: list[tuple[str, bool]] = []
+    leader = threading.Thread(target=lambda: results.append(flights("a", load)))
+    leader.start()
+    started.wait(1)
+    start = time.perf_counter()
+    with pytest.raises(TimeoutError):
+        flights("a", load, 0.05)
+    assert time.perf_counter() - start < 0.15
+    leader.join()
+    assert results == [("A", False)]
+
+
+def test_sync_single_flight() -> None:
+    started = threading.Event()
+    release = threading.Event()
+    calls: list[str] = []
+
+    def load() -> str:
+        calls.append("a")
+        started.set()
+        release.wait(1)
+        return "A"
+
+    flights: SyncSingleFlight[str] = SyncSingleFlight()
+    results: list[tuple[str, bool]] = []
+    leader = threading.Thread(target=lambda: results.append(flights("a", load)))
+    leader.start()
+    started.wait(1)
+    follower = threading.Thread(target=lambda: results.append(flights("a", load)))
+    follower.start()
+    time.sleep(0.01)
+    release.set()
+    leader.join()
+    follower.join()
+    assert sorted(results) == [("A", False), ("A", True)]
+    assert calls == ["a"]
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        pytest.param(
+            {"latencies": [0, 0], "can_hedge": True, "expected": ("0", False)},
+            id="fast",
+        ),
+        pytest.param(
+            {"latencies": [0.1, 0], "can_hedge": True, "expected": ("1", True)},
+            id="hedged",
+        ),
+        pytest.param(
+            {"latencies": [0.1, 0], "can_hedge": False, "expected": ("0", False)},
+            id="no budget",
+        ),
+        pytest.param(
+            {"latencies": [0.02, 0.1], "can_hedge": True, "expected": ("0", False)},
+            id="hedged but slower",
+        ),
+    ],
+)
+async def test_async_hedge(params: dict[str, Any]) -> None:
+    calls: list[int] = []
+
+    async def call() -> str:
+        idx = len(calls)
+        calls.append(idx)
+        await asyncio.sleep(params["latencies"][idx])
+        return str(idx)
+
+    result = await AsyncHedge(call, 0.01, lambda: params["can_hedge"])
+    assert result == params["expected"]
+
+
+async def test_async_hedge_error() -> None:
+    calls: list[int] = []
+
+    async def first_fail() -> str:
+        idx = len(calls)
+        calls.append(idx)
+        if idx == 0:
+            await asyncio.sleep(0.02)
+            raise ValueError("boom")
+        await asyncio.sleep(0.05)
+        return str(idx)
+
+    assert await AsyncHedge(first_fail, 0.01, lambda: True) == ("1", True)
+
+    async def fail() -> str:
+        await asyncio.sleep(0.02)
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        await AsyncHedge(fail, 0.01, lambda: True)
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        pytest.param(
+            {"latencies": [0, 0], "can_hedge": True, "expected": ("0", False)},
+            id="fast",
+        ),
+        pytest.param(
+            {"latencies": [0.1, 0], "can_hedge": True, "expected": ("1", True)},
+            id="hedged",
+        ),
+        pytest.param(
+            {"latencies": [0.1, 0], "can_hedge": False, "expected": ("0", False)},
+            id="no budget",
+        ),
+    ],
+)
+def test_sync_hedge(params: dict[str, Any]) -> None:
+    lock = threading.Lock()
+    calls: list[int] = []
+
+    def call() -> str:
+        with lock:
+            idx = len(calls)
+            calls.append(idx)
+        time.sleep(params["latencies"][idx])
+        return str(idx)
+
+    result = SyncHedge(call, 0.01, lambda: params["can_hedge"])
+    assert result == params["expected"]
+
+
+def test_sync_hedge_error() -> None:
+    def fail() -> str:
+        time.sleep(0.02)
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        SyncHedge(fail, 0.01, lambda: True)
+
+
+async def test_async_limiter() -> None:
+    limiter = AsyncLimiter(1, max_queue=1)
+    assert await limiter.acquire() is True
+    waiting = asyncio.ensure_future(limiter.acquire())
+    await asyncio.sleep(0)
+    assert limiter.queued == 1
+
+    # the queue is full
+    assert await limiter.acquire() is False
+
+    limiter.release()
+    assert await waiting is True
+    assert (limiter.inflight, limiter.queued) == (1, 0)
+
+
+async def test_async_limiter_increase() -> None:
+    limiter = AsyncLimiter(1, max_queue=2)
+    assert await limiter.acquire() is True
+    waiting = [asyncio.ensure_future(limiter.acquire()) for _ in range(2)]
+    await asyncio.sleep(0)
+    assert limiter.queued == 2
+    limiter.limit = 3
+    assert await asyncio.gather(*waiting) == [True, True]
+    assert limiter.inflight == 3
+
+
+async def test_async_limiter_queue_timeout() -> None:
+    limiter = AsyncLimiter(1, max_queue=1, queue_timeout=0.01)
+    assert await limiter.acquire() is True
+    assert await limiter.acquire() is False
+    assert (limiter.inflight, limiter.queued) == (1, 0)
+
+
+async def test_async_limiter_cancelled() -> None:
+    limiter = AsyncLimiter(1, max_queue=1)
+    assert await limiter.acquire() is True
+    waiting = asyncio.ensure_future(limiter.acquire())
+    await asyncio.sleep(0)
+    waiting.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiting
+    assert limiter.queued == 0
+    limiter.release()
+    assert limiter.inflight == 0
+
+
+def test_sync_limiter() -> None:
+    limiter = SyncLimiter(1, max_queue=1)
+    assert limiter.acquire() is True
+    results: list[bool] = []
+    thread = threading.Thread(target=lambda: results.append(limiter.acquire()))
+    thread.start()
+    while not limiter.queued:
+        time.sleep(0.001)
+
+    # the queue is full
+    assert limiter.acquire() is False
+
+    limiter.release()
+    thread.join()
+    assert results == [True]
+    assert (limiter.inflight, limiter.queued) == (1, 0)
+
+
+def test_sync_limiter_queue_timeout() -> None:
+    limiter = SyncLimiter(1, max_queue=1, queue_timeout=0.01)
+    assert limiter.acquire() is True
+    assert limiter.acquire() is False
+    assert (limiter.inflight, limiter.queued) == (1, 0)
+    limiter.limit = 2
+    assert limiter.acquire() is True
+
+
+def test_sync_context_propagation() -> None:
+    var: contextvars.ContextVar[str] = contextvars.ContextVar("var", default="")
+    var.set("caller")
+    assert list(SyncMap(lambda _: var.get(), range(2), 2)) == ["caller", "caller"]
+    assert SyncHedge(var.get, 1, lambda: False) == ("caller", False)
+
+    def gen() -> Iterator[str]:
+        yield var.get()
+
+    assert list(SyncPrefetch(gen(), 1)) == ["caller"]
+
+
+async def test_async_wait_for() -> None:
+    async def func(delay: float) -> float:
+        await asyncio.sleep(delay)
+        return delay
+
+    assert await AsyncWaitFor(lambda: func(0), 0.1) == 0
+    start = time.perf_counter()
+    with pytest.raises(TimeoutError):
+        await AsyncWaitFor(lambda: func(1), 0.05)
+    assert time.perf_counter() - start < 0.5
@@ -1,6 +1,7 @@
 import json
 from collections.abc import Mapping, Sequence
-from datetime import datetime
+from datetime import datetime, timezone
+from decimal import Decimal
 from typing import Any
 
 import pytest
@@ -24,6 +25,8 @@ from blacksmith.service.http_body_serializer import (
     JsonRequestSerializer,
     UrlencodedRequestSerializer,
     get_location,
+    get_serialization_plan,
+    is_json_native,
     register_http_body_serializer,
     serialize_part,
     serialize_request,
@@ -64,6 +67,10 @@ class DummyComplex(BaseModel):
     name: str
 
 
+class DummyDecimal(BaseModel):
+    amount: Decimal
+
+
 class DummyComplexAttachement(Request):
     foo: DummyComplex = PostBodyField()
     bar: Attachment = AttachmentField()
@@ -246,6 +253,197 @@ def test_serialize_part_default_with_none() -> None:
     }
 
 
+def test_serialization_plan() -> None:
+    plan = get_serialization_plan(DummyAttachement)
+    assert get_serialization_plan(DummyAttachement) is plan
+    assert plan.fields_by_loc == {
+        "header": {},
+        "path": {},
+        "query": {},
+        "body": {"foo": ...},
+        "attachment": {"bar": ...},
+    }
+    assert plan.keys == [("foo", "body")]
+
+    plan = get_serialization_plan(DummyAliasRequestTypes)
+    assert plan.keys == [("for", "query")]
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        pytest.param({"type": str, "expected": True}, id="str"),
+        pytest.param({"type": int | None, "expected": True}, id="optional"),
+        pytest.param({"type": list[str], "expected": True}, id="list"),
+        pytest.param({"type": dict[str, int], "expected": True}, id="dict"),
+        pytest.param({"type": DummyComplex, "expected": False}, id="model"),
+        pytest.param({"type": SecretStr | None, "expected": False}, id="secret"),
+        pytest.param({"type": dict[str, Decimal], "expected": False}, id="decimal"),
+        pytest.param({"type": DummyDecimal, "expected": False}, id="nested"),
+        pytest.param({"type": float, "expected": False}, id="float"),
+        pytest.param({"type": list[datetime], "expected": False}, id="datetime"),
+        pytest.param({"type": Any, "expected": False}, id="any"),
+        pytest.param({"type": dict[str, Any], "expected": False}, id="dict-any"),
+        pytest.param({"type": object, "expected": False}, id="object"),
+        pytest.param({"type": dict, "expected": False}, id="bare-dict"),
+    ],
+)
+def test_is_json_native(params: Mapping[str, Any]) -> None:
+    assert is_json_native(params["type"]) is params["expected"]
+
+
+def test_serialize_request_json_body() -> None:
+    class Dummy(Request):
+        name: str = PathInfoField()
+        city: str | None = PostBodyField(None)
+        state: str | None = PostBodyField(None)
+        age: int = PostBodyField(10)
+        tags: list[str] | None = PostBodyField(None)
+
+    assert get_serialization_plan(Dummy).json_body is True
+    req = serialize_request(
+        "POST",
+        "/{name}",
+        Dummy(name="Jane", state=None, tags=["x"]),
+    )
+    assert req.path == {"name": "Jane"}
+    assert req.body == b'{"state":null,"age":10,"tags":["x"]}'
+
+    req = serialize_request("POST", "/{name}", Dummy(name="Jane"))
+    assert req.body == b'{"age":10}'
+
+
+class GoldenNested(BaseModel):
+    label: str
+    note: str | None = None
+
+
+class GoldenRequest(Request):
+    name: str = PathInfoField()
+    first: str = PostBodyField("a")
+    second: int = PostBodyField()
+    third: str | None = PostBodyField(None)
+    fourth: int = PostBodyField(4)
+    extra: Any = PostBodyField(None)
+    ratio: float | None = PostBodyField(None)
+    at: datetime | None = PostBodyField(None)
+    nested: GoldenNested | None = PostBodyField(None)
+
+
+@pytest.mark.parametrize(
+    "req",
+    [
+        pytest.param(GoldenRequest(name="n", second=2), id="unset"),
+        pytest.param(
+            GoldenRequest(name="n", second=2, fourth=5, third="c"), id="key-order"
+        ),
+        pytest.param(
+            GoldenRequest(name="n", second=2, extra={"amount": Decimal("1.5")}),
+            id="any-decimal",
+        ),
+        pytest.param(
+            GoldenRequest(name="n", second=2, ratio=float("inf")), id="infinity"
+        ),
+        pytest.param(
+            GoldenRequest(
+                name="n",
+                second=2,
+                at=datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+            ),
+            id="utc-datetime",
+        ),
+        pytest.param(
+            GoldenRequest(name="n", second=2, nested=GoldenNested(label="x")),
+            id="nested",
+        ),
+    ],
+)
+def test_serialize_request_json_body_golden(req: GoldenRequest) -> None:
+    plan = get_serialization_plan(GoldenRequest)
+    legacy = json.dumps(
+        serialize_part(req, plan.fields_by_loc[BODY], BODY), cls=JSONEncoder
+    )
+    body = serialize_request("POST", "/{name}", req).body
+    assert isinstance(body, str | bytes)
+    assert json.loads(body, object_pairs_hook=list) == json.loads(
+        legacy, object_pairs_hook=list
+    )
+
+
+def test_serialize_request_json_body_golden_fast_path() -> None:
+    class Dummy(Request):
+        first: str = PostBodyField("a")
+        second: int = PostBodyField()
+        third: str | None = PostBodyField(None)
+        fourth: list[str] = PostBodyField(default_factory=list)
+
+    plan = get_serialization_plan(Dummy)
+    assert plan.json_body is True
+    for req in (
+        Dummy(second=2),
+        Dummy(second=2, fourth=["x"], third="c"),
+        Dummy(fourth=["x"], second=2, first="b"),
+    ):
+        legacy = json.dumps(
+            serialize_part(req, plan.fields_by_loc[BODY], BODY), cls=JSONEncoder
+        )
+        body = serialize_request("POST", "/", req).body
+        assert isinstance(body, bytes)
+        assert json.loads(body, object_pairs_hook=list) == json.loads(
+            legacy, object_pairs_hook=list
+        )
+
+
+def test_serialize_request_legacy_json_body() -> None:
+    class Dummy(Request):
+        secret: SecretStr = PostBodyField()
+        amount: Decimal = PostBodyField()
+
+    assert get_serialization_plan(Dummy).json_body is False
+    req = serialize_request(
+        "POST", "/", Dummy(secret=SecretStr("s3cr3t"), amount=Decimal("4.2"))
+    )
+    assert req.body == '{"secret": "s3cr3t", "amount": 4.2}'
+
+
+def test_serialize_request_custom_json_serializer() -> None:
+    class MyJsonSerializer(JsonRequestSerializer):
+        def serialize(self, body: dict[str, Any] | Sequence[Any]) -> str:
+            return json.dumps({"wrapped": body})
+
+    srlz = MyJsonSerializer()
+    register_http_body_serializer(srlz)
+    try:
+        req = serialize_request(
+            "POST",
+            "/{name}",
+            DummyPostRequest(secret=SecretStr("yolo"), bar=1, name="jon", foo="bar"),
+        )
+    finally:
+        unregister_http_body_serializer(srlz)
+    assert req.headers == {"secret": "yolo"}
+    assert req.body == '{"wrapped": {"foo": "bar"}}'
+
+
+def test_serialization_plan_split() -> None:
+    class Dummy(Request):
+        x_message_id: int = HeaderField(default=123, alias="X-Message-Id")
+        name: str = PathInfoField()
+        q: str | None = QueryStringField(None)
+        city: str | None = PostBodyField(None)
+        state: str | None = PostBodyField(None)
+        nested: DummyComplex | None = PostBodyField(None)
+
+    dummy = Dummy(name="Jane", state=None, nested={"name": "x"})  # type: ignore
+    parts = get_serialization_plan(Dummy).split(dummy)
+    assert parts == {
+        "header": {"X-Message-Id": 123},
+        "path": {"name": "Jane"},
+        "query": {},
+        "body": {"state": None, "nested": {"name": "x"}},
+    }
+
+
 @pytest.mark.parametrize(
     "params",
     [
@@ -356,7 +554,7 @@ def test_serialize_request_body_pydantic_2(params: Mapping[str, Any]):
                     method="POST",
                     headers={"secret": "yolo"},
                     path={"name": "jon"},
-                    body='{"foo": "bar"}',
+                    body=b'{"foo":"bar"}',
                     querystring={"bar": 1},
                     url_pattern="/{name}",
                 ),
@@ -505,7 +703,7 @@ def test_register_serializer():
         DummyPostRequestXML(foo="bar", **{"Content-Type": "application/json"}),
     )
 
-    assert httpreq.body == '{"foo": "bar"}'
+    assert httpreq.body == b'{"foo":"bar"}'
 
     unregister_http_body_serializer(srlz)
 
@@ -575,3 +773,64 @@ def test_register_serializer():
 def test_serialize_response(params: Mapping[str, Any]):
     resp = serialize_response(params["raw_response"])
     assert resp == params["expected"]
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        pytest.param(
+            {
+                "raw_response": DummyHTTPRepsonse(
+                    200, {"Content-Type": "application/json"}, '{"foo": "bar"}'
+                ),
+                "expected_content": b'{"foo": "bar"}',
+                "expected": HTTPResponse(
+                    200, {"Content-Type": "application/json"}, {"foo": "bar"}
+                ),
+            },
+            id="json",
+        ),
+        pytest.param(
+            {
+                "raw_response": DummyHTTPRepsonse(
+                    200, {"Content-Type": "application/json"}, '{"foo": "bar"'
+                ),
+                "expected_content": b'{"foo": "bar"',
+                "expected": HTTPResponse(
+                    200,
+                    {"Content-Type": "application/json"},
+                    {"error": '{"foo": "bar"'},
+                ),
+            },
+            id="bad json",
+        ),
+        pytest.param(
+            {
+                "raw_response": DummyHTTPRepsonse(
+                    200,
+                    {"Content-Type": "application/x-www-form-urlencoded"},
+                    "x=42&y=1",
+                ),
+                "expected_content": None,
+                "expected": HTTPResponse(
+                    200,
+                    {"Content-Type": "application/x-www-form-urlencoded"},
+                    {"x": ["42"], "y": ["1"]},
+                ),
+            },
+            id="urlencoded",
+        ),
+        pytest.param(
+            {
+                "raw_response": DummyHTTPRepsonse(204, {}, ""),
+                "expected_content": None,
+                "expected": HTTPResponse(204, {}, ""),
+            },
+            id="nocontent",
+        ),
+    ],
+)
+def test_serialize_response_lazy_json(params: Mapping[str, Any]):
+    resp = serialize_response(params["raw_response"], lazy_json=True)
+    assert resp.content == params["expected_content"]
+    assert resp == params["expected"]
@@ -6,6 +6,9 @@ from pydantic import BaseModel, ValidationError
 
 from blacksmith.shared_utils.introspection import (
     build_pydantic_union,
+    build_pydantic_union_from_json,
+    get_discriminator,
+    get_union_adapter,
     is_instance_with_union,
     is_union,
 )
@@ -19,6 +22,18 @@ class Bar(BaseModel):
     typ: Literal["bar"]
 
 
+class Baz(BaseModel):
+    typ: Literal["foo", "baz"]
+
+
+class DefaultBar(BaseModel):
+    typ: Literal["bar"] = "bar"
+
+
+class Untagged(BaseModel):
+    name: str
+
+
 @pytest.mark.parametrize(
     "params",
     [
@@ -72,6 +87,28 @@ def test_build_pydantic_uniont_error(params: Mapping[str, Any]):
     assert str(ctx.value.errors()[0]["msg"]) == params["err"]
 
 
+@pytest.mark.parametrize(
+    "params",
+    [
+        pytest.param(
+            {"type": Foo, "content": b'{"typ": "foo"}', "expected": Foo(typ="foo")},
+            id="simple",
+        ),
+        pytest.param(
+            {
+                "type": Foo | Bar,
+                "content": b'{"typ": "bar"}',
+                "expected": Bar(typ="bar"),
+            },
+            id="union",
+        ),
+    ],
+)
+def test_build_pydantic_union_from_json(params: Mapping[str, Any]):
+    req = build_pydantic_union_from_json(params["type"], params["content"])
+    assert req == params["expected"]
+
+
 @pytest.mark.parametrize(
     "params",
     [
@@ -113,3 +150,26 @@ def test_is_instance_with_union(params: Mapping[str, Any]):
 )
 def test_is_union(params: Mapping[str, Any]):
     assert is_union(params["type"]) is params["expected"]
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        pytest.param({"members": (Foo, Bar), "expected": "typ"}, id="tagged"),
+        pytest.param({"members": (Foo, Baz), "expected": None}, id="same tag"),
+        pytest.param({"members": (Foo, Untagged), "expected": None}, id="untagged"),
+        pytest.param({"members": (Foo, int), "expected": None}, id="not a model"),
+        pytest.param(
+            {"members": (Foo, DefaultBar), "expected": None}, id="default tag"
+        ),
+    ],
+)
+def test_get_discriminator(params: Mapping[str, Any]):
+    assert get_discriminator(params["members"]) == params["expected"]
+
+
+def test_get_union_adapter():
+    assert get_union_adapter(Foo | Bar) is get_union_adapter(Foo | Bar)
+    adapter = get_union_adapter(Foo | Baz)
+    assert adapter.validate_python({"typ": "foo"}) == Foo(typ="foo")
+    assert adapter.validate_python({"typ": "baz"}) == Baz(typ="baz")
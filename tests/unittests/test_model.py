@@ -2,7 +2,7 @@ from collections.abc import Mapping
 from typing import Any, Literal
 
 import pytest
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationError, model_validator
 from result import Err, Ok, UnwrapError
 
 from blacksmith.domain.error import default_error_parser
@@ -60,6 +60,22 @@ def test_timeout_neq() -> None:
     assert HTTPTimeout() != HTTPTimeout(42)
     assert HTTPTimeout(42) != HTTPTimeout(42, 42)
     assert HTTPTimeout(42, 42) != HTTPTimeout(42, 43)
+    assert HTTPTimeout(42, 42) != HTTPTimeout(42, 42, write=1)
+    assert HTTPTimeout(42, 42) != HTTPTimeout(42, 42, pool=1)
+    assert HTTPTimeout(42, 42) != HTTPTimeout(42, 42, total=1)
+
+
+def test_timeout_defaults() -> None:
+    timeout = HTTPTimeout(10, 5)
+    assert (timeout.write, timeout.pool, timeout.total) == (10, 10, None)
+    assert HTTPTimeout(10, 5) == HTTPTimeout(10, 5, 10, 10)
+
+
+def test_timeout_shrink() -> None:
+    assert HTTPTimeout(10, 5).shrink(20) == HTTPTimeout(10, 5, total=20)
+    assert HTTPTimeout(10, 5, total=8).shrink(20) == HTTPTimeout(10, 5, total=8)
+    assert HTTPTimeout(10, 5, 3, 1).shrink(7) == HTTPTimeout(7, 5, 3, 1, total=7)
+    assert HTTPTimeout(10, 5).shrink(2) == HTTPTimeout(2, 2, 2, 2, total=2)
 
 
 def test_request_url() -> None:
@@ -341,6 +357,133 @@ def test_response_box_union_schema(json: Mapping[str, Any], expected: Response)
     assert resp.as_result() == Ok(expected)
 
 
+def test_response_box_validated_once() -> None:
+    validated = []
+    errors = []
+
+    class CountingResponse(Response):
+        name: str
+
+        @model_validator(mode="after")
+        def count(self) -> "CountingResponse":
+            validated.append(self.name)
+            return self
+
+    def counting_error_parser(error: HTTPError) -> MyErrorFormat:
+        errors.append(error)
+        return error_parser(error)
+
+    resp: ResponseBox[CountingResponse, MyErrorFormat] = ResponseBox(
+        Ok(HTTPResponse(200, {}, {"name": "Alice"})),
+        CountingResponse,
+        "GET",
+        "",
+        "",
+        "",
+        error_parser=counting_error_parser,
+    )
+    assert resp.unwrap().name == "Alice"
+    assert resp.unwrap_or(CountingResponse(name="Bob")).name == "Alice"
+    assert resp.map(lambda x: x.name) == Ok("Alice")  # type: ignore
+    assert resp.as_optional().is_ok()
+    assert resp.map_err(lambda err: err) == resp.as_result()
+    assert validated == ["Alice", "Bob"]
+
+    resp = ResponseBox(
+        Err(
+            HTTPError(
+                "422 Unprocessable entity",
+                HTTPRequest(method="GET", url_pattern="/"),
+                HTTPResponse(
+                    422,
+                    {},
+                    {"message": "Bad Request", "detail": "Unprocessable entity"},
+                ),
+            )
+        ),
+        CountingResponse,
+        "GET",
+        "",
+        "",
+        "",
+        error_parser=counting_error_parser,
+    )
+    assert resp.unwrap_err().status_code == 422
+    assert resp.expect_err("To never fail").status_code == 422
+    assert resp.as_result().is_err()
+    assert len(errors) == 1
+
+
+def test_http_response_lazy_json() -> None:
+    resp = HTTPResponse(200, {}, content=b'{"name": "Alice", "age": 24}')
+    assert resp.json == {"name": "Alice", "age": 24}
+    assert resp == HTTPResponse(200, {}, {"name": "Alice", "age": 24})
+
+    resp = HTTPResponse(200, {}, content=b"not json")
+    assert resp.json == {"error": "not json"}
+
+    resp = HTTPResponse(204, {})
+    assert resp.json == ""
+
+    resp = HTTPResponse(200, {}, content=b'{"name": "Alice", "age": 24}')
+    resp.json = {"name": "Bob", "age": 42}
+    assert resp.content is None
+    assert resp.json == {"name": "Bob", "age": 42}
+
+
+@pytest.mark.parametrize(
+    "content,schema,expected",
+    [
+        pytest.param(
+            b'{"name": "Alice", "age": 24, "useless": true}',
+            GetResponse,
+            GetResponse(name="Alice", age=24),
+            id="model",
+        ),
+        pytest.param(
+            b'{"type": "banana", "ripeness": 2, "flavour_intensity": 5}',
+            Banana | Vanilla,
+            Banana(type="banana", ripeness=2, flavour_intensity=5),
+            id="union",
+        ),
+    ],
+)
+def test_response_box_lazy_json(content: bytes, schema: Any, expected: Any) -> None:
+    resp: ResponseBox[Any, MyErrorFormat] = ResponseBox(
+        Ok(HTTPResponse(200, {}, content=content)),
+        schema,
+        "GET",
+        "/dummies",
+        "Dummy",
+        "api",
+        error_parser=error_parser,
+    )
+    assert resp.unwrap() == expected
+    assert resp.as_optional() == Ok(expected)
+
+
+class OptionalX(BaseModel):
+    x: int | None = None
+
+
+class OptionalY(BaseModel):
+    y: int | None = None
+
+
+@pytest.mark.parametrize("content", [b"null", b"not json", b"[]", b'{"x": 1}'])
+@pytest.mark.parametrize("schema", [OptionalX, OptionalX | OptionalY])
+def test_response_box_lazy_json_as_eager(content: bytes, schema: Any) -> None:
+    def validate(resp: HTTPResponse) -> Any:
+        box: ResponseBox[Any, MyErrorFormat] = ResponseBox(
+            Ok(resp), schema, "GET", "/dummies", "Dummy", "api", error_parser
+        )
+        return box.unwrap()
+
+    lazy = HTTPResponse(200, {}, content=content)
+    eager = HTTPResponse(200, {}, json=HTTPResponse(200, {}, content=content).json)
+    assert validate(lazy) == validate(eager)
+
+
 def test_collection_iterator() -> None:
     collec: CollectionIterator[Any] = CollectionIterator(
         HTTPResponse(
@@ -374,3 +517,63 @@ def test_collection_iterator() -> None:
             "age": 42,
         },
     ]
+
+
+@pytest.mark.parametrize("batch_size", [1, 2, 10])
+def test_collection_iterator_batch(batch_size: int) -> None:
+    collec: CollectionIterator[Any] = CollectionIterator(
+        HTTPResponse(
+            200,
+            {},
+            [{"name": "Alice", "age": 24}, {"name": "Bob", "age": 42}, {}],
+        ),
+        GetResponse,
+        CollectionParser,
+        batch_size=batch_size,
+    )
+    assert next(collec) == GetResponse(name="Alice", age=24)
+    assert next(collec) == GetResponse(name="Bob", age=42)
+    # the invalid item raises on its turn, as without batch
+    with pytest.raises(ValidationError):
+        next(collec)
+
+
+class DefaultTagA(BaseModel):
+    kind: Literal["a"] = "a"
+    x: int
+
+
+class DefaultTagB(BaseModel):
+    kind: Literal["b"] = "b"
+    y: int
+
+
+@pytest.mark.parametrize("batch_size", [0, 10])
+def test_collection_iterator_batch_default_tag(batch_size: int) -> None:
+    collec: CollectionIterator[Any] = CollectionIterator(
+        HTTPResponse(200, {}, [{"x": 1}, {"kind": "b", "y": 2}]),
+        DefaultTagA | DefaultTagB,  # type: ignore
+        CollectionParser,
+        batch_size=batch_size,
+    )
+    assert list(collec) == [DefaultTagA(x=1), DefaultTagB(y=2)]
+
+
+def test_collection_iterator_batch_union() -> None:
+    collec: CollectionIterator[Any] = CollectionIterator(
+        HTTPResponse(
+            200,
+            {},
+            [
+                {"type": "banana", "ripeness": 2, "flavour_intensity": 5},
+                {"type": "vanilla", "sweetness": 6, "flavour_intensity": 5},
+            ],
+        ),
+        Banana | Vanilla,  # type: ignore
+        CollectionParser,
+        batch_size=10,
+    )
+    assert list(collec) == [
+        Banana(type="banana", ripeness=2, flavour_intensity=5),
+        Vanilla(type="vanilla", sweetness=6, flavour_intensity=5),
+    ]
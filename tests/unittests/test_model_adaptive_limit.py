@@ -0,0 +1,33 @@
+from blacksmith.domain.model.middleware.adaptive_limit import AdaptiveLimit
+
+
+def test_adaptive_limit_increase() -> None:
+    limit = AdaptiveLimit(initial_limit=4, max_limit=6)
+    assert limit.get_limit("api") == 4
+    assert limit.get_baseline("api") is None
+
+    # the limit is not used
+    assert limit.on_sample("api", 0.1, inflight=1) == 4
+    assert limit.get_baseline("api") == 0.1
+
+    assert limit.on_sample("api", 0.1, inflight=2) == 5
+    assert limit.on_sample("api", 0.1, inflight=5) == 6
+    assert limit.on_sample("api", 0.1, inflight=6) == 6
+
+    # other clients have their own limit
+    assert limit.get_limit("other") == 4
+
+
+def test_adaptive_limit_decrease() -> None:
+    limit = AdaptiveLimit(initial_limit=10, min_limit=5, backoff_ratio=0.5)
+    assert limit.on_sample("api", 0.1, inflight=1) == 10
+    assert limit.on_sample("api", 0.1, inflight=1, dropped=True) == 5
+    assert limit.on_sample("api", 0.1, inflight=1, dropped=True) == 5
+
+
+def test_adaptive_limit_latency() -> None:
+    limit = AdaptiveLimit(initial_limit=10, tolerance=2, smoothing=0.5)
+    assert limit.on_sample("api", 0.1, inflight=1) == 10
+    assert limit.on_sample("api", 0.3, inflight=10) == 9
+    assert limit.get_baseline("api") == 0.2
+    assert limit.on_sample("api", 0.3, inflight=10) == 10
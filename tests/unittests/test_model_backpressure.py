@@ -0,0 +1,25 @@
+import time
+
+import pytest
+
+from blacksmith.domain.model.middleware.backpressure import Backpressure
+
+
+def test_backpressure(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = 1000.0
+    monkeypatch.setattr(time, "monotonic", lambda: now)
+    backpressure = Backpressure()
+    assert backpressure.get_pause("api") == 0
+
+    backpressure.pause("api", 10)
+    assert backpressure.get_pause("api") == 10
+    assert backpressure.get_pause("other") == 0
+
+    # the longest pause is kept
+    backpressure.pause("api", 5)
+    assert backpressure.get_pause("api") == 10
+
+    now += 4
+    assert backpressure.get_pause("api") == 6
+    now += 6
+    assert backpressure.get_pause("api") == 0
@@ -0,0 +1,26 @@
+from blacksmith.domain.model.middleware.budget import Budget
+
+
+def test_budget() -> None:
+    budget = Budget(ratio=0.5, max_tokens=2)
+    assert budget.withdraw("api") is True
+    assert budget.withdraw("api") is True
+    assert budget.withdraw("api") is False
+
+    # other clients have their own bucket
+    assert budget.withdraw("other") is True
+
+    budget.deposit("api")
+    assert budget.withdraw("api") is False
+    budget.deposit("api")
+    assert budget.withdraw("api") is True
+    assert budget.withdraw("api") is False
+
+
+def test_budget_max_tokens() -> None:
+    budget = Budget(ratio=1, max_tokens=2)
+    for _ in range(10):
+        budget.deposit("api")
+    assert budget.withdraw("api") is True
+    assert budget.withdraw("api") is True
+    assert budget.withdraw("api") is False
@@ -0,0 +1,41 @@
+import time
+
+import pytest
+
+from blacksmith.domain.model.deadline import Deadline, get_remaining_time
+
+
+def test_deadline(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = 1000.0
+    monkeypatch.setattr(time, "monotonic", lambda: now)
+    assert get_remaining_time() is None
+    with Deadline(10):
+        assert get_remaining_time() == 10
+        now += 4
+        assert get_remaining_time() == 6
+
+        # nested deadlines can only shrink the deadline
+        with Deadline(20):
+            assert get_remaining_time() == 6
+        with Deadline(2):
+            assert get_remaining_time() == 2
+        with Deadline(None):
+            assert get_remaining_time() == 6
+
+        assert get_remaining_time() == 6
+        now += 10
+        assert get_remaining_time() == -4
+    assert get_remaining_time() is None
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        pytest.param({"header": "1.5", "expected": 1.5}, id="seconds"),
+        pytest.param({"header": None, "expected": None}, id="missing"),
+        pytest.param({"header": "", "expected": None}, id="empty"),
+        pytest.param({"header": "soon", "expected": None}, id="invalid"),
+    ],
+)
+def test_deadline_from_header(params: dict[str, str | None]) -> None:
+    assert Deadline.from_header(params["header"]).timeout == params["expected"]
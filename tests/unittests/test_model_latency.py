@@ -0,0 +1,37 @@
+from blacksmith.domain.model.middleware.latency import LatencyPercentiles
+
+
+def test_latency_percentiles() -> None:
+    latencies = LatencyPercentiles(window_size=100, min_samples=10, refresh_every=1)
+    for i in range(9):
+        latencies.observe("api", "/", i / 100)
+    assert latencies.get_percentile("api", "/", 0.5) is None
+
+    latencies.observe("api", "/", 0.09)
+    assert latencies.get_percentile("api", "/", 0.5) == 0.05
+    assert latencies.get_percentile("api", "/", 0.9) == 0.09
+    assert latencies.get_percentile("api", "/", 1) == 0.09
+    assert latencies.get_percentile("api", "/other", 0.5) is None
+
+
+def test_latency_percentiles_window() -> None:
+    latencies = LatencyPercentiles(window_size=10, min_samples=10, refresh_every=1)
+    for _ in range(10):
+        latencies.observe("api", "/", 1.0)
+    assert latencies.get_percentile("api", "/", 0.5) == 1.0
+    for _ in range(10):
+        latencies.observe("api", "/", 2.0)
+    assert latencies.get_percentile("api", "/", 0.5) == 2.0
+
+
+def test_latency_percentiles_refresh() -> None:
+    latencies = LatencyPercentiles(window_size=10, min_samples=1, refresh_every=5)
+    latencies.observe("api", "/", 1.0)
+    assert latencies.get_percentile("api", "/", 0.5) == 1.0
+    latencies.observe("api", "/", 2.0)
+    latencies.observe("api", "/", 2.0)
+    # not refreshed yet
+    assert latencies.get_percentile("api", "/", 0.5) == 1.0
+    for _ in range(3):
+        latencies.observe("api", "/", 2.0)
+    assert latencies.get_percentile("api", "/", 0.5) == 2.0
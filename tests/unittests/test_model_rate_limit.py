@@ -0,0 +1,33 @@
+import time
+
+import pytest
+
+from blacksmith.domain.model.middleware.rate_limit import RateLimit, TokenBucket
+
+
+def test_rate_limit_period() -> None:
+    assert RateLimit(rate=10).period == 0.1
+    assert RateLimit(rate=10, burst=5).period == 0.5
+
+
+def test_token_bucket(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = 1000.0
+    monkeypatch.setattr(time, "monotonic", lambda: now)
+    buckets = TokenBucket()
+    limit = RateLimit(rate=4, burst=2)
+    assert buckets.reserve("api", limit) == 0
+    assert buckets.reserve("api", limit) == 0
+    assert buckets.reserve("api", limit) == 0.25
+    assert buckets.reserve("api", limit) == 0.5
+
+    # the token is not reserved if the delay is too long
+    assert buckets.reserve("api", limit, max_delay=0.5) is None
+
+    # other keys have their own bucket
+    assert buckets.reserve("other", limit) == 0
+
+    # the bucket is refilled, up to the burst
+    now += 1.0
+    assert buckets.reserve("api", limit) == 0
+    assert buckets.reserve("api", limit) == 0
+    assert buckets.reserve("api", limit) == 0.25
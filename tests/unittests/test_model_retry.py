@@ -0,0 +1,99 @@
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from typing import Any
+
+import pytest
+from httpx import ConnectError
+
+from blacksmith.domain.exceptions import HTTPError, HTTPTimeoutError
+from blacksmith.domain.model.http import HTTPRequest, HTTPResponse, RouteOptions
+from blacksmith.domain.model.middleware.retry import RetryPolicy, parse_retry_after
+
+
+def http_error(status_code: int, headers: dict[str, str] | None = None) -> HTTPError:
+    return HTTPError(
+        f"{status_code}",
+        HTTPRequest("GET", "/"),
+        HTTPResponse(status_code, headers or {}, json=None),
+    )
+
+
+def test_parse_retry_after() -> None:
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after(" 0 ") == 0.0
+    assert parse_retry_after("not a date") is None
+    past = datetime.now(timezone.utc) - timedelta(seconds=60)
+    assert parse_retry_after(format_datetime(past, usegmt=True)) == 0.0
+    future = datetime.now(timezone.utc) + timedelta(seconds=60)
+    delay = parse_retry_after(format_datetime(future, usegmt=True))
+    assert delay is not None
+    assert 55 < delay <= 60
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        pytest.param({"method": "GET", "expected": True}, id="GET"),
+        pytest.param({"method": "PUT", "expected": True}, id="PUT"),
+        pytest.param({"method": "DELETE", "expected": True}, id="DELETE"),
+        pytest.param({"method": "POST", "expected": False}, id="POST"),
+        pytest.param({"method": "PATCH", "expected": False}, id="PATCH"),
+    ],
+)
+def test_handle_request(params: dict[str, Any]) -> None:
+    policy = RetryPolicy()
+    assert (
+        policy.handle_request(HTTPRequest(params["method"], "/")) is params["expected"]
+    )
+    policy = RetryPolicy(max_attempts=1)
+    assert policy.handle_request(HTTPRequest(params["method"], "/")) is False
+
+
+def test_handle_request_route_options() -> None:
+    policy = RetryPolicy()
+    req = HTTPRequest("POST", "/", options=RouteOptions(retry=True))
+    assert policy.handle_request(req) is True
+    req = HTTPRequest("GET", "/", options=RouteOptions(retry=False))
+    assert policy.handle_request(req) is False
+    policy = RetryPolicy(max_attempts=1)
+    req = HTTPRequest("POST", "/", options=RouteOptions(retry=True))
+    assert policy.handle_request(req) is False
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        pytest.param({"exc": http_error(502), "expected": True}, id="502"),
+        pytest.param({"exc": http_error(503), "expected": True}, id="503"),
+        pytest.param({"exc": http_error(504), "expected": True}, id="504"),
+        pytest.param({"exc": http_error(500), "expected": False}, id="500"),
+        pytest.param({"exc": http_error(404), "expected": False}, id="404"),
+        pytest.param({"exc": HTTPTimeoutError("boom"), "expected": True}, id="timeout"),
+        pytest.param({"exc": ConnectError("boom"), "expected": True}, id="connect"),
+        pytest.param({"exc": ValueError("boom"), "expected": False}, id="bug"),
+    ],
+)
+def test_is_transient(params: dict[str, Any]) -> None:
+    assert RetryPolicy().is_transient(params["exc"]) is params["expected"]
+
+
+def test_get_backoff() -> None:
+    policy = RetryPolicy(base_delay=0.1, max_delay=1.0)
+    delay = 0.0
+    for _ in range(100):
+        delay = policy.get_backoff(delay)
+        assert 0.1 <= delay <= 1.0
+
+
+def test_get_retry_delay() -> None:
+    policy = RetryPolicy(max_attempts=3, base_delay=0.1, max_retry_after=5)
+    delay = policy.get_retry_delay(http_error(503), 1, 0)
+    assert delay is not None
+    assert 0.1 <= delay <= 0.3
+    assert policy.get_retry_delay(http_error(503), 3, 0) is None
+    assert policy.get_retry_delay(http_error(400), 1, 0) is None
+    assert policy.get_retry_delay(http_error(503, {"retry-after": "4"}), 1, 0) == 4
+    assert policy.get_retry_delay(http_error(503, {"Retry-After": "6"}), 1, 0) is None
+    delay = policy.get_retry_delay(http_error(503, {"Retry-After": "soon"}), 1, 0)
+    assert delay is not None
+    assert 0.1 <= delay <= 0.3
@@ -5,9 +5,16 @@ import pytest
 import blacksmith
 from blacksmith.domain import registry
 from blacksmith.domain.exceptions import ConfigurationError, UnregisteredClientException
-from blacksmith.domain.model import PathInfoField, PostBodyField, Request, Response
+from blacksmith.domain.model import (
+    HTTPTimeout,
+    PathInfoField,
+    PostBodyField,
+    Request,
+    Response,
+    RouteOptions,
+)
 from blacksmith.domain.model.params import QueryStringField
-from blacksmith.domain.registry import Registry
+from blacksmith.domain.registry import BatchGet, Registry
 
 
 def test_default_registry() -> None:
@@ -273,6 +280,83 @@ def test_registry_complete() -> None:
     assert api["dummies"].resource.contract["DELETE"][1] is None
 
 
+def test_registry_batch_get() -> None:
+    class DummyRequest(Request):
+        name: str = PathInfoField()
+
+    class DummiesRequest(Request):
+        names: list[str] = QueryStringField(alias="name")
+
+    class Dummy(Response):
+        name: str
+
+    registry = Registry()
+    registry.register(
+        "dummies_api",
+        "dummies",
+        "api",
+        "v5",
+        path="/dummies/{name}",
+        contract={"GET": (DummyRequest, Dummy)},
+        collection_path="/dummies",
+        collection_contract={"GET": (DummiesRequest, Dummy)},
+        batch_get=BatchGet("name", collection_key="names"),
+    )
+    api = registry.clients["dummies_api"]
+    assert api["dummies"].batch_get == BatchGet(
+        key="name", collection_key="names", response_key=None, max_batch_size=100
+    )
+
+
+def test_registry_options() -> None:
+    class DummyRequest(Request):
+        name: str = PathInfoField()
+
+    class Dummy(Response):
+        name: str
+
+    registry = Registry()
+    registry.register(
+        "dummies_api",
+        "dummies",
+        "api",
+        "v5",
+        path="/dummies/{name}",
+        contract={
+            "GET": (DummyRequest, Dummy),
+            "DELETE": (DummyRequest, None),
+        },
+        collection_path="/dummies",
+        collection_contract={"GET": (Request, Dummy)},
+        options={"GET": RouteOptions(timeout=HTTPTimeout(1.0), cache=False)},
+        collection_options=RouteOptions(HTTPTimeout(60.0), retry=False),
+    )
+    api = registry.clients["dummies_api"]
+    assert api["dummies"].resource is not None
+    assert api["dummies"].resource.get_options("GET") == RouteOptions(
+        timeout=HTTPTimeout(1.0), cache=False
+    )
+    assert api["dummies"].resource.get_options("DELETE") == RouteOptions()
+    assert api["dummies"].collection is not None
+    assert api["dummies"].collection.get_options("GET") == RouteOptions(
+        timeout=HTTPTimeout(60.0), retry=False
+    )
+    assert api["dummies"].collection.get_options("POST") == RouteOptions(
+        timeout=HTTPTimeout(60.0), retry=False
+    )
+
+    registry.register(
+        "dummies_api",
+        "dummy",
+        "api",
+        "v5",
+        path="/dummies/{name}",
+        contract={"GET": (DummyRequest, Dummy)},
+    )
+    assert api["dummy"].resource is not None
+    assert api["dummy"].resource.get_options("GET") == RouteOptions()
+
+
 def test_get_service() -> None:
     class DummyRequest(Request):
         pass